@@ -284,6 +284,21 @@ def main():
         parser.add_argument('--db_password',
                             default='sickrage',
                             help='Database password (not used for sqlite)')
+        parser.add_argument('--db_pool_size',
+                            default=10,
+                            type=int,
+                            help='Number of database connections kept open in the connection pool')
+        parser.add_argument('--db_max_overflow',
+                            default=-1,
+                            type=int,
+                            help='Number of database connections allowed above the pool size, -1 for no limit')
+        parser.add_argument('--db_pool_recycle',
+                            default=3600,
+                            type=int,
+                            help='Seconds after which pooled database connections are recycled')
+        parser.add_argument('--db_no_pool_pre_ping',
+                            action='store_true',
+                            help='Disable testing pooled database connections for liveness before use, always off for SQLite')
 
         # Parse startup args
         args = parser.parse_args()
@@ -300,6 +315,10 @@ def main():
         app.db_port = args.db_port
         app.db_username = args.db_username
         app.db_password = args.db_password
+        app.db_pool_size = args.db_pool_size
+        app.db_max_overflow = args.db_max_overflow
+        app.db_pool_recycle = args.db_pool_recycle
+        app.db_pool_pre_ping = False if args.db_no_pool_pre_ping else None
         app.debug = args.debug
         app.data_dir = os.path.abspath(os.path.realpath(os.path.expanduser(args.datadir)))
         app.cache_dir = os.path.abspath(os.path.realpath(os.path.join(app.data_dir, 'cache')))
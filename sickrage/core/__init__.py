@@ -29,6 +29,7 @@ import shutil
 import socket
 import sys
 import threading
+import time
 import traceback
 import uuid
 from urllib.parse import uses_netloc
@@ -45,13 +46,16 @@ import sickrage
 from sickrage.core.announcements import Announcements
 from sickrage.core.api import API
 from sickrage.core.caches.quicksearch_cache import QuicksearchCache
+from sickrage.core.caches.show_stats_cache import ShowStatsCache
 from sickrage.core.common import SD, SKIPPED, WANTED
 from sickrage.core.config import Config
+from sickrage.core.databases import QueryCounter
 from sickrage.core.databases.cache import CacheDB
 from sickrage.core.databases.main import MainDB
 from sickrage.core.helpers import generate_secret, make_dir, get_lan_ip, restore_app_data, get_disk_space_usage, get_free_space, launch_browser, \
     torrent_webui_url, encryption
 from sickrage.core.logger import Logger
+from sickrage.core.nameparser import name_parser_cache, shutdown_parse_pool
 from sickrage.core.nameparser.validator import check_force_season_folders
 from sickrage.core.processors import auto_postprocessor
 from sickrage.core.processors.auto_postprocessor import AutoPostProcessor
@@ -65,7 +69,7 @@ from sickrage.core.searchers.proper_searcher import ProperSearcher
 from sickrage.core.searchers.subtitle_searcher import SubtitleSearcher
 from sickrage.core.searchers.trakt_searcher import TraktSearcher
 from sickrage.core.tv.show import TVShow
-from sickrage.core.tv.show.helpers import get_show_list
+from sickrage.core.tv.show.helpers import get_show_list, show_index
 from sickrage.core.ui import Notifications
 from sickrage.core.updaters.rsscache_updater import RSSCacheUpdater
 from sickrage.core.updaters.show_updater import ShowUpdater
@@ -73,6 +77,7 @@ from sickrage.core.updaters.tz_updater import TimeZoneUpdater
 from sickrage.core.upnp import UPNPClient
 from sickrage.core.version_updater import VersionUpdater
 from sickrage.core.webserver import WebServer
+from sickrage.core.websession import web_session_pool
 from sickrage.metadata import MetadataProviders
 from sickrage.notifiers import NotifierProviders
 from sickrage.providers import SearchProviders
@@ -92,6 +97,7 @@ class Core(object):
             self.tz = tz.tzlocal()
 
         self.shows = {}
+        self.show_stats_cache = ShowStatsCache()
 
         self.private_key = None
         self.public_key = None
@@ -115,6 +121,10 @@ class Core(object):
         self.db_port = None
         self.db_username = None
         self.db_password = None
+        self.db_pool_size = None
+        self.db_max_overflow = None
+        self.db_pool_recycle = None
+        self.db_pool_pre_ping = None
         self.debug = None
         self.newest_version_string = None
 
@@ -173,6 +183,17 @@ class Core(object):
         self.announcements = None
         self.api = None
 
+    @property
+    def db_pool_args(self):
+        pool_args = {
+            'db_pool_size': self.db_pool_size,
+            'db_max_overflow': self.db_max_overflow,
+            'db_pool_recycle': self.db_pool_recycle,
+            'db_pool_pre_ping': self.db_pool_pre_ping
+        }
+
+        return {k: v for k, v in pool_args.items() if v is not None}
+
     def start(self):
         self.started = True
 
@@ -183,8 +204,8 @@ class Core(object):
 
         # init core classes
         self.api = API()
-        self.main_db = MainDB(self.db_type, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password)
-        self.cache_db = CacheDB(self.db_type, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password)
+        self.main_db = MainDB(self.db_type, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password, **self.db_pool_args)
+        self.cache_db = CacheDB(self.db_type, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password, **self.db_pool_args)
         self.notifier_providers = NotifierProviders()
         self.metadata_providers = MetadataProviders()
         self.search_providers = SearchProviders()
@@ -230,8 +251,10 @@ class Core(object):
             success = restore_app_data(os.path.abspath(os.path.join(self.data_dir, 'restore')), self.data_dir)
             self.log.info("Restoring SiCKRAGE backup: %s!" % ("FAILED", "SUCCESSFUL")[success])
             if success:
-                self.main_db = MainDB(self.db_type, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password)
-                self.cache_db = CacheDB(self.db_type, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password)
+                self.main_db.dispose()
+                self.cache_db.dispose()
+                self.main_db = MainDB(self.db_type, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password, **self.db_pool_args)
+                self.cache_db = CacheDB(self.db_type, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password, **self.db_pool_args)
                 shutil.rmtree(os.path.abspath(os.path.join(self.data_dir, 'restore')), ignore_errors=True)
 
         # migrate old database file names to new ones
@@ -258,6 +281,9 @@ class Core(object):
         # set socket timeout
         socket.setdefaulttimeout(self.config.socket_timeout)
 
+        # set name parser cache size
+        name_parser_cache.resize(self.config.name_parser_cache_size)
+
         # setup logger settings
         self.log.logSize = self.config.log_size
         self.log.logNr = self.config.log_nr
@@ -546,18 +572,35 @@ class Core(object):
 
         self.loading_shows = True
 
-        self.shows = {}
-        for query in session.query(MainDB.TVShow).with_entities(MainDB.TVShow.indexer_id, MainDB.TVShow.indexer, MainDB.TVShow.name):
-            try:
-                self.log.info('Loading show {} and building caches'.format(query.name))
-                self.shows.update({(query.indexer_id, query.indexer): TVShow(query.indexer_id, query.indexer)})
-                self.quicksearch_cache.add_show(query.indexer_id)
-            except Exception as e:
-                self.log.debug('There was an error loading show: {}'.format(query.name))
+        start_time = time.time()
+
+        with QueryCounter() as query_counter:
+            # fetch all episodes in a single query and group them by show
+            episodes = {}
+            for episode in session.query(MainDB.TVEpisode):
+                episodes.setdefault((episode.showid, episode.indexer), []).append(episode)
+
+            self.shows = {}
+            for query in session.query(MainDB.TVShow):
+                try:
+                    self.log.info('Loading show {} and building caches'.format(query.name))
+                    show = TVShow(query.indexer_id, query.indexer, data=query.as_dict())
+                    show.load_episodes_from_db(episodes.pop((query.indexer_id, query.indexer), []))
+                    self.shows.update({(query.indexer_id, query.indexer): show})
+                except Exception as e:
+                    self.log.debug('There was an error loading show: {}'.format(query.name))
+
+            del episodes
+
+        show_index.rebuild()
 
         self.loading_shows = False
 
-        self.log.info('Loading initial shows list finished')
+        # bring the quicksearch cache up to date without holding up startup
+        self.quicksearch_cache.build()
+
+        self.log.info('Loading initial shows list finished, loaded {} shows in {:.2f}s using {} queries'.format(
+            len(self.shows), time.time() - start_time, query_counter.count))
 
     def shutdown(self, restart=False):
         if self.started:
@@ -580,6 +623,16 @@ class Core(object):
             # save settings
             self.config.save()
 
+            # close pooled web connections
+            web_session_pool.clear()
+
+            # stop name parser worker processes
+            shutdown_parse_pool()
+
+            # close database connections
+            self.main_db.dispose()
+            self.cache_db.dispose()
+
             # shutdown logging
             if self.log:
                 self.log.close()
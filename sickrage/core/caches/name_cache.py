@@ -20,8 +20,6 @@ import threading
 import time
 from datetime import datetime, timedelta
 
-from sqlalchemy import orm
-
 import sickrage
 from sickrage.core.databases.cache import CacheDB
 from sickrage.core.helpers import full_sanitize_scene_name
@@ -34,6 +32,8 @@ class NameCache(object):
         self.min_time = 10
         self.last_update = {}
         self.cache = {}
+        self.dirty = set()
+        self.lock = threading.Lock()
 
     def should_update(self, show):
         # if we've updated recently then skip the update
@@ -43,28 +43,20 @@ class NameCache(object):
 
     def put(self, name, indexer_id=0):
         """
-        Adds the show & tvdb id to the scene_names table in cache db
+        Adds the show & tvdb id to the cache, changed names are written to the scene_names table in cache db on
+        the next save
 
         :param name: The show name to cache
         :param indexer_id: the TVDB id that this show should be cached with (can be None/0 for unknown)
         """
 
-        session = sickrage.app.cache_db.session()
-
         # standardize the name we're using to account for small differences in providers
         name = full_sanitize_scene_name(name)
 
-        self.cache[name] = int(indexer_id)
-
-        try:
-            session.query(CacheDB.SceneName).filter_by(name=name, indexer_id=int(indexer_id)).one()
-        except orm.exc.NoResultFound:
-            session.add(CacheDB.SceneName(**{
-                'indexer_id': indexer_id,
-                'name': name
-            }))
-        finally:
-            session.commit()
+        with self.lock:
+            if self.cache.get(name) != int(indexer_id):
+                self.cache[name] = int(indexer_id)
+                self.dirty.add(name)
 
     def get(self, name):
         """
@@ -92,31 +84,31 @@ class NameCache(object):
                 session.query(CacheDB.SceneName).filter_by(name=name).delete()
                 session.commit()
 
-            for key, value in self.cache.copy().items():
-                if value == indexer_id or key == name:
-                    del self.cache[key]
+            with self.lock:
+                for key, value in self.cache.copy().items():
+                    if value == indexer_id or key == name:
+                        del self.cache[key]
+                        self.dirty.discard(key)
 
     def load(self):
         session = sickrage.app.cache_db.session()
-        self.cache = dict([(x.name, x.indexer_id) for x in session.query(CacheDB.SceneName)])
+
+        with self.lock:
+            self.cache = dict([(x.name, x.indexer_id) for x in session.query(CacheDB.SceneName)])
+            self.dirty.clear()
 
     def save(self):
         """
-        Commit cache to database file
+        Commit names changed since the last save to database file
         """
 
-        session = sickrage.app.cache_db.session()
-
-        sql_t = []
+        with self.lock:
+            scene_names = {name: self.cache[name] for name in self.dirty if name in self.cache}
+            self.dirty.clear()
 
-        for name, indexer_id in self.cache.items():
-            try:
-                session.query(CacheDB.SceneName).filter_by(name=name, indexer_id=indexer_id).one()
-            except orm.exc.NoResultFound:
-                sql_t.append({
-                    'indexer_id': indexer_id,
-                    'name': name
-                })
-
-        session.bulk_insert_mappings(CacheDB.SceneName, sql_t)
-        session.commit()
+        try:
+            sickrage.app.cache_db.upsert_scene_names(scene_names)
+        except Exception:
+            with self.lock:
+                self.dirty.update(scene_names)
+            raise
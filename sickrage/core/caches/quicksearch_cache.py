@@ -18,90 +18,334 @@
 #  You should have received a copy of the GNU General Public License
 #  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 # ##############################################################################
+import bisect
+import heapq
+import itertools
+import re
 import threading
+import time
 
 import sickrage
 from sickrage.core.databases.cache import CacheDB
 from sickrage.core.media.util import showImage
 from sickrage.core.tv.show.helpers import find_show, get_show_list
 
+QUICKSEARCH_RESULT_LIMIT = 50
+
+
+class QuicksearchIndex(object):
+    """
+    Name index for quicksearch lookups.
+
+    Whole name prefixes are answered from a sorted list of names, substrings from a trigram index and terms shorter
+    than a trigram from an index of word prefixes.
+    """
+
+    word_regex = re.compile(r'\w+', re.U)
+
+    def __init__(self):
+        self.names = {}
+        self.sorted_names = []
+        self.trigrams = {}
+        self.prefixes = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, key):
+        return key in self.names
+
+    @staticmethod
+    def get_trigrams(name):
+        return {name[i:i + 3] for i in range(len(name) - 2)}
+
+    def get_prefixes(self, name):
+        return {word[:i] for word in self.word_regex.findall(name) for i in (1, 2) if len(word) >= i}
+
+    def add(self, key, name):
+        self.remove(key)
+
+        if name is None:
+            return
+
+        name = name.lower()
+        self.names[key] = name
+        bisect.insort(self.sorted_names, (name, key))
+        self._add_grams(key, name)
+
+    def add_many(self, items):
+        """Adds (key, name) pairs, sorting the name list once instead of per insert"""
+        sorted_names = []
+        for key, name in dict(items).items():
+            self.remove(key)
+
+            if name is None:
+                continue
+
+            name = name.lower()
+            self.names[key] = name
+            sorted_names.append((name, key))
+            self._add_grams(key, name)
+
+        self.sorted_names.extend(sorted_names)
+        self.sorted_names.sort()
+
+    def _add_grams(self, key, name):
+        for trigram in self.get_trigrams(name):
+            self.trigrams.setdefault(trigram, set()).add(key)
+        for prefix in self.get_prefixes(name):
+            self.prefixes.setdefault(prefix, set()).add(key)
+
+    def remove(self, key):
+        name = self.names.pop(key, None)
+        if name is None:
+            return
+
+        del self.sorted_names[bisect.bisect_left(self.sorted_names, (name, key))]
+
+        for postings, grams in ((self.trigrams, self.get_trigrams(name)), (self.prefixes, self.get_prefixes(name))):
+            for gram in grams:
+                keys = postings.get(gram)
+                if keys is None:
+                    continue
+
+                keys.discard(key)
+                if not keys:
+                    del postings[gram]
+
+    def clear(self):
+        self.names.clear()
+        del self.sorted_names[:]
+        self.trigrams.clear()
+        self.prefixes.clear()
+
+    def search(self, term, limit=QUICKSEARCH_RESULT_LIMIT):
+        """
+        Returns up to limit keys whose name contains term, best matches first
+
+        Names starting with term come first in alphabetical order, so an exact match always leads. The rest are
+        ranked by whether term starts a word and then by the shorter name.
+        """
+
+        term = term.lower()
+
+        results = []
+        for name, key in itertools.islice(self.sorted_names, bisect.bisect_left(self.sorted_names, (term,)), None):
+            if len(results) >= limit or not name.startswith(term):
+                break
+            results.append(key)
+
+        if len(results) >= limit or not term:
+            return results
+
+        if len(term) < 3:
+            candidates = self.prefixes.get(term, set()).difference(results)
+        else:
+            postings = sorted((self.trigrams.get(trigram, set()) for trigram in self.get_trigrams(term)), key=len)
+            candidates = postings[0].intersection(*postings[1:]).difference(results)
+            candidates = [key for key in candidates if term in self.names[key]]
+
+        def rank(key):
+            name = self.names[key]
+            return ' ' + term not in name, len(name), name
+
+        return results + heapq.nsmallest(limit - len(results), candidates, key=rank)
+
 
 class QuicksearchCache(object):
     def __init__(self):
         self.name = "QUICKSEARCH-CACHE"
 
+        self.lock = threading.RLock()
+
+        # serializes updates so the database and the in memory index change together
+        self.write_lock = threading.RLock()
+
         self.cache = {
             'shows': {},
             'episodes': {}
         }
 
+        self.show_index = QuicksearchIndex()
+        self.episode_index = QuicksearchIndex()
+        self.show_episodes = {}
+
+        self.build_thread = None
+        self.build_total = 0
+        self.build_done = 0
+
     def run(self):
         # set thread name
         threading.currentThread().setName(self.name)
 
-        self.load()
-        [self.add_show(show.indexer_id) for show in get_show_list()]
+        shows = get_show_list()
+
+        self.build_done = 0
+        self.build_total = len(shows)
+
+        start_time = time.time()
+
+        for show in shows:
+            try:
+                self.update_show(show.indexer_id)
+            except Exception as e:
+                sickrage.app.log.debug("Unable to update show {} in QuickSearch cache: {}".format(show.indexer_id, e))
+
+            self.build_done += 1
+
+        sickrage.app.log.debug("Built QuickSearch cache for {} shows in {:.2f}s".format(self.build_total, time.time() - start_time))
+
+    def build(self):
+        """
+        Brings the cache up to date with the show list on a background thread, searches are served from what has
+        been cached so far while it runs
+        """
+        if self.building:
+            return
+
+        self.build_thread = threading.Thread(target=self.run, name=self.name)
+        self.build_thread.daemon = True
+        self.build_thread.start()
+
+    @property
+    def building(self):
+        return self.build_thread is not None and self.build_thread.is_alive()
+
+    @property
+    def progress(self):
+        return {
+            'building': self.building,
+            'shows_done': self.build_done,
+            'shows_total': self.build_total,
+            'percent': int(self.build_done * 100 / self.build_total) if self.build_total else 100,
+            'shows': len(self.cache['shows']),
+            'episodes': len(self.cache['episodes'])
+        }
 
     def load(self):
         session = sickrage.app.cache_db.session()
 
-        for x in session.query(CacheDB.QuickSearchShow):
-            self.cache['shows'][x.showid] = x.as_dict()
-        for x in session.query(CacheDB.QuickSearchEpisode):
-            self.cache['episodes'][x.episodeid] = x.as_dict()
+        with self.write_lock, self.lock:
+            for x in session.query(CacheDB.QuickSearchShow):
+                self._cache_show(x.as_dict())
+            self._cache_episodes([x.as_dict() for x in session.query(CacheDB.QuickSearchEpisode)])
 
         sickrage.app.log.debug("Loaded {} shows to QuickSearch cache".format(len(self.cache['shows'])))
         sickrage.app.log.debug("Loaded {} episodes to QuickSearch cache".format(len(self.cache['episodes'])))
 
-    def get_shows(self, term):
-        return [d for d in self.cache['shows'].values() if d['name'] is not None and term.lower() in d['name'].lower()]
+    def get_shows(self, term, limit=QUICKSEARCH_RESULT_LIMIT):
+        with self.lock:
+            return [self.cache['shows'][x] for x in self.show_index.search(term, limit)]
 
-    def get_episodes(self, term):
-        return [d for d in self.cache['episodes'].values() if d['name'] is not None and term.lower() in d['name'].lower()]
+    def get_episodes(self, term, limit=QUICKSEARCH_RESULT_LIMIT):
+        with self.lock:
+            return [self.cache['episodes'][x] for x in self.episode_index.search(term, limit)]
 
-    def update_show(self, indexer_id):
-        self.del_show(indexer_id)
-        self.add_show(indexer_id)
+    @staticmethod
+    def _episode_key(data):
+        # episode indexer ids default to 0 and are not unique, records are keyed like the quicksearch_episodes table
+        return data['showid'], data['season'], data['episode']
 
-    def add_show(self, indexer_id):
-        session = sickrage.app.cache_db.session()
+    def _cache_show(self, data):
+        self.cache['shows'][data['showid']] = data
+        self.show_index.add(data['showid'], data['name'])
+
+    def _cache_episodes(self, episodes):
+        for data in episodes:
+            self.cache['episodes'][self._episode_key(data)] = data
+            self.show_episodes.setdefault(data['showid'], set()).add(self._episode_key(data))
 
+        self.episode_index.add_many((self._episode_key(data), data['name']) for data in episodes)
+
+    def _uncache_episodes(self, episodes):
+        for data in episodes:
+            self.cache['episodes'].pop(self._episode_key(data), None)
+            self.show_episodes.get(data['showid'], set()).discard(self._episode_key(data))
+            self.episode_index.remove(self._episode_key(data))
+
+    def _uncache_show(self, indexer_id):
+        self.cache['shows'].pop(indexer_id, None)
+        self.show_index.remove(indexer_id)
+
+        for key in self.show_episodes.pop(indexer_id, ()):
+            self.cache['episodes'].pop(key, None)
+            self.episode_index.remove(key)
+
+    def update_show(self, indexer_id):
+        """
+        Syncs the cached records of a show with the show list, only the show and episode records that changed are
+        rewritten in the index and database
+        """
         show = find_show(indexer_id)
+        if not show:
+            return
+
+        img = sickrage.app.config.web_root + showImage(indexer_id, 'poster_thumb').url
 
-        if indexer_id not in self.cache['shows']:
-            sickrage.app.log.debug("Adding show {} to QuickSearch cache".format(show.name))
+        show_data = {
+            'category': 'shows',
+            'showid': indexer_id,
+            'seasons': len(set([s.season for s in show.episodes])),
+            'name': show.name,
+            'img': img
+        }
 
-            qsData = {
-                'category': 'shows',
+        episodes = {}
+        for e in show.episodes:
+            episodes[(indexer_id, e.season, e.episode)] = {
+                'category': 'episodes',
                 'showid': indexer_id,
-                'seasons': len(set([s.season for s in show.episodes])),
-                'name': show.name,
-                'img': sickrage.app.config.web_root + showImage(indexer_id, 'poster_thumb').url
+                'episodeid': e.indexer_id,
+                'season': e.season,
+                'episode': e.episode,
+                'name': e.name,
+                'showname': show.name,
+                'img': img
             }
 
-            self.cache['shows'][indexer_id] = qsData
-            session.add(CacheDB.QuickSearchShow(**qsData))
-            session.commit()
+        with self.write_lock:
+            with self.lock:
+                show_changed = self.cache['shows'].get(indexer_id) != show_data
+
+                cached = {x: self.cache['episodes'][x] for x in self.show_episodes.get(indexer_id, ())}
+                stale = [v for k, v in cached.items() if episodes.get(k) != v]
+                fresh = [v for k, v in episodes.items() if cached.get(k) != v]
 
-            sql_t = []
-            for e in show.episodes:
-                qsData = {
-                    'category': 'episodes',
-                    'showid': e.showid,
-                    'episodeid': e.indexer_id,
-                    'season': e.season,
-                    'episode': e.episode,
-                    'name': e.name,
-                    'showname': show.name,
-                    'img': sickrage.app.config.web_root + showImage(e.showid, 'poster_thumb').url
-                }
+            if not any([show_changed, stale, fresh]):
+                return
 
-                sql_t.append(qsData)
+            sickrage.app.log.debug("Updating show {} in QuickSearch cache, {} stale and {} new episode records".format(
+                show.name, len(stale), len(fresh)))
 
-                self.cache['episodes'][e.indexer_id] = qsData
+            session = sickrage.app.cache_db.session()
 
-            session.bulk_insert_mappings(CacheDB.QuickSearchEpisode, sql_t)
-            session.commit()
+            try:
+                if show_changed:
+                    session.merge(CacheDB.QuickSearchShow(**show_data))
+
+                if not cached:
+                    session.query(CacheDB.QuickSearchEpisode).filter_by(showid=indexer_id).delete()
+
+                for data in stale:
+                    session.query(CacheDB.QuickSearchEpisode).filter_by(showid=data['showid'], season=data['season'],
+                                                                        episode=data['episode']).delete()
+
+                session.bulk_insert_mappings(CacheDB.QuickSearchEpisode, fresh)
+                session.commit()
+            except Exception:
+                # the index is only changed once the database write went through, so it still matches the database
+                session.rollback()
+                raise
+
+            with self.lock:
+                if show_changed:
+                    self._cache_show(show_data)
+
+                self._uncache_episodes(stale)
+                self._cache_episodes(fresh)
+
+    def add_show(self, indexer_id):
+        self.update_show(indexer_id)
 
     def del_show(self, indexer_id):
         session = sickrage.app.cache_db.session()
@@ -110,14 +354,14 @@ class QuicksearchCache(object):
 
         sickrage.app.log.debug("Deleting show {} from QuickSearch cache".format(show.name))
 
-        if indexer_id in self.cache['shows'].copy():
-            del self.cache['shows'][indexer_id]
-
-        for k, v in self.cache['episodes'].copy().items():
-            if v['showid'] == indexer_id:
-                del self.cache['episodes'][k]
+        with self.write_lock:
+            try:
+                session.query(CacheDB.QuickSearchShow).filter_by(showid=indexer_id).delete()
+                session.query(CacheDB.QuickSearchEpisode).filter_by(showid=indexer_id).delete()
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
 
-        # remove from database
-        session.query(CacheDB.QuickSearchShow).filter_by(showid=indexer_id).delete()
-        session.query(CacheDB.QuickSearchEpisode).filter_by(showid=indexer_id).delete()
-        session.commit()
+            with self.lock:
+                self._uncache_show(indexer_id)
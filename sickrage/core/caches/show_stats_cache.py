@@ -0,0 +1,138 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+import datetime
+import threading
+
+from sqlalchemy import func, case, and_
+
+import sickrage
+from sickrage.core.common import Quality, UNAIRED, WANTED
+from sickrage.core.databases.main import MainDB
+
+
+class ShowStatsCache(object):
+    def __init__(self):
+        self.name = "SHOW-STATS-CACHE"
+        self.lock = threading.Lock()
+        self.cache = {}
+        self.cache_date = None
+
+    @property
+    def default_stats(self):
+        return {
+            'airs_next': datetime.date.min,
+            'airs_prev': datetime.date.min,
+            'total': 0,
+            'unaired': 0,
+            'snatched': 0,
+            'downloaded': 0,
+            'special': 0,
+            'special_unaired': 0,
+            'special_snatched': 0,
+            'special_downloaded': 0,
+            'total_size': 0
+        }
+
+    def get(self, indexer_id, indexer=1):
+        """
+        Returns the episode counters, next/previous air dates and total size of a show
+
+        :param indexer_id: show indexer id
+        :param indexer: show indexer
+        :return: dict of show statistics
+        """
+        with self.lock:
+            # airs next/prev depend on todays date so reload when the day changes
+            if self.cache_date != datetime.date.today():
+                self.load()
+            return self.cache.get((indexer_id, indexer), self.default_stats)
+
+    def invalidate(self):
+        with self.lock:
+            self.cache_date = None
+
+    def load(self):
+        today = datetime.date.today()
+
+        snatched = Quality.SNATCHED + Quality.SNATCHED_BEST + Quality.SNATCHED_PROPER
+        downloaded = Quality.DOWNLOADED + Quality.ARCHIVED
+
+        def count_if(*criteria):
+            return func.sum(case([(and_(*criteria), 1)], else_=0))
+
+        session = sickrage.app.main_db.session()
+
+        # episodes sharing the same file within a season only count its size once, same as TVShow.related_episodes
+        file_stats = session.query(
+            MainDB.TVEpisode.showid,
+            MainDB.TVEpisode.indexer,
+            func.count().label('total'),
+            count_if(MainDB.TVEpisode.season != 0, MainDB.TVEpisode.status == UNAIRED).label('unaired'),
+            count_if(MainDB.TVEpisode.season != 0, MainDB.TVEpisode.status.in_(snatched)).label('snatched'),
+            count_if(MainDB.TVEpisode.season != 0, MainDB.TVEpisode.status.in_(downloaded)).label('downloaded'),
+            count_if(MainDB.TVEpisode.season == 0).label('special'),
+            count_if(MainDB.TVEpisode.season == 0, MainDB.TVEpisode.status == UNAIRED).label('special_unaired'),
+            count_if(MainDB.TVEpisode.season == 0, MainDB.TVEpisode.status.in_(snatched)).label('special_snatched'),
+            count_if(MainDB.TVEpisode.season == 0, MainDB.TVEpisode.status.in_(downloaded)).label('special_downloaded'),
+            func.min(case([(and_(MainDB.TVEpisode.season != 0,
+                                 MainDB.TVEpisode.airdate >= today,
+                                 MainDB.TVEpisode.status.in_([UNAIRED, WANTED])), MainDB.TVEpisode.airdate)])).label('airs_next'),
+            func.max(case([(and_(MainDB.TVEpisode.season != 0,
+                                 MainDB.TVEpisode.airdate < today,
+                                 MainDB.TVEpisode.status != UNAIRED), MainDB.TVEpisode.airdate)])).label('airs_prev'),
+            case([(MainDB.TVEpisode.location != '', func.max(MainDB.TVEpisode.file_size))],
+                 else_=func.sum(MainDB.TVEpisode.file_size)).label('total_size')
+        ).group_by(
+            MainDB.TVEpisode.showid,
+            MainDB.TVEpisode.indexer,
+            MainDB.TVEpisode.season,
+            MainDB.TVEpisode.location
+        ).subquery()
+
+        query = session.query(
+            file_stats.c.showid,
+            file_stats.c.indexer,
+            func.sum(file_stats.c.total).label('total'),
+            func.sum(file_stats.c.unaired).label('unaired'),
+            func.sum(file_stats.c.snatched).label('snatched'),
+            func.sum(file_stats.c.downloaded).label('downloaded'),
+            func.sum(file_stats.c.special).label('special'),
+            func.sum(file_stats.c.special_unaired).label('special_unaired'),
+            func.sum(file_stats.c.special_snatched).label('special_snatched'),
+            func.sum(file_stats.c.special_downloaded).label('special_downloaded'),
+            func.min(file_stats.c.airs_next).label('airs_next'),
+            func.max(file_stats.c.airs_prev).label('airs_prev'),
+            func.sum(file_stats.c.total_size).label('total_size')
+        ).group_by(
+            file_stats.c.showid,
+            file_stats.c.indexer
+        )
+
+        self.cache = {}
+        for x in query:
+            stats = self.default_stats
+            for key, value in x._asdict().items():
+                if key not in stats or value is None:
+                    continue
+                stats[key] = value if key in ['airs_next', 'airs_prev'] else int(value)
+            self.cache[(x.showid, x.indexer)] = stats
+
+        self.cache_date = today
@@ -33,7 +33,7 @@ from sickrage.core.common import Quality
 from sickrage.core.databases.cache import CacheDB
 from sickrage.core.exceptions import AuthException
 from sickrage.core.helpers import show_names, validate_url, is_ip_private, try_int
-from sickrage.core.nameparser import InvalidNameException, NameParser, InvalidShowException
+from sickrage.core.nameparser import NameParser
 from sickrage.core.tv.show.helpers import find_show
 from sickrage.core.websession import WebSession
 
@@ -46,10 +46,8 @@ class TVCache(object):
         self.search_strings = kwargs.pop('search_strings', dict(RSS=['']))
 
     def clear(self):
-        session = sickrage.app.cache_db.session()
         if self.shouldClearCache():
-            session.query(CacheDB.Provider).filter_by(provider=self.providerID).delete()
-            session.commit()
+            sickrage.app.cache_db.delete_providers(self.providerID)
 
     def _get_title_and_url(self, item):
         return self.provider._get_title_and_url(item)
@@ -84,7 +82,7 @@ class TVCache(object):
                 # set updated
                 self.last_update = datetime.datetime.today()
 
-                [self._parseItem(item) for item in data['entries']]
+                self.add_cache_entries([self._get_cache_entry(item) for item in data['entries']])
             except AuthException as e:
                 sickrage.app.log.warning("Authentication error: {}".format(e))
                 return False
@@ -112,7 +110,7 @@ class TVCache(object):
     def _translateLinkURL(self, url):
         return url.replace('&amp;', '&')
 
-    def _parseItem(self, item):
+    def _get_cache_entry(self, item):
         title, url = self._get_title_and_url(item)
         seeders, leechers = self._get_result_stats(item)
         size = self._get_size(item)
@@ -120,10 +118,10 @@ class TVCache(object):
         self.check_item(title, url)
 
         if title and url:
-            self.add_cache_entry(self._translateTitle(title), self._translateLinkURL(url), seeders, leechers, size)
-        else:
-            sickrage.app.log.debug(
-                "The data returned from the " + self.provider.name + " feed is incomplete, this result is unusable")
+            return self._translateTitle(title), self._translateLinkURL(url), seeders, leechers, size
+
+        sickrage.app.log.debug(
+            "The data returned from the " + self.provider.name + " feed is incomplete, this result is unusable")
 
     @property
     def last_update(self):
@@ -195,72 +193,108 @@ class TVCache(object):
             return False
         return True
 
-    def add_cache_entry(self, name, url, seeders, leechers, size):
+    def _get_existing_urls(self, urls):
         session = sickrage.app.cache_db.session()
 
-        # check for existing entry in cache
-        if session.query(CacheDB.Provider).filter_by(url=url).count():
-            return
+        urls = list(urls)
+        existing_urls = set()
+        for i in range(0, len(urls), 500):
+            existing_urls.update(x.url for x in session.query(CacheDB.Provider.url).filter(CacheDB.Provider.url.in_(urls[i:i + 500])))
+
+        return existing_urls
+
+    def add_cache_entry(self, name, url, seeders, leechers, size):
+        return self.add_cache_entries([(name, url, seeders, leechers, size)])
+
+    def add_cache_entries(self, entries):
+        """
+        Parses and stores a batch of feed entries, existing urls are skipped using a single lookup and new results
+        are written to the cache in one transaction.
+        :param entries: list of (name, url, seeders, leechers, size) tuples
+        :return: number of results added to cache
+        """
+        start_time = time.time()
+
+        entries = [entry for entry in entries if entry]
+        if not entries:
+            return 0
+
+        # check for existing entries in cache
+        existing_urls = self._get_existing_urls(set(entry[1] for entry in entries))
+
+        candidates = {}
+        for name, url, seeders, leechers, size in entries:
+            if url in existing_urls or url in candidates:
+                continue
+
+            # ignore invalid and private IP address urls
+            if not validate_url(url):
+                if not url.startswith('magnet'):
+                    continue
+            elif is_ip_private(url.split(r'//')[-1].split(r'/')[0]):
+                continue
+
+            candidates[url] = (name, seeders, leechers, size)
+
+        # parse release names
+        parse_results = NameParser(validate_show=True).parse_many([x[0] for x in candidates.values()])
 
-        # ignore invalid and private IP address urls
-        if not validate_url(url):
-            if not url.startswith('magnet'):
-                return
-        elif is_ip_private(url.split(r'//')[-1].split(r'/')[0]):
-            return
+        dbData = {}
+        for (url, (name, seeders, leechers, size)), parse_result in zip(candidates.items(), parse_results):
+            if not parse_result or not parse_result.series_name or parse_result.quality == Quality.UNKNOWN:
+                continue
 
+            season = parse_result.season_number if parse_result.season_number else 1
+            episodes = parse_result.episode_numbers
+
+            if season and episodes:
+                dbData[url] = {
+                    'provider': self.providerID,
+                    'name': name,
+                    'season': season,
+                    'episodes': "|" + "|".join(map(str, episodes)) + "|",
+                    'series_id': parse_result.indexer_id,
+                    'url': url,
+                    'time': int(time.mktime(datetime.datetime.today().timetuple())),
+                    'quality': parse_result.quality,
+                    'release_group': parse_result.release_group,
+                    'version': parse_result.version,
+                    'seeders': try_int(seeders),
+                    'leechers': try_int(leechers),
+                    'size': try_int(size, -1)
+                }
+
+        # add to internal database
         try:
-            # parse release name
-            parse_result = NameParser(validate_show=True).parse(name)
-            if parse_result.series_name and parse_result.quality != Quality.UNKNOWN:
-                season = parse_result.season_number if parse_result.season_number else 1
-                episodes = parse_result.episode_numbers
-
-                if season and episodes:
-                    # store episodes as a seperated string
-                    episodeText = "|" + "|".join(map(str, episodes)) + "|"
-
-                    # get quality of release
-                    quality = parse_result.quality
-
-                    # get release group
-                    release_group = parse_result.release_group
-
-                    # get version
-                    version = parse_result.version
-
-                    dbData = {
-                        'provider': self.providerID,
-                        'name': name,
-                        'season': season,
-                        'episodes': episodeText,
-                        'series_id': parse_result.indexer_id,
-                        'url': url,
-                        'time': int(time.mktime(datetime.datetime.today().timetuple())),
-                        'quality': quality,
-                        'release_group': release_group,
-                        'version': version,
-                        'seeders': try_int(seeders),
-                        'leechers': try_int(leechers),
-                        'size': try_int(size, -1)
-                    }
-
-                    # add to internal database
-                    try:
-                        session.add(CacheDB.Provider(**dbData))
-                        session.commit()
-                        sickrage.app.log.debug("SEARCH RESULT:[{}] ADDED TO CACHE!".format(name))
-                    except IntegrityError:
-                        pass
-
-                    # add to external provider cache database
-                    if sickrage.app.config.enable_api_providers_cache and not self.provider.private:
-                        try:
-                            sickrage.app.io_loop.run_in_executor(None, functools.partial(sickrage.app.api.provider_cache.add, data=dbData))
-                        except Exception as e:
-                            pass
-        except (InvalidShowException, InvalidNameException):
-            pass
+            sickrage.app.cache_db.upsert_providers(list(dbData.values()))
+        except IntegrityError:
+            # another thread or provider cached some of these urls since the lookup above, leave their rows alone and
+            # retry the rest once
+            for url in self._get_existing_urls(dbData):
+                del dbData[url]
+
+            try:
+                sickrage.app.cache_db.upsert_providers(list(dbData.values()))
+            except IntegrityError as e:
+                sickrage.app.log.warning("{}: unable to add {} results to cache: {}".format(self.provider.name, len(dbData), e))
+                return 0
+
+        for data in dbData.values():
+            sickrage.app.log.debug("SEARCH RESULT:[{}] ADDED TO CACHE!".format(data['name']))
+
+        # add to external provider cache database
+        if sickrage.app.config.enable_api_providers_cache and not self.provider.private:
+            for data in dbData.values():
+                try:
+                    sickrage.app.io_loop.run_in_executor(None, functools.partial(sickrage.app.api.provider_cache.add, data=data))
+                except Exception:
+                    pass
+
+        elapsed = time.time() - start_time
+        sickrage.app.log.debug("{}: ingested {} new of {} cache entries in {:.2f}s ({:.1f} entries/s)".format(
+            self.provider.name, len(dbData), len(entries), elapsed, len(entries) / elapsed if elapsed else len(entries)))
+
+        return len(dbData)
 
     def search_cache(self, show_id, season, episode, manualSearch=False, downCurQuality=False):
         cache_results = {}
@@ -275,8 +309,12 @@ class TVCache(object):
 
         # get data from internal database
         session = sickrage.app.cache_db.session()
-        dbData += [x.as_dict() for x in session.query(CacheDB.Provider).filter_by(provider=self.providerID, series_id=show_id, season=season).filter(
-            CacheDB.Provider.episodes.contains("|{}|".format(episode)))]
+        dbData += [x.as_dict() for x in session.query(CacheDB.Provider).join(
+            CacheDB.ProviderEpisode, CacheDB.ProviderEpisode.provider_row_id == CacheDB.Provider.id).filter(
+            CacheDB.Provider.provider == self.providerID,
+            CacheDB.ProviderEpisode.series_id == show_id,
+            CacheDB.ProviderEpisode.season == season,
+            CacheDB.ProviderEpisode.episode == episode)]
 
         for curResult in dbData:
             show_object = find_show(int(curResult["series_id"]))
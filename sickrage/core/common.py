@@ -21,7 +21,7 @@
 import operator
 import re
 from collections import UserDict
-from functools import reduce
+from functools import lru_cache, reduce
 
 import pathlib
 
@@ -42,6 +42,26 @@ dateFormat = '%Y-%m-%d'
 dateTimeFormat = '%Y-%m-%d %H:%M:%S'
 timeFormat = '%A %I:%M %p'
 
+### Scene quality detection
+SCENE_QUALITY_CACHE_SIZE = 10000
+
+
+def _compile_quality_regexes(*patterns):
+    return tuple(re.compile(pattern, re.I) for pattern in patterns)
+
+
+_anime_dvd_regexes = _compile_quality_regexes(r"dvd", r"dvdrip")
+_anime_bluray_regexes = _compile_quality_regexes(r"BD", r"blue?-?ray")
+_anime_sd_regexes = _compile_quality_regexes(r"360p", r"480p", r"848x480", r"XviD")
+_anime_hd_regexes = _compile_quality_regexes(r"720p", r"1280x720", r"960x720")
+_anime_fullhd_regexes = _compile_quality_regexes(r"1080p", r"1920x1080")
+
+_codec_pattern = r"[xh].?26[45]"
+_web_pattern = r"\bweb\b|web.?dl|web(rip|mux|hd)"
+_bluray_pattern = r"blue?-?ray|hddvd|b[rd](rip|mux)"
+_sd_exclude_regexes = (_compile_quality_regexes(r"(720|1080|2160|4320)[pi]"),
+                       _compile_quality_regexes(r"hr.ws.pdtv.[xh].?26[45]"))
+
 ### Other constants
 MULTI_EP_RESULT = -1
 SEASON_RESULT = -2
@@ -261,22 +281,34 @@ class Quality(object):
         :return: Quality prefix
         """
 
+        if not name:
+            return Quality.UNKNOWN
+
+        return Quality._scene_quality(pathlib.Path(name).name, bool(anime))
+
+    @staticmethod
+    @lru_cache(maxsize=SCENE_QUALITY_CACHE_SIZE)
+    def _scene_quality(name, anime):
+        """
+        Memoized body of scene_quality, keyed by (basename, anime)
+
+        :param name: Episode file basename to analyse
+        :param anime: Boolean to indicate if the show we're resolving is Anime
+        :return: Quality prefix
+        """
+
         # pylint: disable=R0912
 
         ret = Quality.UNKNOWN
-        if not name:
-            return ret
-
-        name = pathlib.Path(name).name
 
-        check_name = lambda l, func: func([re.search(x, name, re.I) for x in l])
+        check_name = lambda patterns, func: func(pattern.search(name) for pattern in patterns)
 
         if anime:
-            dvdOptions = check_name([r"dvd", r"dvdrip"], any)
-            blueRayOptions = check_name([r"BD", r"blue?-?ray"], any)
-            sdOptions = check_name([r"360p", r"480p", r"848x480", r"XviD"], any)
-            hdOptions = check_name([r"720p", r"1280x720", r"960x720"], any)
-            fullHD = check_name([r"1080p", r"1920x1080"], any)
+            dvdOptions = check_name(_anime_dvd_regexes, any)
+            blueRayOptions = check_name(_anime_bluray_regexes, any)
+            sdOptions = check_name(_anime_sd_regexes, any)
+            hdOptions = check_name(_anime_hd_regexes, any)
+            fullHD = check_name(_anime_fullhd_regexes, any)
 
             if sdOptions and not blueRayOptions and not dvdOptions:
                 ret = Quality.SDTV
@@ -295,48 +327,10 @@ class Quality(object):
 
             return ret
 
-        if (check_name([r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip", r"xvid|divx|[xh].?26[45]"], all)
-                and not check_name([r"(720|1080|2160|4320)[pi]"], all)
-                and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
-            ret = Quality.SDTV
-        elif (check_name([r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray", r"xvid|divx|[xh].?26[45]"], all)
-              and not check_name([r"(720|1080|2160|4320)[pi]"], all)
-              and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
-            ret = Quality.SDDVD
-        elif (check_name([r"720p", r"hd.?tv", r"[xh].?26[45]"], all)
-              or check_name([r"720p", r"hevc", r"[xh].?26[45]"], all)
-              or check_name([r"hr.ws.pdtv.[xh].?26[45]"], any) and not check_name([r"1080[pi]"], all)):
-            ret = Quality.HDTV
-        elif (check_name([r"720p|1080i", r"hd.?tv", r"mpeg-?2"], all)
-              or check_name([r"1080[pi].hdtv", r"h.?26[45]"], all)):
-            ret = Quality.RAWHDTV
-        elif (check_name([r"1080p", r"hd.?tv", r"[xh].?26[45]"], all)
-              or check_name([r"1080p", r"hevc", r"[xh].?26[45]"], all)):
-            ret = Quality.FULLHDTV
-        elif (check_name([r"720p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"720p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.HDWEBDL
-        elif (check_name([r"1080p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"1080p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.FULLHDWEBDL
-        elif check_name([r"720p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.HDBLURAY
-        elif check_name([r"1080p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.FULLHDBLURAY
-        elif check_name([r"2160p", r"hd.?tv", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_4K_TV
-        elif check_name([r"4320p", r"hd.?tv", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_8K_TV
-        elif (check_name([r"2160p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"2160p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.UHD_4K_WEBDL
-        elif (check_name([r"4320p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"4320p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.UHD_8K_WEBDL
-        elif check_name([r"2160p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_4K_BLURAY
-        elif check_name([r"4320p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_8K_BLURAY
+        for quality, conditions in _scene_quality_rules:
+            for required, excluded in conditions:
+                if check_name(required, all) and not any(check_name(x, all) for x in excluded):
+                    return quality
 
         return ret
 
@@ -351,10 +345,23 @@ class Quality(object):
     @staticmethod
     def split_composite_status(status):
         """Returns a tuple containing (status, quality)"""
+        try:
+            return Quality._composite_status_table[status]
+        except (KeyError, TypeError):
+            return Quality._split_composite_status(status)
+
+    @staticmethod
+    def split_composite_statuses(statuses):
+        """Returns a list of (status, quality) tuples, one for each composite status in statuses"""
+        table = Quality._composite_status_table
+        return [table[x] if x in table else Quality._split_composite_status(x) for x in statuses]
+
+    @staticmethod
+    def _split_composite_status(status):
         if status == UNKNOWN:
             return UNKNOWN, Quality.UNKNOWN
 
-        for q in sorted(Quality.qualityStrings.keys(), reverse=True):
+        for q in Quality._descending_qualities:
             if status > q * 100:
                 return status - q * 100, q
 
@@ -486,6 +493,9 @@ class Quality(object):
         quality = Quality.name_quality(name, anime)
         return Quality.composite_status(DOWNLOADED, quality)
 
+    _descending_qualities = None
+    _composite_status_table = None
+
     DOWNLOADED = None
     SNATCHED = None
     SNATCHED_PROPER = None
@@ -495,6 +505,61 @@ class Quality(object):
     IGNORED = None
 
 
+# ordered (quality, conditions) rules for non-anime scene names, the first quality with a
+# matching condition wins; a condition is (regexes that must all match, regex groups that
+# must not all match)
+_scene_quality_rules = (
+    (Quality.SDTV, [
+        (_compile_quality_regexes(r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip",
+                                  r"xvid|divx|" + _codec_pattern), _sd_exclude_regexes)]),
+    (Quality.SDDVD, [
+        (_compile_quality_regexes(r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray", r"xvid|divx|" + _codec_pattern),
+         _sd_exclude_regexes)]),
+    (Quality.HDTV, [
+        (_compile_quality_regexes(r"720p", r"hd.?tv", _codec_pattern), ()),
+        (_compile_quality_regexes(r"720p", r"hevc", _codec_pattern), ()),
+        (_compile_quality_regexes(r"hr.ws.pdtv.[xh].?26[45]"), (_compile_quality_regexes(r"1080[pi]"),))]),
+    (Quality.RAWHDTV, [
+        (_compile_quality_regexes(r"720p|1080i", r"hd.?tv", r"mpeg-?2"), ()),
+        (_compile_quality_regexes(r"1080[pi].hdtv", r"h.?26[45]"), ())]),
+    (Quality.FULLHDTV, [
+        (_compile_quality_regexes(r"1080p", r"hd.?tv", _codec_pattern), ()),
+        (_compile_quality_regexes(r"1080p", r"hevc", _codec_pattern), ())]),
+    (Quality.HDWEBDL, [
+        (_compile_quality_regexes(r"720p", _web_pattern), ()),
+        (_compile_quality_regexes(r"720p", r"itunes", _codec_pattern), ())]),
+    (Quality.FULLHDWEBDL, [
+        (_compile_quality_regexes(r"1080p", _web_pattern), ()),
+        (_compile_quality_regexes(r"1080p", r"itunes", _codec_pattern), ())]),
+    (Quality.HDBLURAY, [
+        (_compile_quality_regexes(r"720p", _bluray_pattern, _codec_pattern), ())]),
+    (Quality.FULLHDBLURAY, [
+        (_compile_quality_regexes(r"1080p", _bluray_pattern, _codec_pattern), ())]),
+    (Quality.UHD_4K_TV, [
+        (_compile_quality_regexes(r"2160p", r"hd.?tv", _codec_pattern), ())]),
+    (Quality.UHD_8K_TV, [
+        (_compile_quality_regexes(r"4320p", r"hd.?tv", _codec_pattern), ())]),
+    (Quality.UHD_4K_WEBDL, [
+        (_compile_quality_regexes(r"2160p", _web_pattern), ()),
+        (_compile_quality_regexes(r"2160p", r"itunes", _codec_pattern), ())]),
+    (Quality.UHD_8K_WEBDL, [
+        (_compile_quality_regexes(r"4320p", _web_pattern), ()),
+        (_compile_quality_regexes(r"4320p", r"itunes", _codec_pattern), ())]),
+    (Quality.UHD_4K_BLURAY, [
+        (_compile_quality_regexes(r"2160p", _bluray_pattern, _codec_pattern), ())]),
+    (Quality.UHD_8K_BLURAY, [
+        (_compile_quality_regexes(r"4320p", _bluray_pattern, _codec_pattern), ())]),
+)
+
+Quality._descending_qualities = tuple(sorted(Quality.qualityStrings.keys(), reverse=True))
+
+# every composite of a status (0-99) and a quality, decoded once so lookups are a single dict access
+Quality._composite_status_table = {UNKNOWN: Quality._split_composite_status(UNKNOWN)}
+Quality._composite_status_table.update({
+    Quality.composite_status(x, q): Quality._split_composite_status(Quality.composite_status(x, q))
+    for x in range(100) for q in Quality._descending_qualities
+})
+
 Quality.DOWNLOADED = [Quality.composite_status(DOWNLOADED, x) for x in Quality.qualityStrings.keys()]
 Quality.SNATCHED = [Quality.composite_status(SNATCHED, x) for x in Quality.qualityStrings.keys()]
 Quality.SNATCHED_PROPER = [Quality.composite_status(SNATCHED_PROPER, x) for x in Quality.qualityStrings.keys()]
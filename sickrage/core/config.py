@@ -144,6 +144,8 @@ class Config(object):
         self.allow_high_priority = False
         self.sab_forced = False
         self.randomize_providers = False
+        self.max_provider_threads = 4
+        self.name_parser_cache_size = 5000
         self.min_autopostprocessor_freq = 1
         self.min_daily_searcher_freq = 10
         self.min_backlog_searcher_freq = 10
@@ -771,6 +773,8 @@ class Config(object):
                 'naming_anime_pattern': 'Season %0S/%SN - S%0SE%0E - %EN',
                 'naming_custom_anime': False,
                 'randomize_providers': False,
+                'max_provider_threads': 4,
+                'name_parser_cache_size': 5000,
                 'web_host': get_lan_ip(),
                 'config_version': self.config_version,
                 'process_automatically': False,
@@ -1474,6 +1478,8 @@ class Config(object):
         self.download_unverified_magnet_link = self.check_setting_bool('General', 'download_unverified_magnet_link')
         self.proper_searcher_interval = self.check_setting_str('General', 'check_propers_interval')
         self.randomize_providers = self.check_setting_bool('General', 'randomize_providers')
+        self.max_provider_threads = self.check_setting_int('General', 'max_provider_threads')
+        self.name_parser_cache_size = self.check_setting_int('General', 'name_parser_cache_size')
         self.allow_high_priority = self.check_setting_bool('General', 'allow_high_priority')
         self.skip_removed_files = self.check_setting_bool('General', 'skip_removed_files')
         self.usenet_retention = self.check_setting_int('General', 'usenet_retention')
@@ -1942,6 +1948,8 @@ class Config(object):
                 'torrent_file_to_magnet': int(self.torrent_file_to_magnet),
                 'download_unverified_magnet_link': int(self.download_unverified_magnet_link),
                 'randomize_providers': int(self.randomize_providers),
+                'max_provider_threads': int(self.max_provider_threads),
+                'name_parser_cache_size': int(self.name_parser_cache_size),
                 'check_propers_interval': self.proper_searcher_interval,
                 'allow_high_priority': int(self.allow_high_priority),
                 'skip_removed_files': int(self.skip_removed_files),
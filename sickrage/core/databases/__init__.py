@@ -18,12 +18,12 @@
 import datetime
 import os
 import pickle
-import random
 import shutil
 import sqlite3
 import threading
-from collections import OrderedDict
-from time import sleep
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 
 import sqlalchemy
 from migrate import DatabaseAlreadyControlledError, DatabaseNotControlledError
@@ -32,10 +32,14 @@ from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker, mapper, scoped_session
+from sqlalchemy.pool import Pool, QueuePool
 
 import sickrage
 from sickrage.core.helpers import backup_versioned_file
 
+_query_counters = threading.local()
+_database_writers = {}
+
 
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
@@ -56,6 +60,49 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor.close()
 
 
+@event.listens_for(Engine, "before_cursor_execute")
+def count_queries(conn, cursor, statement, parameters, context, executemany):
+    for counter in getattr(_query_counters, 'active', []):
+        counter.count += 1
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def acquire_database_writer(conn, cursor, statement, parameters, context, executemany):
+    writer = _database_writers.get(conn.engine.url.database)
+    if not writer or 'database_writer' in conn.info:
+        return
+
+    if statement.lstrip().split(None, 1)[0].upper() in ['SELECT', 'PRAGMA']:
+        return
+
+    # a timed out wait is recorded as None so the rest of this checkout does not queue up again
+    conn.info['database_writer'] = writer if writer.acquire() else None
+
+
+def _release_database_writer(info):
+    writer = info.pop('database_writer', None)
+    if writer:
+        writer.release()
+
+
+@event.listens_for(Pool, "checkin")
+def release_database_writer(dbapi_connection, connection_record):
+    # sessions check their connection in once the DBAPI commit or rollback has returned, the engine commit and
+    # rollback events fire before it and would let the next writer in while sqlite still holds the lock
+    if connection_record is None:
+        return
+
+    _release_database_writer(connection_record.info)
+
+
+@event.listens_for(Pool, "invalidate")
+def release_database_writer_on_invalidate(dbapi_connection, connection_record, exception):
+    if connection_record is None:
+        return
+
+    _release_database_writer(connection_record.info)
+
+
 @event.listens_for(mapper, "init")
 def instant_defaults_listener(target, args, kwargs):
     for key, column in inspect(target.__class__).columns.items():
@@ -66,43 +113,131 @@ def instant_defaults_listener(target, args, kwargs):
                 setattr(target, key, column.default.arg)
 
 
+class QueryCounter(object):
+    """Counts SQL statements executed on the current thread, can be used as context manager"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __enter__(self):
+        if not hasattr(_query_counters, 'active'):
+            _query_counters.active = []
+        _query_counters.active.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _query_counters.active.remove(self)
+
+
+class DatabaseWriter(object):
+    """
+    Serializes write transactions for a database in FIFO order. SQLite only allows a single writer at a time
+    while WAL mode lets readers carry on concurrently, so writers queue up here instead of racing each other
+    for the database lock. A writer slot is taken by the first data modifying statement on a connection and
+    handed to the next queued writer once the connection is returned to the pool, after its transaction has
+    committed or rolled back, or is invalidated.
+    """
+
+    def __init__(self, name, timeout=60):
+        self.name = name
+        self.timeout = timeout
+
+        self._mutex = threading.Lock()
+        self._owner = None
+        self._count = 0
+        self._acquired_at = None
+        self._waiters = deque()
+
+        self.writes = 0
+        self.timeouts = 0
+        self.total_wait_time = 0
+        self.total_write_time = 0
+        self.max_write_time = 0
+
+    @property
+    def queue_depth(self):
+        return len(self._waiters)
+
+    @property
+    def metrics(self):
+        return {
+            'queue_depth': self.queue_depth,
+            'writes': self.writes,
+            'timeouts': self.timeouts,
+            'avg_wait_time': self.total_wait_time / self.writes if self.writes else 0,
+            'avg_write_time': self.total_write_time / self.writes if self.writes else 0,
+            'max_write_time': self.max_write_time
+        }
+
+    def acquire(self):
+        queued_at = time.time()
+
+        with self._mutex:
+            # re-entrant for the owning thread, it may hold more than one connection
+            if self._owner in [None, threading.get_ident()]:
+                self._owner = threading.get_ident()
+                self._count += 1
+                if self._count == 1:
+                    self._acquired_at = time.time()
+                return True
+
+            waiter = threading.Event()
+            self._waiters.append((threading.get_ident(), waiter))
+
+        waiter.wait(self.timeout)
+
+        with self._mutex:
+            if not waiter.is_set():
+                # fall back to sqlite's own busy handling rather than blocking forever
+                self._waiters.remove((threading.get_ident(), waiter))
+                self.timeouts += 1
+                sickrage.app.log.debug('Timed out waiting to write to {} database, queue depth {}'.format(self.name, self.queue_depth))
+                return False
+
+            self.total_wait_time += time.time() - queued_at
+
+        return True
+
+    def release(self):
+        with self._mutex:
+            self._count -= 1
+            if self._count > 0:
+                return
+
+            write_time = time.time() - self._acquired_at
+            self.writes += 1
+            self.total_write_time += write_time
+            self.max_write_time = max(self.max_write_time, write_time)
+
+            if self._waiters:
+                # hand the writer slot straight to the next writer in line
+                self._owner, waiter = self._waiters.popleft()
+                self._count = 1
+                self._acquired_at = time.time()
+                waiter.set()
+            else:
+                self._owner = None
+                self._count = 0
+
+
 class ContextSession(sqlalchemy.orm.Session):
     """:class:`sqlalchemy.orm.Session` which can be used as context manager"""
 
-    def __init__(self, *args, **kwargs):
-        super(ContextSession, self).__init__(*args, **kwargs)
-        self._lock = threading.Lock()
-        self.max_attempts = 50
+    def get_bind(self, mapper=None, clause=None):
+        database = self.info.get('database')
+        if database is not None:
+            return database.engine
+        return super(ContextSession, self).get_bind(mapper, clause)
 
     def commit(self, close=False):
-        with self._lock:
-            statement = None
-            params = None
-            for i in range(self.max_attempts):
-                try:
-                    if statement and params:
-                        self.bind.execute(statement, params)
-                    super(ContextSession, self).commit()
-                except OperationalError as e:
-                    self.rollback()
-
-                    if 'database is locked' not in str(e):
-                        raise
-
-                    statement = e.statement
-                    params = e.params
-
-                    timer = random.randint(10, 30)
-                    sickrage.app.log.debug('Retrying database commit in {}s, attempt {}'.format(timer, i))
-                    sleep(timer)
-                except Exception as e:
-                    self.rollback()
-                    raise
-                else:
-                    break
-                finally:
-                    if close:
-                        self.close()
+        try:
+            super(ContextSession, self).commit()
+        except Exception:
+            self.rollback()
+            raise
+        finally:
+            if close:
+                self.close()
 
     def __enter__(self):
         return self
@@ -124,7 +259,7 @@ class SRDatabaseBase(object):
 
 class SRDatabase(object):
     def __init__(self, name, db_version=0, db_type='sqlite', db_prefix='sickrage', db_host='localhost', db_port='3306', db_username='sickrage',
-                 db_password='sickrage'):
+                 db_password='sickrage', db_pool_size=10, db_max_overflow=-1, db_pool_recycle=3600, db_pool_pre_ping=None):
         self.name = name
         self.db_version = db_version
         self.db_type = db_type
@@ -134,12 +269,32 @@ class SRDatabase(object):
         self.db_username = db_username
         self.db_password = db_password
 
+        # connection pool settings
+        self.db_pool_size = db_pool_size
+        self.db_max_overflow = db_max_overflow
+        self.db_pool_recycle = db_pool_recycle
+        # a local sqlite file can't drop connections, pinging it would only add a round trip to every checkout
+        self.db_pool_pre_ping = db_pool_pre_ping if db_pool_pre_ping is not None else self.db_type != 'sqlite'
+
+        self._engine = None
+        self._engine_lock = threading.Lock()
+
         self.tables = {}
 
+        # write-behind batch state, kept per thread
+        self._batch_state = threading.local()
+        self.batch_flush_size = 500
+
         self.db_path = os.path.join(sickrage.app.data_dir, '{}.db'.format(self.name))
         self.db_repository = os.path.join(os.path.dirname(__file__), self.name, 'db_repository')
 
-        self.session = scoped_session(sessionmaker(class_=ContextSession, bind=self.engine))
+        # sqlite allows a single writer at a time, funnel all writes through one writer queue
+        self.writer = None
+        if self.db_type == 'sqlite':
+            self.writer = _database_writers[self.db_path] = DatabaseWriter(self.name)
+
+        # sessions look the engine up on use, so they follow a new engine after dispose
+        self.session = scoped_session(sessionmaker(class_=ContextSession, info={'database': self}))
 
         if not self.version:
             api.version_control(self.engine, self.db_repository, api.version(self.db_repository))
@@ -151,14 +306,40 @@ class SRDatabase(object):
 
     @property
     def engine(self):
+        if self._engine is None:
+            with self._engine_lock:
+                if self._engine is None:
+                    self._engine = self.create_engine()
+        return self._engine
+
+    def create_engine(self):
+        pool_args = {
+            'poolclass': QueuePool,
+            'pool_size': self.db_pool_size,
+            'max_overflow': self.db_max_overflow,
+            'pool_recycle': self.db_pool_recycle,
+            'pool_pre_ping': self.db_pool_pre_ping
+        }
+
         if self.db_type == 'sqlite':
-            return create_engine('sqlite:///{}'.format(self.db_path), echo=False, connect_args={'check_same_thread': False, 'timeout': 30})
+            return create_engine('sqlite:///{}'.format(self.db_path), echo=False, connect_args={'check_same_thread': False, 'timeout': 30},
+                                 **pool_args)
         elif self.db_type == 'mysql':
             mysql_engine = create_engine('mysql+pymysql://{}:{}@{}:{}/'.format(self.db_username, self.db_password, self.db_host, self.db_port), echo=False)
             mysql_engine.execute("CREATE DATABASE IF NOT EXISTS {}_{}".format(self.db_prefix, self.name))
+            mysql_engine.dispose()
             return create_engine(
                 'mysql+pymysql://{}:{}@{}:{}/{}_{}'.format(self.db_username, self.db_password, self.db_host, self.db_port, self.db_prefix, self.name),
-                echo=False)
+                echo=False, **pool_args)
+
+    def dispose(self):
+        with self._engine_lock:
+            if self._engine is None:
+                return
+
+            self.session.remove()
+            self._engine.dispose()
+            self._engine = None
 
     @property
     def version(self):
@@ -189,6 +370,64 @@ class SRDatabase(object):
             api.downgrade(self.engine, self.db_repository, self.db_version)
             sickrage.app.log.info('Downgraded {} database to version {}'.format(self.name, self.version))
 
+    @contextmanager
+    def batch(self):
+        """
+        Coalesces row updates queued with queue_update on the current thread and writes them
+        in a single transaction when the outermost batch ends, can be nested. Pending rows are
+        only written once batch_flush_size rows are queued or the batch ends, also when it ends
+        with an exception, so database reads inside a batch do not see them yet.
+        """
+        self._batch_state.depth = getattr(self._batch_state, 'depth', 0) + 1
+        if self._batch_state.depth == 1:
+            self._batch_state.pending = OrderedDict()
+
+        try:
+            yield
+        finally:
+            self._batch_state.depth -= 1
+            if not self._batch_state.depth:
+                self.flush_updates()
+
+    def queue_update(self, table, data):
+        """
+        Queues a row update if called within a batch, later updates to the same row replace earlier ones
+
+        :param table: declarative table class
+        :param data: dict of column values, must include the primary keys
+        :return: True if the update was queued, False if no batch is active and the caller should write the row itself
+        """
+        if not getattr(self._batch_state, 'depth', 0):
+            return False
+
+        primary_keys = tuple(data[pk.name] for pk in table.__table__.primary_key)
+        self._batch_state.pending[(table, primary_keys)] = data.copy()
+
+        # flush large batches early so pending rows do not pile up
+        if len(self._batch_state.pending) >= self.batch_flush_size:
+            self.flush_updates()
+
+        return True
+
+    def flush_updates(self):
+        """
+        Writes all row updates queued on the current thread using a single transaction
+        """
+        pending = getattr(self._batch_state, 'pending', None)
+        if not pending:
+            return
+
+        self._batch_state.pending = OrderedDict()
+
+        mappings = OrderedDict()
+        for (table, __), data in pending.items():
+            mappings.setdefault(table, []).append(data)
+
+        with self.session() as session:
+            for table, rows in mappings.items():
+                session.bulk_update_mappings(table, rows)
+            session.commit()
+
     def cleanup(self):
         pass
 
@@ -16,7 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 
-from sqlalchemy import Column, Integer, Text, String, Boolean
+from sqlalchemy import Column, Integer, Text, String, Boolean, ForeignKey, Index
 from sqlalchemy.ext.declarative import as_declarative
 from sqlalchemy.orm import sessionmaker
 
@@ -29,8 +29,8 @@ class CacheDBBase(SRDatabaseBase):
 
 
 class CacheDB(SRDatabase):
-    def __init__(self, db_type, db_prefix, db_host, db_port, db_username, db_password):
-        super(CacheDB, self).__init__('cache', 5, db_type, db_prefix, db_host, db_port, db_username, db_password)
+    def __init__(self, db_type, db_prefix, db_host, db_port, db_username, db_password, **kwargs):
+        super(CacheDB, self).__init__('cache', 6, db_type, db_prefix, db_host, db_port, db_username, db_password, **kwargs)
         CacheDBBase.metadata.create_all(self.engine)
         for model in CacheDBBase._decl_class_registry.values():
             if hasattr(model, '__tablename__'):
@@ -64,6 +64,108 @@ class CacheDB(SRDatabase):
         remove_duplicates_from_last_search_table()
         # remove_duplicates_from_scene_name_table()
 
+    def upsert_providers(self, rows):
+        """
+        Insert or update provider cache rows keyed on url along with their normalized episode rows, in a single transaction.
+        :param rows: list of provider row dicts, episodes stored as a pipe separated string
+        :return: number of rows written
+        """
+        if not rows:
+            return 0
+
+        rows = list({row['url']: row for row in rows}.values())
+
+        session = self.session()
+
+        try:
+            # chunked to stay under the bound parameter limit of sqlite
+            for i in range(0, len(rows), 500):
+                chunk = rows[i:i + 500]
+                urls = [row['url'] for row in chunk]
+
+                existing = dict(session.query(CacheDB.Provider.url, CacheDB.Provider.id).filter(CacheDB.Provider.url.in_(urls)))
+
+                session.bulk_update_mappings(CacheDB.Provider, [dict(row, id=existing[row['url']]) for row in chunk if row['url'] in existing])
+                session.bulk_insert_mappings(CacheDB.Provider, [row for row in chunk if row['url'] not in existing])
+
+                row_ids = dict(session.query(CacheDB.Provider.url, CacheDB.Provider.id).filter(CacheDB.Provider.url.in_(urls)))
+
+                session.query(CacheDB.ProviderEpisode).filter(
+                    CacheDB.ProviderEpisode.provider_row_id.in_(list(row_ids.values()))).delete(synchronize_session=False)
+
+                session.bulk_insert_mappings(CacheDB.ProviderEpisode, [{
+                    'provider_row_id': row_ids[row['url']],
+                    'series_id': row['series_id'],
+                    'season': row['season'],
+                    'episode': episode
+                } for row in chunk for episode in set(int(x) for x in filter(None, row['episodes'].split('|')))])
+
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        return len(rows)
+
+    def upsert_scene_names(self, scene_names):
+        """
+        Insert or update scene name rows keyed on name, in a single transaction.
+        :param scene_names: dict of scene name to indexer id
+        :return: number of rows written
+        """
+        if not scene_names:
+            return 0
+
+        names = list(scene_names)
+
+        session = self.session()
+
+        try:
+            # chunked to stay under the bound parameter limit of sqlite
+            for i in range(0, len(names), 500):
+                chunk = names[i:i + 500]
+
+                existing, duplicates = {}, []
+                for name, row_id in session.query(CacheDB.SceneName.name, CacheDB.SceneName.id).filter(
+                        CacheDB.SceneName.name.in_(chunk)).order_by(CacheDB.SceneName.id):
+                    if name in existing:
+                        duplicates.append(row_id)
+                    else:
+                        existing[name] = row_id
+
+                if duplicates:
+                    session.query(CacheDB.SceneName).filter(CacheDB.SceneName.id.in_(duplicates)).delete(synchronize_session=False)
+
+                session.bulk_update_mappings(CacheDB.SceneName, [{'id': existing[name], 'indexer_id': scene_names[name]}
+                                                                 for name in chunk if name in existing])
+                session.bulk_insert_mappings(CacheDB.SceneName, [{'name': name, 'indexer_id': scene_names[name]}
+                                                                 for name in chunk if name not in existing])
+
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        return len(names)
+
+    def delete_providers(self, provider_id):
+        """
+        Delete a provider's cache rows along with their episode rows, foreign keys are not enforced so the
+        episode rows are removed here rather than by the database.
+        :param provider_id: provider id to delete cache rows for
+        """
+        session = self.session()
+
+        try:
+            row_ids = session.query(CacheDB.Provider.id).filter_by(provider=provider_id)
+            session.query(CacheDB.ProviderEpisode).filter(CacheDB.ProviderEpisode.provider_row_id.in_(row_ids.subquery())).delete(
+                synchronize_session=False)
+            session.query(CacheDB.Provider).filter_by(provider=provider_id).delete()
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
     class LastUpdate(CacheDBBase):
         __tablename__ = 'last_update'
 
@@ -107,6 +209,17 @@ class CacheDB(SRDatabase):
         leechers = Column(Integer)
         size = Column(Integer)
 
+    class ProviderEpisode(CacheDBBase):
+        __tablename__ = 'provider_episodes'
+        __table_args__ = (
+            Index('idx_series_id_season_episode', 'series_id', 'season', 'episode'),
+        )
+
+        provider_row_id = Column(Integer, ForeignKey('providers.id'), primary_key=True)
+        episode = Column(Integer, primary_key=True)
+        series_id = Column(Integer)
+        season = Column(Integer)
+
     class QuickSearchShow(CacheDBBase):
         __tablename__ = 'quicksearch_shows'
 
@@ -0,0 +1,52 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+from sqlalchemy import *
+
+
+def upgrade(migrate_engine):
+    meta = MetaData(bind=migrate_engine)
+    providers = Table('providers', meta, autoload=True)
+
+    provider_episodes = Table('provider_episodes', meta,
+                              Column('provider_row_id', Integer, ForeignKey('providers.id'), primary_key=True),
+                              Column('episode', Integer, primary_key=True),
+                              Column('series_id', Integer),
+                              Column('season', Integer),
+                              Index('idx_series_id_season_episode', 'series_id', 'season', 'episode'))
+    provider_episodes.create(checkfirst=True)
+
+    if migrate_engine.execute(select([func.count()]).select_from(provider_episodes)).scalar():
+        return
+
+    rows = []
+    for row in migrate_engine.execute(select([providers.c.id, providers.c.series_id, providers.c.season, providers.c.episodes])):
+        for episode in set(int(x) for x in filter(None, (row.episodes or '').split('|')) if x.isdigit()):
+            rows.append({'provider_row_id': row.id, 'episode': episode, 'series_id': row.series_id, 'season': row.season})
+
+    if rows:
+        migrate_engine.execute(provider_episodes.insert(), rows)
+
+
+def downgrade(migrate_engine):
+    meta = MetaData(bind=migrate_engine)
+    provider_episodes = Table('provider_episodes', meta, autoload=True)
+    provider_episodes.drop()
@@ -21,6 +21,7 @@ from sqlalchemy import Column, Integer, Text, ForeignKeyConstraint, String, Date
 from sqlalchemy.ext.declarative import as_declarative
 from sqlalchemy.orm import relationship
 
+import sickrage
 from sickrage.core import common
 from sickrage.core.databases import SRDatabase, SRDatabaseBase
 
@@ -30,13 +31,19 @@ class MainDBBase(SRDatabaseBase):
     pass
 
 class MainDB(SRDatabase):
-    def __init__(self, db_type, db_prefix, db_host, db_port, db_username, db_password):
-        super(MainDB, self).__init__('main', 11, db_type, db_prefix, db_host, db_port, db_username, db_password)
+    def __init__(self, db_type, db_prefix, db_host, db_port, db_username, db_password, **kwargs):
+        super(MainDB, self).__init__('main', 11, db_type, db_prefix, db_host, db_port, db_username, db_password, **kwargs)
         MainDBBase.metadata.create_all(self.engine)
         for model in MainDBBase._decl_class_registry.values():
             if hasattr(model, '__tablename__'):
                 self.tables[model.__tablename__] = model
 
+    def flush_updates(self):
+        super(MainDB, self).flush_updates()
+
+        # batched episode saves skip the per row status check, so drop show statistics once written
+        sickrage.app.show_stats_cache.invalidate()
+
     class TVShow(MainDBBase):
         __tablename__ = 'tv_shows'
 
@@ -178,12 +178,12 @@ def make_scene_season_search_string(show_id, season, episode, extraSearchType=No
 
         # compile a list of all the episode numbers we need in this 'season'
         seasonStrings = []
-        for episode in (x for x in show_object.episodes if x.season == episode_object.season):
+        season_episodes = [x for x in show_object.episodes if x.season == episode_object.season]
 
-            # get quality of the episode
-            curCompositeStatus = episode.status
-            curStatus, curQuality = common.Quality.split_composite_status(curCompositeStatus)
+        # get quality of the episodes
+        season_statuses = common.Quality.split_composite_statuses([x.status for x in season_episodes])
 
+        for episode, (curStatus, curQuality) in zip(season_episodes, season_statuses):
             if bestQualities:
                 highestBestQuality = max(bestQualities)
             else:
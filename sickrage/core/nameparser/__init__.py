@@ -20,10 +20,14 @@
 # ##############################################################################
 
 
+import copy
+import itertools
+import multiprocessing
 import os
 import re
 import time
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from threading import Lock
 
 from dateutil import parser
@@ -40,6 +44,208 @@ from sickrage.indexers import IndexerApi
 from sickrage.indexers.exceptions import indexer_episodenotfound, indexer_error
 
 
+_compiled_regexes = {}
+_compiled_regexes_lock = Lock()
+
+# batches smaller than this are parsed in process, worker start up and pickling would cost more than it saves
+PARSE_POOL_MIN_BATCH = 200
+PARSE_POOL_MAX_WORKERS = 4
+# seconds to wait for a batch before giving up on the pool and parsing in process
+PARSE_POOL_TIMEOUT = 60
+_parse_pool = None
+_parse_pool_lock = Lock()
+
+
+def compile_regexes(regexMode):
+    """
+    Compiles the name parser regexes for a regex mode once per process, compiled patterns are shared by all parsers
+    :param regexMode: NameParser.ALL_REGEX, NameParser.NORMAL_REGEX or NameParser.ANIME_REGEX
+    :return: tuple of (pattern number, pattern name, compiled regex)
+    """
+    if regexMode in _compiled_regexes:
+        return _compiled_regexes[regexMode]
+
+    with _compiled_regexes_lock:
+        if regexMode in _compiled_regexes:
+            return _compiled_regexes[regexMode]
+
+        if regexMode == NameParser.ANIME_REGEX:
+            dbg_str = "ANIME"
+            uncompiled_regex = [regexes.anime_regexes]
+        elif regexMode == NameParser.NORMAL_REGEX:
+            dbg_str = "NORMAL"
+            uncompiled_regex = [regexes.normal_regexes]
+        else:
+            dbg_str = "ALL"
+            uncompiled_regex = [regexes.normal_regexes, regexes.anime_regexes]
+
+        compiled_regexes = []
+        for regexItem in uncompiled_regex:
+            for cur_pattern_num, (cur_pattern_name, cur_pattern) in enumerate(regexItem):
+                try:
+                    cur_regex = re.compile(cur_pattern, re.VERBOSE | re.IGNORECASE)
+                except re.error as errormsg:
+                    sickrage.app.log.info(
+                        "WARNING: Invalid episode_pattern using %s regexs, %s. %s" % (
+                            dbg_str, errormsg, cur_pattern))
+                else:
+                    compiled_regexes.append((cur_pattern_num, cur_pattern_name, cur_regex))
+
+        _compiled_regexes[regexMode] = tuple(compiled_regexes)
+
+    return _compiled_regexes[regexMode]
+
+
+def match_name(name, regexMode):
+    """
+    Matches a name against the name parser regexes, this is the pure regex part of parsing and has no
+    dependencies on shows or the database so it can run in a worker process
+    :param name: release or file name
+    :param regexMode: NameParser.ALL_REGEX, NameParser.NORMAL_REGEX or NameParser.ANIME_REGEX
+    :return: ParseResult of the best matching regex or None
+    """
+    matches = []
+
+    for (cur_regex_num, cur_regex_name, cur_regex) in compile_regexes(regexMode):
+        match = cur_regex.match(name)
+
+        if not match:
+            continue
+
+        result = ParseResult(name)
+        result.which_regex = {cur_regex_name}
+        result.score = 0 - cur_regex_num
+
+        named_groups = match.groupdict().keys()
+
+        if 'series_name' in named_groups:
+            result.series_name = match.group('series_name')
+            if result.series_name:
+                result.series_name = NameParser.clean_series_name(result.series_name)
+                result.score += 1
+
+        if 'series_num' in named_groups and match.group('series_num'):
+            result.score += 1
+
+        if 'season_num' in named_groups:
+            tmp_season = int(match.group('season_num'))
+            if cur_regex_name == 'bare' and tmp_season in (19, 20):
+                continue
+            if cur_regex_name == 'fov' and tmp_season > 500:
+                continue
+
+            result.season_number = tmp_season
+            result.score += 1
+
+        if 'ep_num' in named_groups:
+            ep_num = NameParser._convert_number(match.group('ep_num'))
+            if 'extra_ep_num' in named_groups and match.group('extra_ep_num'):
+                tmp_episodes = list(range(ep_num, NameParser._convert_number(match.group('extra_ep_num')) + 1))
+                # if len(tmp_episodes) > 6:
+                #     continue
+            else:
+                tmp_episodes = [ep_num]
+
+            result.episode_numbers = tmp_episodes
+            result.score += 3
+
+        if 'ep_ab_num' in named_groups:
+            ep_ab_num = NameParser._convert_number(match.group('ep_ab_num'))
+            result.score += 1
+
+            if 'extra_ab_ep_num' in named_groups and match.group('extra_ab_ep_num'):
+                result.ab_episode_numbers = list(range(ep_ab_num,
+                                                       NameParser._convert_number(match.group('extra_ab_ep_num')) + 1))
+                result.score += 1
+            else:
+                result.ab_episode_numbers = [ep_ab_num]
+
+        if 'air_date' in named_groups:
+            air_date = match.group('air_date')
+            try:
+                result.air_date = parser.parse(air_date, fuzzy=True).date()
+                result.score += 1
+            except Exception:
+                continue
+
+        if 'extra_info' in named_groups:
+            tmp_extra_info = match.group('extra_info')
+
+            # Show.S04.Special or Show.S05.Part.2.Extras is almost certainly not every episode in the season
+            if tmp_extra_info and cur_regex_name == 'season_only' and re.search(
+                    r'([. _-]|^)(special|extra)s?\w*([. _-]|$)', tmp_extra_info, re.I):
+                continue
+            result.extra_info = tmp_extra_info
+            result.score += 1
+
+        if 'release_group' in named_groups:
+            result.release_group = match.group('release_group')
+            result.score += 1
+
+        if 'version' in named_groups:
+            # assigns version to anime file if detected using anime regex. Non-anime regex receives -1
+            version = match.group('version')
+            if version:
+                result.version = version
+            else:
+                result.version = 1
+        else:
+            result.version = -1
+
+        matches.append(result)
+
+    if len(matches):
+        # pick best match with highest score based on placement
+        return max(sorted(matches, reverse=True, key=lambda x: x.which_regex), key=lambda x: x.score)
+
+
+def _get_parse_pool():
+    global _parse_pool
+
+    with _parse_pool_lock:
+        if not _parse_pool:
+            # never fork the multithreaded app process, a forked worker can inherit locks held by other threads
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _parse_pool = ProcessPoolExecutor(max_workers=_parse_pool_workers(), mp_context=multiprocessing.get_context(start_method))
+
+        return _parse_pool
+
+
+def _parse_pool_workers():
+    return max(1, min(os.cpu_count() or 1, PARSE_POOL_MAX_WORKERS))
+
+
+def shutdown_parse_pool():
+    global _parse_pool
+
+    with _parse_pool_lock:
+        if _parse_pool:
+            _parse_pool.shutdown(wait=False)
+            _parse_pool = None
+
+
+def match_names(names, regexMode):
+    """
+    Matches a batch of names against the name parser regexes, large batches are spread over a process pool
+    :param names: list of release or file names
+    :param regexMode: NameParser.ALL_REGEX, NameParser.NORMAL_REGEX or NameParser.ANIME_REGEX
+    :return: tuple of (dict of name to ParseResult or None, True if the matching ran in the process pool)
+    """
+    names = list(names)
+
+    if len(names) >= PARSE_POOL_MIN_BATCH:
+        try:
+            chunksize = max(1, len(names) // (_parse_pool_workers() * 4))
+            results = _get_parse_pool().map(match_name, names, itertools.repeat(regexMode), chunksize=chunksize,
+                                            timeout=PARSE_POOL_TIMEOUT)
+            return dict(zip(names, results)), True
+        except Exception as e:
+            sickrage.app.log.debug("Unable to parse names using process pool, falling back to parsing in process: {!r}".format(e))
+            shutdown_parse_pool()
+
+    return {name: match_name(name, regexMode) for name in names}, False
+
+
 class NameParser(object):
     ALL_REGEX = 0
     NORMAL_REGEX = 1
@@ -50,13 +256,17 @@ class NameParser(object):
         self.show_obj = find_show(show_id) if show_id else None
         self.naming_pattern = naming_pattern
         self.validate_show = validate_show
+        self._matched = {}
+        self._matched_in_pool = False
 
         if self.show_obj and not self.show_obj.is_anime:
-            self._compile_regexes(self.NORMAL_REGEX)
+            self.regex_mode = self.NORMAL_REGEX
         elif self.show_obj and self.show_obj.is_anime:
-            self._compile_regexes(self.ANIME_REGEX)
+            self.regex_mode = self.ANIME_REGEX
         else:
-            self._compile_regexes(self.ALL_REGEX)
+            self.regex_mode = self.ALL_REGEX
+
+        self._compile_regexes(self.regex_mode)
 
     def get_show(self, name):
         show_id = None
@@ -113,27 +323,7 @@ class NameParser(object):
         return series_name.strip()
 
     def _compile_regexes(self, regexMode):
-        if regexMode == self.ANIME_REGEX:
-            dbg_str = "ANIME"
-            uncompiled_regex = [regexes.anime_regexes]
-        elif regexMode == self.NORMAL_REGEX:
-            dbg_str = "NORMAL"
-            uncompiled_regex = [regexes.normal_regexes]
-        else:
-            dbg_str = "ALL"
-            uncompiled_regex = [regexes.normal_regexes, regexes.anime_regexes]
-
-        self.compiled_regexes = []
-        for regexItem in uncompiled_regex:
-            for cur_pattern_num, (cur_pattern_name, cur_pattern) in enumerate(regexItem):
-                try:
-                    cur_regex = re.compile(cur_pattern, re.VERBOSE | re.IGNORECASE)
-                except re.error as errormsg:
-                    sickrage.app.log.info(
-                        "WARNING: Invalid episode_pattern using %s regexs, %s. %s" % (
-                            dbg_str, errormsg, cur_pattern))
-                else:
-                    self.compiled_regexes.append((cur_pattern_num, cur_pattern_name, cur_regex))
+        self.compiled_regexes = compile_regexes(regexMode)
 
     def _parse_string(self, name, skip_scene_detection=False):
         if not name:
@@ -141,101 +331,15 @@ class NameParser(object):
 
         session = sickrage.app.main_db.session()
 
-        matches = []
-        best_result = None
-
-        for (cur_regex_num, cur_regex_name, cur_regex) in self.compiled_regexes:
-            match = cur_regex.match(name)
-
-            if not match:
-                continue
-
-            result = ParseResult(name)
-            result.which_regex = {cur_regex_name}
-            result.score = 0 - cur_regex_num
-
-            named_groups = match.groupdict().keys()
-
-            if 'series_name' in named_groups:
-                result.series_name = match.group('series_name')
-                if result.series_name:
-                    result.series_name = self.clean_series_name(result.series_name)
-                    result.score += 1
-
-            if 'series_num' in named_groups and match.group('series_num'):
-                result.score += 1
-
-            if 'season_num' in named_groups:
-                tmp_season = int(match.group('season_num'))
-                if cur_regex_name == 'bare' and tmp_season in (19, 20):
-                    continue
-                if cur_regex_name == 'fov' and tmp_season > 500:
-                    continue
-
-                result.season_number = tmp_season
-                result.score += 1
-
-            if 'ep_num' in named_groups:
-                ep_num = self._convert_number(match.group('ep_num'))
-                if 'extra_ep_num' in named_groups and match.group('extra_ep_num'):
-                    tmp_episodes = list(range(ep_num, self._convert_number(match.group('extra_ep_num')) + 1))
-                    # if len(tmp_episodes) > 6:
-                    #     continue
-                else:
-                    tmp_episodes = [ep_num]
-
-                result.episode_numbers = tmp_episodes
-                result.score += 3
-
-            if 'ep_ab_num' in named_groups:
-                ep_ab_num = self._convert_number(match.group('ep_ab_num'))
-                result.score += 1
-
-                if 'extra_ab_ep_num' in named_groups and match.group('extra_ab_ep_num'):
-                    result.ab_episode_numbers = list(range(ep_ab_num,
-                                                           self._convert_number(match.group('extra_ab_ep_num')) + 1))
-                    result.score += 1
-                else:
-                    result.ab_episode_numbers = [ep_ab_num]
-
-            if 'air_date' in named_groups:
-                air_date = match.group('air_date')
-                try:
-                    result.air_date = parser.parse(air_date, fuzzy=True).date()
-                    result.score += 1
-                except Exception:
-                    continue
-
-            if 'extra_info' in named_groups:
-                tmp_extra_info = match.group('extra_info')
-
-                # Show.S04.Special or Show.S05.Part.2.Extras is almost certainly not every episode in the season
-                if tmp_extra_info and cur_regex_name == 'season_only' and re.search(
-                        r'([. _-]|^)(special|extra)s?\w*([. _-]|$)', tmp_extra_info, re.I):
-                    continue
-                result.extra_info = tmp_extra_info
-                result.score += 1
-
-            if 'release_group' in named_groups:
-                result.release_group = match.group('release_group')
-                result.score += 1
-
-            if 'version' in named_groups:
-                # assigns version to anime file if detected using anime regex. Non-anime regex receives -1
-                version = match.group('version')
-                if version:
-                    result.version = version
-                else:
-                    result.version = 1
-            else:
-                result.version = -1
-
-            matches.append(result)
-
-        if len(matches):
-            # pick best match with highest score based on placement
-            best_result = max(sorted(matches, reverse=True, key=lambda x: x.which_regex), key=lambda x: x.score)
+        if name in self._matched:
+            # regex matching already done in bulk by parse_many
+            best_result = copy.deepcopy(self._matched[name])
+            matched_inline = not self._matched_in_pool
+        else:
+            best_result = match_name(name, self.regex_mode)
+            matched_inline = True
 
+        if best_result:
             show_obj = None
             best_result.indexer_id = self.show_obj.indexer_id if self.show_obj else 0
 
@@ -363,8 +467,9 @@ class NameParser(object):
             if show_obj.is_scene and not skip_scene_detection:
                 sickrage.app.log.debug("Scene converted parsed result {} into {}".format(best_result.original_name, best_result))
 
-        # CPU sleep
-        time.sleep(0.02)
+        # CPU sleep, only needed when the regex matching ran in this process
+        if matched_inline:
+            time.sleep(0.02)
 
         return best_result
 
@@ -429,9 +534,11 @@ class NameParser(object):
         if self.naming_pattern:
             cache_result = False
 
-        cached = name_parser_cache.get(name)
-        if cached:
-            return cached
+        cache_key = (name, skip_scene_detection, self.validate_show, self.file_name, self.show_obj.indexer_id if self.show_obj else None)
+        if cache_result:
+            cached = name_parser_cache.get(cache_key)
+            if cached:
+                return cached
 
         # break it into parts if there are any (dirname, file name, extension)
         dir_name, file_name = os.path.split(name)
@@ -491,11 +598,43 @@ class NameParser(object):
             raise InvalidNameException("Unable to parse {} to a valid episode. Parser result: {}".format(name, final_result))
 
         if cache_result and final_result.indexer_id:
-            name_parser_cache.add(name, final_result)
+            name_parser_cache.add(cache_key, final_result)
 
         sickrage.app.log.debug("Parsed {} into {}".format(name, final_result))
         return final_result
 
+    def parse_many(self, names, cache_result=True, skip_scene_detection=False):
+        """
+        Parses a batch of names, the regex matching for large batches is spread over a process pool while show
+        lookups and scene numbering still run in this process
+        :param names: list of release or file names
+        :return: list of ParseResult, or None where a name could not be parsed, in the same order as names
+        """
+        names = [name or '' for name in names]
+
+        strings = set()
+        for name in names:
+            dir_name, file_name = os.path.split(name)
+            strings.add(remove_extension(file_name) if self.file_name else file_name)
+            strings.add(os.path.basename(dir_name))
+        strings.discard('')
+
+        self._matched, self._matched_in_pool = match_names(strings, self.regex_mode)
+
+        results = []
+        try:
+            for name in names:
+                try:
+                    results.append(self.parse(name, cache_result, skip_scene_detection))
+                except (InvalidNameException, InvalidShowException) as e:
+                    sickrage.app.log.debug("{}".format(e))
+                    results.append(None)
+        finally:
+            self._matched = {}
+            self._matched_in_pool = False
+
+        return results
+
 
 class ParseResult(object):
     def __init__(self,
@@ -585,23 +724,69 @@ class ParseResult(object):
 
 
 class NameParserCache(object):
-    def __init__(self):
+    """
+    LRU cache of parse results keyed by release name and the parser options that affect the result
+    """
+
+    def __init__(self, max_size=5000):
         self.lock = Lock()
         self.data = OrderedDict()
-        self.max_size = 200
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def metrics(self):
+        return {
+            'size': len(self.data),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
 
     def get(self, key):
         with self.lock:
             value = self.data.get(key)
-            if value:
-                sickrage.app.log.debug("Using cached parse result for: {}".format(key))
-            return value
+            if not value:
+                self.misses += 1
+                return
+
+            self.hits += 1
+            self.data.move_to_end(key)
+
+        sickrage.app.log.debug("Using cached parse result for: {}".format(key[0]))
+        return value
 
     def add(self, key, value):
         with self.lock:
-            self.data.update({key: value})
-            while len(self.data) > self.max_size:
-                self.data.pop(list(self.data.keys())[0], None)
+            self.data[key] = value
+            self.data.move_to_end(key)
+            self._evict()
+
+    def resize(self, max_size):
+        with self.lock:
+            self.max_size = max(0, max_size)
+            self._evict()
+
+    def invalidate(self, indexer_id=None):
+        """
+        Drops cached parse results, only those of a single show if an indexer id is given
+        :param indexer_id: indexer id of the show, or None to drop everything
+        """
+        with self.lock:
+            if indexer_id is None:
+                self.data.clear()
+                return
+
+            for key in [k for k, v in self.data.items() if indexer_id in (v.indexer_id, k[-1])]:
+                del self.data[key]
+
+    def _evict(self):
+        while len(self.data) > self.max_size:
+            self.data.popitem(last=False)
+            self.evictions += 1
 
 
 name_parser_cache = NameParserCache()
@@ -21,8 +21,8 @@ import ctypes
 import datetime
 import threading
 import traceback
+from collections import Counter
 
-from apscheduler.schedulers.tornado import TornadoScheduler
 from tornado.queues import Queue, PriorityQueue
 
 import sickrage
@@ -44,49 +44,58 @@ class SRQueue(object):
     def __init__(self, name="QUEUE"):
         super(SRQueue, self).__init__()
         self.name = name
-        self.scheduler = TornadoScheduler({'apscheduler.timezone': 'UTC'})
         self.queue = PriorityQueue()
         self._result_queue = Queue()
         self._queue_items = []
         self.processing = []
+        self._membership = Counter()
+        self._membership_keys = {}
+        self._membership_lock = threading.Lock()
         self.min_priority = SRQueuePriorities.EXTREME
         self.amActive = False
+        self.started = False
         self.stop = False
 
     def start(self):
-        self.scheduler.start()
+        self.started = True
+        sickrage.app.io_loop.add_callback(self.dispatch)
 
-    async def run(self):
+    def dispatch(self):
         """
-        Process items in this queue
+        Starts queued items on worker threads until every worker slot is taken, runs on the io loop whenever an
+        item is added, an item finishes or the queue is unpaused
         """
 
+        if not self.started or self.stop or self.is_paused:
+            return
+
         self.amActive = True
 
-        if not self.stop and not self.queue.empty():
-            if not self.is_paused and not len(self.processing) >= int(sickrage.app.config.max_queue_workers):
-                self.scheduler.add_job(self.worker, args=(await self.queue.get(),))
-                # threading.Thread(target=self.worker, args=(self.queue.get(),)).start()
-                # sickrage.app.io_loop.run_in_executor(None, self.worker, self.get())
+        while not self.queue.empty() and len(self.processing) < int(sickrage.app.config.max_queue_workers):
+            item = self.queue.get_nowait()
+            self.processing.append(item)
+
+            worker = threading.Thread(target=self.worker, args=(item,), name=item.name)
+            worker.daemon = True
+            worker.start()
 
         self.amActive = False
 
     def worker(self, item):
-        threading.currentThread().setName(item.name)
         item.thread_id = threading.currentThread().ident
 
         try:
             item.is_alive = True
-            self.processing.append(item)
             item.run()
         except QueueItemStopException:
             pass
         except Exception:
             sickrage.app.log.debug(traceback.format_exc())
         finally:
-            self._queue_items.remove(item)
-            self.processing.remove(item)
+            item.is_alive = False
+            self.remove(item)
             self.queue.task_done()
+            sickrage.app.io_loop.add_callback(self.dispatch)
 
     async def get(self):
         return await self.queue.get()
@@ -105,10 +114,47 @@ class SRQueue(object):
         item.name = "{}-{}".format(self.name, item.name)
         item.result_queue = self._result_queue
         self._queue_items.append(item)
+        self._index_item(item)
         await self.queue.put(item)
 
+        self.dispatch()
+
         return item
 
+    def membership_keys(self, item):
+        """
+        Returns the keys an item is indexed under while it is queued or running, queues override this to make
+        their membership checks constant-time
+
+        :param item: Queue object
+        :return: iterable of hashable keys
+        """
+        return ()
+
+    def _index_item(self, item):
+        keys = tuple(self.membership_keys(item))
+
+        with self._membership_lock:
+            self._membership_keys[id(item)] = keys
+            self._membership.update(keys)
+
+    def _unindex_item(self, item):
+        with self._membership_lock:
+            keys = self._membership_keys.pop(id(item), None)
+            if keys is None:
+                return
+
+            for key in keys:
+                self._membership[key] -= 1
+                if self._membership[key] <= 0:
+                    del self._membership[key]
+
+    def membership_count(self, key):
+        return self._membership[key]
+
+    def is_queued(self, item):
+        return id(item) in self._membership_keys
+
     @property
     def queue_items(self):
         return self._queue_items + self.processing
@@ -130,12 +176,17 @@ class SRQueue(object):
         """Unpauses this queue"""
         sickrage.app.log.info("Un-pausing {}".format(self.name))
         self.min_priority = SRQueuePriorities.EXTREME
+        sickrage.app.io_loop.add_callback(self.dispatch)
 
     def remove(self, item):
-        if item in self._queue_items:
-            self._queue_items.remove(item)
-        if item in self.processing:
-            self.processing.remove(item)
+        self._unindex_item(item)
+
+        # queue items compare equal by priority, so match on identity
+        for items in (self._queue_items, self.processing):
+            for i, cur_item in enumerate(items):
+                if cur_item is item:
+                    del items[i]
+                    break
 
     def stop_item(self, item):
         if not item.is_alive:
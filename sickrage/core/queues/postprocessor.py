@@ -25,8 +25,6 @@ import threading
 import traceback
 from time import sleep
 
-from apscheduler.triggers.interval import IntervalTrigger
-
 import sickrage
 from sickrage.core.common import cpu_presets
 from sickrage.core.process_tv import ProcessResult
@@ -51,16 +49,6 @@ class PostProcessorQueue(SRQueue):
         SRQueue.__init__(self, "POSTPROCESSORQUEUE")
         self._output = []
 
-        self.scheduler.add_job(
-            self.run,
-            IntervalTrigger(
-                seconds=1,
-                timezone='utc'
-            ),
-            name=self.name,
-            id=self.name
-        )
-
     @property
     def output(self):
         return '\n'.join(self._output)
@@ -20,9 +20,9 @@
 # ##############################################################################
 
 
+import threading
 import traceback
-
-from apscheduler.triggers.interval import IntervalTrigger
+from collections import OrderedDict
 
 import sickrage
 from sickrage.core.queues import SRQueue, SRQueueItem, SRQueuePriorities
@@ -36,46 +36,92 @@ FAILED_SEARCH = 30
 MANUAL_SEARCH = 40
 
 
+class SearchHistory(object):
+    """
+    Bounded history keyed by (show id, season, episode), re-adding an episode replaces its entry and the oldest
+    entries are dropped once max_size is reached
+    """
+
+    def __init__(self, max_size=100):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._shows = {}
+        self._lock = threading.Lock()
+
+    def add(self, key, value=None):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = value
+            self._shows.setdefault(key[0], OrderedDict())[key] = None
+
+            while len(self._entries) > self.max_size:
+                old_key, __ = self._entries.popitem(last=False)
+                self._discard_show_key(old_key)
+
+    def remove(self, key):
+        with self._lock:
+            if key in self._entries:
+                del self._entries[key]
+                self._discard_show_key(key)
+
+    def get(self, key, default=None):
+        return self._entries.get(key, default)
+
+    def get_show(self, show_id):
+        with self._lock:
+            return [self._entries[key] for key in self._shows.get(show_id, ())]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._shows.clear()
+
+    def _discard_show_key(self, key):
+        show_keys = self._shows.get(key[0])
+        if show_keys is not None:
+            show_keys.pop(key, None)
+            if not show_keys:
+                del self._shows[key[0]]
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._entries))
+
+
 class SearchQueue(SRQueue):
     def __init__(self):
         SRQueue.__init__(self, "SEARCHQUEUE")
-        self.SNATCH_HISTORY = []
         self.SNATCH_HISTORY_SIZE = 100
-        self.MANUAL_SEARCH_HISTORY = []
+        self.SNATCH_HISTORY = SearchHistory(self.SNATCH_HISTORY_SIZE)
         self.MANUAL_SEARCH_HISTORY_SIZE = 100
+        self.MANUAL_SEARCH_HISTORY = SearchHistory(self.MANUAL_SEARCH_HISTORY_SIZE)
+
+    def membership_keys(self, item):
+        keys = [('type', type(item))]
 
-        self.scheduler.add_job(
-            self.run,
-            IntervalTrigger(
-                seconds=1,
-                timezone='utc'
-            ),
-            name=self.name,
-            id=self.name
-        )
-
-    def fifo(self, my_list, item, max_size=100):
-        if len(my_list) >= max_size:
-            my_list.pop(0)
-        my_list.append(item)
+        if isinstance(item, BacklogQueueItem):
+            keys.append(('backlog', item.show_id, item.season, item.episode))
+        elif isinstance(item, (ManualSearchQueueItem, FailedQueueItem)):
+            keys.append(('manual', item.season, item.episode))
+            keys.append(('manual_show', item.show_id))
+
+        return keys
 
     def is_in_queue(self, show_id, season, episode):
-        for cur_item in self.queue_items:
-            if isinstance(cur_item, BacklogQueueItem) and all([cur_item.show_id == show_id, cur_item.season == season, cur_item.episode == episode]):
-                return True
-        return False
+        return self.membership_count(('backlog', show_id, season, episode)) > 0
 
     def is_ep_in_queue(self, season, episode):
-        for cur_item in self.queue_items:
-            if isinstance(cur_item, (ManualSearchQueueItem, FailedQueueItem)) and all([cur_item.season == season, cur_item.episode == episode]):
-                return True
-        return False
+        return self.membership_count(('manual', season, episode)) > 0
 
     def is_show_in_queue(self, show_id):
-        for cur_item in self.queue_items:
-            if isinstance(cur_item, (ManualSearchQueueItem, FailedQueueItem)) and cur_item.show_id == show_id:
-                return True
-        return False
+        return self.membership_count(('manual_show', show_id)) > 0
 
     def get_all_items_from_queue(self, show_id):
         items = []
@@ -108,37 +154,19 @@ class SearchQueue(SRQueue):
         return not sickrage.app.scheduler.get_job(sickrage.app.backlog_searcher.name).next_run_time
 
     def is_manual_search_in_progress(self):
-        for cur_item in self.queue_items:
-            if isinstance(cur_item, (ManualSearchQueueItem, FailedQueueItem)):
-                return True
-        return False
+        return any(self.membership_count(('type', x)) for x in (ManualSearchQueueItem, FailedQueueItem))
 
     def is_backlog_in_progress(self):
-        for cur_item in self.queue_items:
-            if isinstance(cur_item, BacklogQueueItem):
-                return True
-        return False
+        return self.membership_count(('type', BacklogQueueItem)) > 0
 
     def is_dailysearch_in_progress(self):
-        for cur_item in self.queue_items:
-            if isinstance(cur_item, DailySearchQueueItem):
-                return True
-
-        return False
+        return self.membership_count(('type', DailySearchQueueItem)) > 0
 
     def queue_length(self):
-        length = {'backlog': 0, 'daily': 0, 'manual': 0, 'failed': 0}
-        for cur_item in self.queue_items:
-            if isinstance(cur_item, DailySearchQueueItem):
-                length['daily'] += 1
-            elif isinstance(cur_item, BacklogQueueItem):
-                length['backlog'] += 1
-            elif isinstance(cur_item, ManualSearchQueueItem):
-                length['manual'] += 1
-            elif isinstance(cur_item, FailedQueueItem):
-                length['failed'] += 1
-
-        return length
+        return {'backlog': self.membership_count(('type', BacklogQueueItem)),
+                'daily': self.membership_count(('type', DailySearchQueueItem)),
+                'manual': self.membership_count(('type', ManualSearchQueueItem)),
+                'failed': self.membership_count(('type', FailedQueueItem))}
 
     def put(self, item, *args, **kwargs):
         if all([not sickrage.app.config.use_nzbs, not sickrage.app.config.use_torrents]):
@@ -185,9 +213,7 @@ class DailySearchQueueItem(SRQueueItem):
                               not in sickrage.app.search_queue.SNATCH_HISTORY for episode in search_result.episodes])
 
                 if snatch:
-                    [sickrage.app.search_queue.fifo(sickrage.app.search_queue.SNATCH_HISTORY,
-                                                    (search_result.show_id, search_result.season, episode),
-                                                    sickrage.app.search_queue.SNATCH_HISTORY_SIZE) for episode in search_result.episodes]
+                    [sickrage.app.search_queue.SNATCH_HISTORY.add((search_result.show_id, search_result.season, episode)) for episode in search_result.episodes]
 
                     sickrage.app.log.info("Downloading " + search_result.name + " from " + search_result.provider.name)
                     snatch_episode(search_result)
@@ -222,9 +248,7 @@ class ManualSearchQueueItem(SRQueueItem):
 
             search_result = search_providers(self.show_id, self.season, self.episode, manualSearch=True, downCurQuality=self.downCurQuality)
             if search_result:
-                [sickrage.app.search_queue.fifo(sickrage.app.search_queue.SNATCH_HISTORY,
-                                                (search_result.show_id, search_result.season, episode),
-                                                sickrage.app.search_queue.SNATCH_HISTORY_SIZE) for episode in search_result.episodes]
+                [sickrage.app.search_queue.SNATCH_HISTORY.add((search_result.show_id, search_result.season, episode)) for episode in search_result.episodes]
 
                 sickrage.app.log.info("Downloading " + search_result.name + " from " + search_result.provider.name)
                 self.success = snatch_episode(search_result)
@@ -239,7 +263,7 @@ class ManualSearchQueueItem(SRQueueItem):
             sickrage.app.log.debug(traceback.format_exc())
         finally:
             sickrage.app.log.info("Finished manual search for: [" + episode_object.pretty_name() + "]")
-            sickrage.app.search_queue.fifo(sickrage.app.search_queue.MANUAL_SEARCH_HISTORY, self, sickrage.app.search_queue.MANUAL_SEARCH_HISTORY_SIZE)
+            sickrage.app.search_queue.MANUAL_SEARCH_HISTORY.add((self.show_id, self.season, self.episode), self)
 
 
 class BacklogQueueItem(SRQueueItem):
@@ -267,9 +291,7 @@ class BacklogQueueItem(SRQueueItem):
                               not in sickrage.app.search_queue.SNATCH_HISTORY for episode in search_result.episodes])
 
                 if snatch:
-                    [sickrage.app.search_queue.fifo(sickrage.app.search_queue.SNATCH_HISTORY,
-                                                    (search_result.show_id, search_result.season, episode),
-                                                    sickrage.app.search_queue.SNATCH_HISTORY_SIZE) for episode in search_result.episodes]
+                    [sickrage.app.search_queue.SNATCH_HISTORY.add((search_result.show_id, search_result.season, episode)) for episode in search_result.episodes]
 
                     sickrage.app.log.info("Downloading " + search_result.name + " from " + search_result.provider.name)
                     snatch_episode(search_result)
@@ -319,9 +341,7 @@ class FailedQueueItem(SRQueueItem):
                               not in sickrage.app.search_queue.SNATCH_HISTORY for episode in search_result.episodes])
 
                 if snatch:
-                    [sickrage.app.search_queue.fifo(sickrage.app.search_queue.SNATCH_HISTORY,
-                                                    (search_result.show_id, search_result.season, episode),
-                                                    sickrage.app.search_queue.SNATCH_HISTORY_SIZE) for episode in search_result.episodes]
+                    [sickrage.app.search_queue.SNATCH_HISTORY.add((search_result.show_id, search_result.season, episode)) for episode in search_result.episodes]
 
                     sickrage.app.log.info("Downloading " + search_result.name + " from " + search_result.provider.name)
                     snatch_episode(search_result)
@@ -329,4 +349,4 @@ class FailedQueueItem(SRQueueItem):
             sickrage.app.log.debug(traceback.format_exc())
         finally:
             sickrage.app.log.info("Finished failed download search for: [" + show_object.name + "]")
-            sickrage.app.search_queue.fifo(sickrage.app.search_queue.MANUAL_SEARCH_HISTORY, self, sickrage.app.search_queue.MANUAL_SEARCH_HISTORY_SIZE)
+            sickrage.app.search_queue.MANUAL_SEARCH_HISTORY.add((self.show_id, self.season, self.episode), self)
@@ -25,8 +25,6 @@ import os
 import time
 import traceback
 
-from apscheduler.triggers.interval import IntervalTrigger
-
 import sickrage
 from sickrage.core.common import WANTED
 from sickrage.core.exceptions import CantRefreshShowException, CantRemoveShowException, CantUpdateShowException, EpisodeDeletedException, \
@@ -44,25 +42,18 @@ class ShowQueue(SRQueue):
     def __init__(self):
         SRQueue.__init__(self, "SHOWQUEUE")
 
-        self.scheduler.add_job(
-            self.run,
-            IntervalTrigger(
-                seconds=1,
-                timezone='utc'
-            ),
-            name=self.name,
-            id=self.name
-        )
-
     @property
     def loading_show_list(self):
         return [x.indexer_id for x in self.queue_items if x.is_loading]
 
+    def membership_keys(self, item):
+        return [('show', item.indexer_id), ('action', item.indexer_id, item.action_id)]
+
     def _is_in_queue(self, indexer_id):
-        return indexer_id in [x.indexer_id for x in self.queue_items]
+        return self.membership_count(('show', indexer_id)) > 0
 
     def _is_being(self, indexer_id, actions):
-        return indexer_id in [x.indexer_id for x in self.queue_items if x.action_id in actions]
+        return any(self.membership_count(('action', indexer_id, action)) for action in actions)
 
     def is_being_removed(self, indexer_id):
         return self._is_being(indexer_id, [ShowQueueActions.REMOVE])
@@ -195,7 +186,7 @@ class ShowQueueItem(SRQueueItem):
         self.indexer_id = indexer_id
 
     def is_in_queue(self):
-        return self in sickrage.app.show_queue.queue_items
+        return sickrage.app.show_queue.is_queued(self)
 
     @property
     def show_name(self):
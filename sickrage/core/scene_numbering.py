@@ -528,23 +528,24 @@ def xem_refresh(indexer_id, indexer, force=False):
                 return
 
             tv_show = find_show(indexer_id)
-            for entry in parsed_json['data']:
-                try:
-                    tv_episode = tv_show.get_episode(season=entry[IndexerApi(indexer).config['xem_origin']]['season'],
-                                                     episode=entry[IndexerApi(indexer).config['xem_origin']]['episode'])
-                except SiCKRAGETVEpisodeException:
-                    continue
-
-                if 'scene' in entry:
-                    tv_episode.scene_season = entry['scene']['season']
-                    tv_episode.scene_episode = entry['scene']['episode']
-                    tv_episode.scene_absolute_number = entry['scene']['absolute']
-                if 'scene_2' in entry:  # for doubles
-                    tv_episode.scene_season = entry['scene_2']['season']
-                    tv_episode.scene_episode = entry['scene_2']['episode']
-                    tv_episode.scene_absolute_number = entry['scene_2']['absolute']
-
-                tv_episode.save()
+            with sickrage.app.main_db.batch():
+                for entry in parsed_json['data']:
+                    try:
+                        tv_episode = tv_show.get_episode(season=entry[IndexerApi(indexer).config['xem_origin']]['season'],
+                                                         episode=entry[IndexerApi(indexer).config['xem_origin']]['episode'])
+                    except SiCKRAGETVEpisodeException:
+                        continue
+
+                    if 'scene' in entry:
+                        tv_episode.scene_season = entry['scene']['season']
+                        tv_episode.scene_episode = entry['scene']['episode']
+                        tv_episode.scene_absolute_number = entry['scene']['absolute']
+                    if 'scene_2' in entry:  # for doubles
+                        tv_episode.scene_season = entry['scene_2']['season']
+                        tv_episode.scene_episode = entry['scene_2']['episode']
+                        tv_episode.scene_absolute_number = entry['scene_2']['absolute']
+
+                    tv_episode.save()
         except Exception as e:
             sickrage.app.log.debug("Exception while refreshing XEM data for show {} on {}: {}".format(indexer_id, IndexerApi(indexer).name, e))
             sickrage.app.log.debug(traceback.format_exc())
@@ -16,9 +16,12 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+import functools
 import itertools
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import date, timedelta
 
 import sickrage
@@ -34,7 +37,7 @@ from sickrage.core.common import (
     MULTI_EP_RESULT
 )
 from sickrage.core.exceptions import AuthException
-from sickrage.core.helpers import show_names
+from sickrage.core.helpers import show_names, try_int
 from sickrage.core.nzbSplitter import split_nzb_result
 from sickrage.core.tv.show.helpers import find_show
 from sickrage.core.tv.show.history import (
@@ -307,6 +310,93 @@ def is_first_best_match(result):
     return False
 
 
+def provider_fan_out(providers, func, thread_name=None):
+    """
+    Runs func against each provider on a bounded thread pool
+
+    :param providers: providers to run against, in priority order
+    :param func: callable taking a provider object
+    :param thread_name: name prefix for the worker threads
+    :return: generator of (provider, result) tuples in provider order
+    """
+
+    thread_name = thread_name or threading.currentThread().getName()
+
+    def run(provider):
+        threading.currentThread().setName(thread_name + "::[" + provider.name + "]")
+        try:
+            return func(provider)
+        finally:
+            threading.currentThread().setName(thread_name)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, try_int(sickrage.app.config.max_provider_threads, 1)))
+
+    futures = []
+    try:
+        futures = [(provider, executor.submit(run, provider)) for provider in providers]
+        for provider, future in futures:
+            yield provider, future.result()
+    finally:
+        # stop providers that have not started yet when the caller is done early
+        for __, future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _search_provider(providerObj, show_object, season, episode, manualSearch=False, downCurQuality=False, cacheOnly=False):
+    found_results = {}
+
+    search_count = 0
+    search_mode = providerObj.search_mode
+
+    # Always search for episode when manually searching when in sponly
+    if search_mode == 'sponly' and manualSearch is True:
+        search_mode = 'eponly'
+
+    while True:
+        search_count += 1
+
+        try:
+            if episode and search_mode == 'eponly':
+                sickrage.app.log.info("Performing episode search for " + show_object.name)
+            else:
+                sickrage.app.log.info("Performing season pack search for " + show_object.name)
+
+            # search provider for episodes
+            found_results = providerObj.find_search_results(show_object.indexer_id,
+                                                            season,
+                                                            episode,
+                                                            search_mode,
+                                                            manualSearch,
+                                                            downCurQuality,
+                                                            cacheOnly)
+        except AuthException as e:
+            sickrage.app.log.warning("Authentication error: {}".format(e))
+            break
+        except Exception as e:
+            sickrage.app.log.error("Error while searching " + providerObj.name + ", skipping: {}".format(e))
+            break
+
+        if len(found_results):
+            # make a list of all the results for this provider
+            for search_result in found_results:
+                # Sort results by seeders if available
+                if providerObj.type == 'torrent' or getattr(providerObj, 'torznab', False):
+                    found_results[search_result].sort(key=lambda k: int(k.seeders), reverse=True)
+            break
+        elif not providerObj.search_fallback or search_count == 2:
+            break
+
+        if search_mode == 'sponly':
+            sickrage.app.log.debug("Fallback episode search initiated")
+            search_mode = 'eponly'
+        else:
+            sickrage.app.log.debug("Fallback season pack search initiate")
+            search_mode = 'sponly'
+
+    return found_results
+
+
 def search_providers(show_id, season, episode, manualSearch=False, downCurQuality=False, cacheOnly=False):
     """
     Walk providers for information on shows
@@ -318,12 +408,11 @@ def search_providers(show_id, season, episode, manualSearch=False, downCurQualit
     :return: results for search
     """
 
-    orig_thread_name = threading.currentThread().getName()
-
     show_object = find_show(show_id)
 
     final_results = []
 
+    providers = []
     for providerID, providerObj in sickrage.app.search_providers.sort(randomize=sickrage.app.config.randomize_providers).items():
         # check if provider is enabled
         if not providerObj.is_enabled:
@@ -339,229 +428,183 @@ def search_providers(show_id, season, episode, manualSearch=False, downCurQualit
             sickrage.app.log.debug("" + str(show_object.name) + " is not an anime, skiping")
             continue
 
-        found_results = {}
+        providers.append(providerObj)
 
-        search_count = 0
-        search_mode = providerObj.search_mode
+    # providers are searched concurrently, results are still processed in provider priority order
+    search_func = functools.partial(_search_provider, show_object=show_object, season=season, episode=episode, manualSearch=manualSearch,
+                                    downCurQuality=downCurQuality, cacheOnly=cacheOnly)
 
-        # Always search for episode when manually searching when in sponly
-        if search_mode == 'sponly' and manualSearch is True:
-            search_mode = 'eponly'
-
-        while True:
-            search_count += 1
+    with closing(provider_fan_out(providers, search_func)) as provider_results:
+        for providerObj, found_results in provider_results:
+            # skip to next provider if we have no results to process
+            if not len(found_results):
+                continue
 
-            try:
-                threading.currentThread().setName(orig_thread_name + "::[" + providerObj.name + "]")
+            # remove duplicates
+            for cur_episode in found_results:
+                found_results[cur_episode] = [next(obj) for i, obj in itertools.groupby(sorted(found_results[cur_episode], key=lambda x: x.url), lambda x: x.url)]
 
-                if episode and search_mode == 'eponly':
-                    sickrage.app.log.info("Performing episode search for " + show_object.name)
-                else:
-                    sickrage.app.log.info("Performing season pack search for " + show_object.name)
-
-                # search provider for episodes
-                found_results = providerObj.find_search_results(show_id,
-                                                                season,
-                                                                episode,
-                                                                search_mode,
-                                                                manualSearch,
-                                                                downCurQuality,
-                                                                cacheOnly)
-            except AuthException as e:
-                sickrage.app.log.warning("Authentication error: {}".format(e))
-                break
-            except Exception as e:
-                sickrage.app.log.error("Error while searching " + providerObj.name + ", skipping: {}".format(e))
-                break
-            finally:
-                threading.currentThread().setName(orig_thread_name)
-
-            if len(found_results):
-                # make a list of all the results for this provider
-                for search_result in found_results:
-                    # Sort results by seeders if available
-                    if providerObj.type == 'torrent' or getattr(providerObj, 'torznab', False):
-                        found_results[search_result].sort(key=lambda k: int(k.seeders), reverse=True)
-                break
-            elif not providerObj.search_fallback or search_count == 2:
-                break
-
-            if search_mode == 'sponly':
-                sickrage.app.log.debug("Fallback episode search initiated")
-                search_mode = 'eponly'
-            else:
-                sickrage.app.log.debug("Fallback season pack search initiate")
-                search_mode = 'sponly'
+            # pick the best season NZB
+            best_season_result = None
+            if SEASON_RESULT in found_results:
+                best_season_result = pick_best_result(found_results[SEASON_RESULT], season_pack=True)
 
-        # skip to next provider if we have no results to process
-        if not len(found_results):
-            continue
+            highest_quality_overall = 0
+            for cur_episode in found_results:
+                for cur_result in found_results[cur_episode]:
+                    if cur_result.quality != Quality.UNKNOWN and cur_result.quality > highest_quality_overall:
+                        highest_quality_overall = cur_result.quality
 
-        # remove duplicates
-        for cur_episode in found_results:
-            found_results[cur_episode] = [next(obj) for i, obj in itertools.groupby(sorted(found_results[cur_episode], key=lambda x: x.url), lambda x: x.url)]
+            sickrage.app.log.debug("The highest quality of any match is " + Quality.qualityStrings[highest_quality_overall])
 
-        # pick the best season NZB
-        best_season_result = None
-        if SEASON_RESULT in found_results:
-            best_season_result = pick_best_result(found_results[SEASON_RESULT], season_pack=True)
+            # see if every episode is wanted
+            if best_season_result:
+                # get the quality of the season nzb
+                season_qual = best_season_result.quality
+                sickrage.app.log.debug("The quality of the season " + best_season_result.provider.type + " is " + Quality.qualityStrings[season_qual])
 
-        highest_quality_overall = 0
-        for cur_episode in found_results:
-            for cur_result in found_results[cur_episode]:
-                if cur_result.quality != Quality.UNKNOWN and cur_result.quality > highest_quality_overall:
-                    highest_quality_overall = cur_result.quality
+                all_episodes = set([x.episode for x in show_object.episodes if x.season == best_season_result.season])
 
-        sickrage.app.log.debug("The highest quality of any match is " + Quality.qualityStrings[highest_quality_overall])
+                sickrage.app.log.debug("Episodes list: {}".format(','.join(map(str, all_episodes))))
 
-        # see if every episode is wanted
-        if best_season_result:
-            # get the quality of the season nzb
-            season_qual = best_season_result.quality
-            sickrage.app.log.debug("The quality of the season " + best_season_result.provider.type + " is " + Quality.qualityStrings[season_qual])
+                all_wanted = True
+                any_wanted = False
 
-            all_episodes = set([x.episode for x in show_object.episodes if x.season == best_season_result.season])
+                for curEp in all_episodes:
+                    if not show_object.want_episode(season, curEp, season_qual, downCurQuality):
+                        all_wanted = False
+                    else:
+                        any_wanted = True
 
-            sickrage.app.log.debug("Episodes list: {}".format(','.join(map(str, all_episodes))))
+                # if we need every ep in the season and there's nothing better then just download this and be done
+                # with it (unless single episodes are preferred)
+                if all_wanted and best_season_result.quality == highest_quality_overall:
+                    sickrage.app.log.info("Every ep in this season is needed, "
+                                          "downloading the whole " + best_season_result.provider.type + " " + best_season_result.name)
 
-            all_wanted = True
-            any_wanted = False
+                    best_season_result.episodes = all_episodes
 
-            for curEp in all_episodes:
-                if not show_object.want_episode(season, curEp, season_qual, downCurQuality):
-                    all_wanted = False
+                    return best_season_result
+                elif not any_wanted:
+                    sickrage.app.log.debug("No eps from this season are wanted at this quality, ignoring the result of {}".format(best_season_result.name))
                 else:
-                    any_wanted = True
-
-            # if we need every ep in the season and there's nothing better then just download this and be done
-            # with it (unless single episodes are preferred)
-            if all_wanted and best_season_result.quality == highest_quality_overall:
-                sickrage.app.log.info("Every ep in this season is needed, "
-                                      "downloading the whole " + best_season_result.provider.type + " " + best_season_result.name)
+                    if best_season_result.provider.type == NZBProvider.type:
+                        sickrage.app.log.debug("Breaking apart the NZB and adding the individual ones to our results")
+
+                        # if not, break it apart and add them as the lowest priority results
+                        individual_results = split_nzb_result(best_season_result)
+                        for curResult in individual_results:
+                            ep_num = -1
+                            if len(curResult.episodes) == 1:
+                                ep_num = curResult.episodes[0]
+                            elif len(curResult.episodes) > 1:
+                                ep_num = MULTI_EP_RESULT
+
+                            if ep_num in found_results:
+                                found_results[ep_num].append(curResult)
+                            else:
+                                found_results[ep_num] = [curResult]
+
+                    # If this is a torrent all we can do is leech the entire torrent, user will have to select which
+                    # eps not do download in his torrent client
+                    else:
+                        # Season result from Torrent Provider must be a full-season torrent, creating multi-ep result
+                        # for it.
+                        sickrage.app.log.info("Adding multi-ep result for full-season torrent. Set the episodes you "
+                                              "don't want to 'don't download' in your torrent client if desired!")
 
-                best_season_result.episodes = all_episodes
+                        best_season_result.episodes = all_episodes
 
-                return best_season_result
-            elif not any_wanted:
-                sickrage.app.log.debug("No eps from this season are wanted at this quality, ignoring the result of {}".format(best_season_result.name))
-            else:
-                if best_season_result.provider.type == NZBProvider.type:
-                    sickrage.app.log.debug("Breaking apart the NZB and adding the individual ones to our results")
-
-                    # if not, break it apart and add them as the lowest priority results
-                    individual_results = split_nzb_result(best_season_result)
-                    for curResult in individual_results:
-                        ep_num = -1
-                        if len(curResult.episodes) == 1:
-                            ep_num = curResult.episodes[0]
-                        elif len(curResult.episodes) > 1:
-                            ep_num = MULTI_EP_RESULT
-
-                        if ep_num in found_results:
-                            found_results[ep_num].append(curResult)
+                        if MULTI_EP_RESULT in found_results:
+                            found_results[MULTI_EP_RESULT].append(best_season_result)
                         else:
-                            found_results[ep_num] = [curResult]
-
-                # If this is a torrent all we can do is leech the entire torrent, user will have to select which
-                # eps not do download in his torrent client
-                else:
-                    # Season result from Torrent Provider must be a full-season torrent, creating multi-ep result
-                    # for it.
-                    sickrage.app.log.info("Adding multi-ep result for full-season torrent. Set the episodes you "
-                                          "don't want to 'don't download' in your torrent client if desired!")
-
-                    best_season_result.episodes = all_episodes
-
-                    if MULTI_EP_RESULT in found_results:
-                        found_results[MULTI_EP_RESULT].append(best_season_result)
-                    else:
-                        found_results[MULTI_EP_RESULT] = [best_season_result]
-
-        # go through multi-ep results and see if we really want them or not, get rid of the rest
-        multi_results = {}
-        if MULTI_EP_RESULT in found_results:
-            for _multiResult in found_results[MULTI_EP_RESULT]:
-                sickrage.app.log.debug(
-                    "Seeing if we want to bother with multi-episode result " + _multiResult.name)
-
-                # Filter result by ignore/required/whitelist/blacklist/quality, etc
-                multi_result = pick_best_result(_multiResult)
-                if not multi_result:
+                            found_results[MULTI_EP_RESULT] = [best_season_result]
+
+            # go through multi-ep results and see if we really want them or not, get rid of the rest
+            multi_results = {}
+            if MULTI_EP_RESULT in found_results:
+                for _multiResult in found_results[MULTI_EP_RESULT]:
+                    sickrage.app.log.debug(
+                        "Seeing if we want to bother with multi-episode result " + _multiResult.name)
+
+                    # Filter result by ignore/required/whitelist/blacklist/quality, etc
+                    multi_result = pick_best_result(_multiResult)
+                    if not multi_result:
+                        continue
+
+                    # see how many of the eps that this result covers aren't covered by single results
+                    needed_eps = []
+                    not_needed_eps = []
+                    for multi_result_episode in multi_result.episodes:
+                        # if we have results for the episode
+                        if multi_result_episode in found_results and len(found_results[multi_result_episode]) > 0:
+                            not_needed_eps.append(multi_result_episode)
+                        else:
+                            needed_eps.append(multi_result_episode)
+
+                    sickrage.app.log.debug("Single-ep check result is neededEps: " + str(needed_eps) + ", notNeededEps: " + str(not_needed_eps))
+                    if not needed_eps:
+                        sickrage.app.log.debug("All of these episodes were covered by single episode results, ignoring this multi-episode result")
+                        continue
+
+                    # check if these eps are already covered by another multi-result
+                    multi_needed_eps = []
+                    multi_not_needed_eps = []
+                    for multi_result_episode in multi_result.episodes:
+                        if multi_result_episode in multi_results:
+                            multi_not_needed_eps.append(multi_result_episode)
+                        else:
+                            multi_needed_eps.append(multi_result_episode)
+
+                    sickrage.app.log.debug(
+                        "Multi-ep check result is multiNeededEps: " + str(
+                            multi_needed_eps) + ", multiNotNeededEps: " + str(
+                            multi_not_needed_eps)
+                    )
+
+                    if not multi_needed_eps:
+                        sickrage.app.log.debug("All of these episodes were covered by another multi-episode nzbs, ignoring this multi-ep result")
+                        continue
+
+                    # don't bother with the single result if we're going to get it with a multi result
+                    for multi_result_episode in multi_result.episodes:
+                        multi_results[multi_result_episode] = multi_result
+
+                        if multi_result_episode in found_results:
+                            sickrage.app.log.debug("A needed multi-episode result overlaps with a single-episode result for ep #" + str(
+                                multi_result_episode) + ", removing the single-episode results from the list")
+                            del found_results[multi_result_episode]
+
+            # of all the single ep results narrow it down to the best one
+            final_results += list(set(multi_results.values()))
+            for curEp, curResults in found_results.items():
+                if curEp in (MULTI_EP_RESULT, SEASON_RESULT):
                     continue
 
-                # see how many of the eps that this result covers aren't covered by single results
-                needed_eps = []
-                not_needed_eps = []
-                for multi_result_episode in multi_result.episodes:
-                    # if we have results for the episode
-                    if multi_result_episode in found_results and len(found_results[multi_result_episode]) > 0:
-                        not_needed_eps.append(multi_result_episode)
-                    else:
-                        needed_eps.append(multi_result_episode)
-
-                sickrage.app.log.debug("Single-ep check result is neededEps: " + str(needed_eps) + ", notNeededEps: " + str(not_needed_eps))
-                if not needed_eps:
-                    sickrage.app.log.debug("All of these episodes were covered by single episode results, ignoring this multi-episode result")
+                if not len(curResults) > 0:
                     continue
 
-                # check if these eps are already covered by another multi-result
-                multi_needed_eps = []
-                multi_not_needed_eps = []
-                for multi_result_episode in multi_result.episodes:
-                    if multi_result_episode in multi_results:
-                        multi_not_needed_eps.append(multi_result_episode)
-                    else:
-                        multi_needed_eps.append(multi_result_episode)
-
-                sickrage.app.log.debug(
-                    "Multi-ep check result is multiNeededEps: " + str(
-                        multi_needed_eps) + ", multiNotNeededEps: " + str(
-                        multi_not_needed_eps)
-                )
-
-                if not multi_needed_eps:
-                    sickrage.app.log.debug("All of these episodes were covered by another multi-episode nzbs, ignoring this multi-ep result")
+                # if all results were rejected move on to the next episode
+                best_result = pick_best_result(curResults)
+                if not best_result:
                     continue
 
-                # don't bother with the single result if we're going to get it with a multi result
-                for multi_result_episode in multi_result.episodes:
-                    multi_results[multi_result_episode] = multi_result
-
-                    if multi_result_episode in found_results:
-                        sickrage.app.log.debug("A needed multi-episode result overlaps with a single-episode result for ep #" + str(
-                            multi_result_episode) + ", removing the single-episode results from the list")
-                        del found_results[multi_result_episode]
-
-        # of all the single ep results narrow it down to the best one
-        final_results += list(set(multi_results.values()))
-        for curEp, curResults in found_results.items():
-            if curEp in (MULTI_EP_RESULT, SEASON_RESULT):
-                continue
-
-            if not len(curResults) > 0:
-                continue
-
-            # if all results were rejected move on to the next episode
-            best_result = pick_best_result(curResults)
-            if not best_result:
-                continue
-
-            # add result
-            final_results.append(best_result)
+                # add result
+                final_results.append(best_result)
 
-        # narrow results by comparing quality
-        if len(final_results) > 1:
-            final_results = list(set([a for a, b in itertools.product(final_results, repeat=len(final_results)) if a.quality >= b.quality]))
+            # narrow results by comparing quality
+            if len(final_results) > 1:
+                final_results = list(set([a for a, b in itertools.product(final_results, repeat=len(final_results)) if a.quality >= b.quality]))
 
-        # narrow results by comparing seeders for torrent results
-        if len(final_results) > 1:
-            final_results = list(set(
-                [a for a, b in itertools.product(final_results, repeat=len(final_results)) if a.provider.type == NZBProvider.type or a.seeders > b.seeders]))
+            # narrow results by comparing seeders for torrent results
+            if len(final_results) > 1:
+                final_results = list(set(
+                    [a for a, b in itertools.product(final_results, repeat=len(final_results)) if a.provider.type == NZBProvider.type or a.seeders > b.seeders]))
 
-        # check that we got all the episodes we wanted first before doing a match and snatch
-        for result in final_results.copy():
-            if all([episode in result.episodes and is_final_result(result)]):
-                return result
+            # check that we got all the episodes we wanted first before doing a match and snatch
+            for result in final_results.copy():
+                if all([episode in result.episodes and is_final_result(result)]):
+                    return result
 
     if len(final_results) == 1:
         return next(iter(final_results))
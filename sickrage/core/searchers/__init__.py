@@ -16,3 +16,73 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import sickrage
+from sickrage.core.common import Quality, DOWNLOADED, SNATCHED, SNATCHED_PROPER, WANTED
+from sickrage.core.databases.main import MainDB
+
+WANTED_STATUSES = (WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER)
+
+
+def wanted_composite_statuses(show_quality, skip_downloaded=False):
+    """
+    Returns every composite status an episode can have while it still needs to be searched for
+    :param show_quality: combined any and best qualities of the show
+    :param skip_downloaded: skip upgrading the quality of downloaded episodes
+    :return: set of composite statuses
+    """
+
+    any_qualities, best_qualities = Quality.split_quality(show_quality)
+    wanted_qualities = best_qualities or any_qualities
+
+    statuses = set()
+    for status in WANTED_STATUSES:
+        if status == DOWNLOADED and skip_downloaded:
+            continue
+
+        for quality in Quality.qualityStrings:
+            # if we need a better one then say yes
+            if status != WANTED:
+                if quality in wanted_qualities:
+                    continue
+                elif quality != Quality.UNKNOWN and wanted_qualities and quality > max(wanted_qualities):
+                    continue
+
+            statuses.add(Quality.composite_status(status, quality))
+
+    return statuses
+
+
+def get_wanted_episodes(shows, min_airdate, max_airdate=None):
+    """
+    Selects the episodes of the given shows that need to be searched for with a single query
+    :param shows: list of show objects
+    :param min_airdate: only episodes aired on or after this date
+    :param max_airdate: only episodes aired on or before this date, unbounded if None
+    :return: dict of (show indexer id, indexer) to a list of wanted (season, episode) tuples
+    """
+
+    wanted = {}
+
+    show_statuses = {}
+    for show in shows:
+        show_statuses[(show.indexer_id, show.indexer)] = wanted_composite_statuses(show.quality, show.skip_downloaded)
+
+    all_statuses = set().union(*show_statuses.values())
+    if not all_statuses:
+        return wanted
+
+    with sickrage.app.main_db.session() as session:
+        query = session.query(MainDB.TVEpisode.showid, MainDB.TVEpisode.indexer, MainDB.TVEpisode.season,
+                              MainDB.TVEpisode.episode, MainDB.TVEpisode.status).filter(MainDB.TVEpisode.season > 0,
+                                                                                        MainDB.TVEpisode.status.in_(all_statuses),
+                                                                                        MainDB.TVEpisode.airdate >= min_airdate)
+        if max_airdate is not None:
+            query = query.filter(MainDB.TVEpisode.airdate <= max_airdate)
+
+        for showid, indexer, season, episode, status in query.order_by(MainDB.TVEpisode.season, MainDB.TVEpisode.episode):
+            if status in show_statuses.get((showid, indexer), ()):
+                wanted.setdefault((showid, indexer), []).append((season, episode))
+
+    return wanted
@@ -24,8 +24,8 @@ import datetime
 import threading
 
 import sickrage
-from sickrage.core.common import Quality, DOWNLOADED, SNATCHED, SNATCHED_PROPER, WANTED
 from sickrage.core.queues.search import BacklogQueueItem
+from sickrage.core.searchers import get_wanted_episodes
 from sickrage.core.tv.show.helpers import find_show, get_show_list
 
 
@@ -78,13 +78,17 @@ class BacklogSearcher(object):
         else:
             sickrage.app.log.info('Running full backlog search on missed episodes for all shows')
 
+        # select wanted episodes of every show in a single query
+        wanted_episodes = get_wanted_episodes([x for x in show_list if not x.paused], from_date + datetime.timedelta(days=1),
+                                              cur_date - datetime.timedelta(days=1))
+
         # go through non air-by-date shows and see if they need any episodes
         for curShow in show_list:
             if curShow.paused:
                 sickrage.app.log.debug("Skipping search for {} because the show is paused".format(curShow.name))
                 continue
 
-            wanted = self._get_wanted(curShow, from_date)
+            wanted = wanted_episodes.get((curShow.indexer_id, curShow.indexer))
             if not wanted:
                 sickrage.app.log.debug("Nothing needs to be downloaded for {}, skipping".format(curShow.name))
                 continue
@@ -101,44 +105,6 @@ class BacklogSearcher(object):
 
         self.amActive = False
 
-    @staticmethod
-    def _get_wanted(show, from_date):
-        any_qualities, best_qualities = Quality.split_quality(show.quality)
-
-        sickrage.app.log.debug("Seeing if we need anything that's older then today for {}".format(show.name))
-
-        # check through the list of statuses to see if we want any
-        wanted = []
-        for episode_object in show.episodes:
-            if not episode_object.season > 0 or not datetime.date.today() > episode_object.airdate > from_date:
-                continue
-
-            cur_status, cur_quality = Quality.split_composite_status(int(episode_object.status or -1))
-
-            # if we need a better one then say yes
-            if cur_status not in {WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER}:
-                continue
-
-            if cur_status != WANTED:
-                if best_qualities:
-                    if cur_quality in best_qualities:
-                        continue
-                    elif cur_quality != Quality.UNKNOWN and cur_quality > max(best_qualities):
-                        continue
-                else:
-                    if cur_quality in any_qualities:
-                        continue
-                    elif cur_quality != Quality.UNKNOWN and cur_quality > max(any_qualities):
-                        continue
-
-            # skip upgrading quality of downloaded episodes if enabled
-            if cur_status == DOWNLOADED and show.skip_downloaded:
-                continue
-
-            wanted += [(episode_object.season, episode_object.episode)]
-
-        return wanted
-
     @staticmethod
     def _get_last_backlog_search(show):
         sickrage.app.log.debug("Retrieving the last check time from the DB")
@@ -23,8 +23,8 @@ import threading
 
 import sickrage
 from sickrage.core import common
-from sickrage.core.common import Quality, WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER
 from sickrage.core.queues.search import DailySearchQueueItem
+from sickrage.core.searchers import get_wanted_episodes
 from sickrage.core.tv.show.helpers import get_show_list
 
 
@@ -47,22 +47,31 @@ class DailySearcher(object):
         # set thread name
         threading.currentThread().setName(self.name)
 
+        show_list = []
+
         # find new released episodes and update their statuses
         for curShow in get_show_list():
             if curShow.paused:
                 sickrage.app.log.debug("Skipping search for {} because the show is paused".format(curShow.name))
                 continue
 
-            for tv_episode in curShow.new_episodes:
-                tv_episode.status = tv_episode.show.default_ep_status if tv_episode.season > 0 else common.SKIPPED
-                tv_episode.save()
-                sickrage.app.log.info('Setting status ({status}) for show airing today: {name} {special}'.format(
-                    name=tv_episode.pretty_name(),
-                    status=common.statusStrings[tv_episode.status],
-                    special='(specials are not supported)' if not tv_episode.season > 0 else '',
-                ))
+            show_list.append(curShow)
+
+            with sickrage.app.main_db.batch():
+                for tv_episode in curShow.new_episodes:
+                    tv_episode.status = tv_episode.show.default_ep_status if tv_episode.season > 0 else common.SKIPPED
+                    tv_episode.save()
+                    sickrage.app.log.info('Setting status ({status}) for show airing today: {name} {special}'.format(
+                        name=tv_episode.pretty_name(),
+                        status=common.statusStrings[tv_episode.status],
+                        special='(specials are not supported)' if not tv_episode.season > 0 else '',
+                    ))
+
+        # select wanted episodes of every show in a single query
+        wanted_episodes = get_wanted_episodes(show_list, datetime.date.today())
 
-            wanted = self._get_wanted(curShow, datetime.date.today())
+        for curShow in show_list:
+            wanted = wanted_episodes.get((curShow.indexer_id, curShow.indexer))
             if not wanted:
                 sickrage.app.log.debug("Nothing needs to be downloaded for {}, skipping".format(curShow.name))
                 continue
@@ -74,50 +83,3 @@ class DailySearcher(object):
                 sickrage.app.io_loop.add_callback(sickrage.app.search_queue.put, DailySearchQueueItem(curShow.indexer_id, season, episode))
 
         self.amActive = False
-
-    @staticmethod
-    def _get_wanted(show, from_date):
-        """
-        Get a list of episodes that we want to download
-        :param show: Show these episodes are from
-        :param fromDate: Search from a certain date
-        :return: list of wanted episodes
-        """
-
-        wanted = []
-
-        any_qualities, best_qualities = Quality.split_quality(show.quality)
-        all_qualities = list(set(any_qualities + best_qualities))
-
-        sickrage.app.log.debug("Seeing if we need anything for today from {}".format(show.name))
-
-        # check through the list of statuses to see if we want any
-        for episode_object in show.episodes:
-            if not episode_object.season > 0 or not episode_object.airdate >= from_date:
-                continue
-
-            cur_status, cur_quality = Quality.split_composite_status(int(episode_object.status or -1))
-
-            # if we need a better one then say yes
-            if cur_status not in (WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER):
-                continue
-
-            if cur_status != WANTED:
-                if best_qualities:
-                    if cur_quality in best_qualities:
-                        continue
-                    elif cur_quality != Quality.UNKNOWN and cur_quality > max(best_qualities):
-                        continue
-                else:
-                    if cur_quality in any_qualities:
-                        continue
-                    elif cur_quality != Quality.UNKNOWN and cur_quality > max(any_qualities):
-                        continue
-
-            # skip upgrading quality of downloaded episodes if enabled
-            if cur_status == DOWNLOADED and show.skip_downloaded:
-                continue
-
-            wanted += [(episode_object.season, episode_object.episode)]
-
-        return wanted
@@ -48,9 +48,14 @@ from sickrage.subtitles import Subtitles
 
 
 class TVEpisode(object):
-    def __init__(self, showid, indexer, season, episode, location=''):
+    def __init__(self, showid, indexer, season, episode, location='', data=None):
         self.lock = threading.Lock()
 
+        # episode row already fetched by caller, skip the database round trip
+        if data is not None:
+            self._data_local = data
+            return
+
         with sickrage.app.main_db.session() as session:
             try:
                 query = session.query(MainDB.TVEpisode).filter_by(showid=showid, indexer=indexer, season=season, episode=episode).one()
@@ -69,6 +74,8 @@ class TVEpisode(object):
                 except Exception as e:
                     pass
 
+                sickrage.app.show_stats_cache.invalidate()
+
                 query = session.query(MainDB.TVEpisode).filter_by(showid=showid, indexer=indexer, season=season, episode=episode).one()
                 self._data_local = query.as_dict()
 
@@ -281,12 +288,20 @@ class TVEpisode(object):
         return [x for x in self.show.episodes if x.location and x.location == self.location and x.season == self.season and x.episode != self.episode]
 
     def save(self):
+        # defer the write if called within a database batch
+        if sickrage.app.main_db.queue_update(MainDB.TVEpisode, self._data_local):
+            return
+
         with sickrage.app.main_db.session() as session:
             query = session.query(MainDB.TVEpisode).filter_by(showid=self.showid,
                                                               indexer=self.indexer,
                                                               season=self.season,
                                                               episode=self.episode).one_or_none()
             if query:
+                # show statistics are derived from these columns, drop them if any have changed
+                if any(getattr(query, x) != self._data_local[x] for x in ['status', 'airdate', 'location', 'file_size']):
+                    sickrage.app.show_stats_cache.invalidate()
+
                 query.update(**self._data_local)
 
             session.commit()
@@ -299,6 +314,8 @@ class TVEpisode(object):
                                                       episode=self.episode).delete()
             session.commit()
 
+        sickrage.app.show_stats_cache.invalidate()
+
     def refresh_subtitles(self):
         """Look for subtitles files and refresh the subtitles property"""
         subtitles, save_subtitles = Subtitles().refresh_subtitles(self.showid, self.season, self.episode)
@@ -672,8 +689,8 @@ class TVEpisode(object):
         # delete myself from show episode cache
         try:
             sickrage.app.log.debug("Deleting %s S%02dE%02d from the shows episode cache" % (self.show.name, self.season or 0, self.episode or 0))
-            del self.show.episodes[self.show.episodes.index(self)]
-        except (IndexError, ValueError) as e:
+            self.show.remove_episode(self)
+        except AttributeError:
             pass
 
         # delete myself from the database
@@ -30,7 +30,6 @@ import time
 import traceback
 
 import send2trash
-import sqlalchemy
 from adba.aniDBAbstracter import Anime
 from sqlalchemy import orm
 from unidecode import unidecode
@@ -43,17 +42,26 @@ from sickrage.core.common import Quality, SKIPPED, WANTED, UNKNOWN, DOWNLOADED,
 from sickrage.core.databases.main import MainDB
 from sickrage.core.exceptions import ShowNotFoundException, EpisodeNotFoundException, EpisodeDeletedException, MultipleEpisodesInDatabaseException
 from sickrage.core.helpers import list_media_files, is_media_file, try_int, safe_getattr
-from sickrage.core.nameparser import NameParser, InvalidNameException, InvalidShowException
+from sickrage.core.nameparser import NameParser, InvalidNameException, InvalidShowException, name_parser_cache
 from sickrage.core.tv.episode import TVEpisode
+from sickrage.core.tv.show.helpers import show_index
 from sickrage.indexers import IndexerApi
 from sickrage.indexers.config import INDEXER_TVRAGE
 from sickrage.indexers.exceptions import indexer_attributenotfound
 
 
 class TVShow(object):
-    def __init__(self, indexer_id, indexer, lang='en', location=''):
+    def __init__(self, indexer_id, indexer, lang='en', location='', data=None):
         self.lock = threading.Lock()
-        self._episodes = []
+        self._episodes = {}
+        self._episodes_by_absolute_number = {}
+        self._episodes_by_indexer_id = {}
+        self._episodes_loaded = False
+
+        # show row already fetched by caller, skip the database round trip
+        if data is not None:
+            self._data_local = data
+            return
 
         with sickrage.app.main_db.session() as session:
             try:
@@ -73,6 +81,8 @@ class TVShow(object):
                 self._data_local = query.as_dict()
 
                 sickrage.app.shows.update({(self.indexer_id, self.indexer): self})
+                show_index.add(self)
+                name_parser_cache.invalidate()
 
                 self.load_from_indexer()
 
@@ -98,7 +108,11 @@ class TVShow(object):
 
     @name.setter
     def name(self, value):
+        changed = self._data_local['name'] != value
         self._data_local['name'] = value
+        if changed:
+            name_parser_cache.invalidate(self.indexer_id)
+            show_index.update(self)
 
     @property
     def location(self):
@@ -106,7 +120,10 @@ class TVShow(object):
 
     @location.setter
     def location(self, value):
+        changed = self._data_local['location'] != value
         self._data_local['location'] = value
+        if changed:
+            show_index.update(self)
 
     @property
     def network(self):
@@ -318,11 +335,17 @@ class TVShow(object):
 
     @property
     def scene_exceptions(self):
-        return list(filter(None, self._data_local['scene_exceptions'].split(',')))
+        return list(filter(None, (self._data_local['scene_exceptions'] or '').split(',')))
 
     @scene_exceptions.setter
     def scene_exceptions(self, value):
-        self._data_local['scene_exceptions'] = ','.join(value)
+        # callers pass sets, store them sorted so an unchanged set never looks changed
+        value = ','.join(sorted(filter(None, value)))
+        changed = self._data_local['scene_exceptions'] != value
+        self._data_local['scene_exceptions'] = value
+        if changed:
+            name_parser_cache.invalidate(self.indexer_id)
+            show_index.update(self)
 
     @property
     def last_update(self):
@@ -366,11 +389,9 @@ class TVShow(object):
 
     @property
     def episodes(self):
-        if not self._episodes:
-            with sickrage.app.main_db.session() as session:
-                query = session.query(MainDB.TVShow).filter_by(indexer_id=self.indexer_id, indexer=self.indexer).one()
-                self._episodes = [TVEpisode(showid=self.indexer_id, indexer=self.indexer, season=x.season, episode=x.episode) for x in query.episodes]
-        return self._episodes
+        if not self._episodes_loaded:
+            self.load_episodes_from_db()
+        return list(self._episodes.values())
 
     @property
     def imdb_info(self):
@@ -392,103 +413,43 @@ class TVShow(object):
 
     @property
     def airs_next(self):
-        _airs_next = datetime.date.min
-
-        with sickrage.app.main_db.session() as session:
-            show_query = session.query(MainDB.TVShow).filter_by(indexer_id=self.indexer_id, indexer=self.indexer).one()
-            query = show_query.episodes.filter(
-                MainDB.TVEpisode.season != 0,
-                MainDB.TVEpisode.airdate >= datetime.date.today(),
-                MainDB.TVEpisode.status.in_([UNAIRED, WANTED])
-            ).order_by(
-                MainDB.TVEpisode.airdate
-            ).first()
-
-            if query:
-                _airs_next = query.airdate
-
-        return _airs_next
+        return sickrage.app.show_stats_cache.get(self.indexer_id, self.indexer)['airs_next']
 
     @property
     def airs_prev(self):
-        _airs_prev = datetime.date.min
-
-        with sickrage.app.main_db.session() as session:
-            show_query = session.query(MainDB.TVShow).filter_by(indexer_id=self.indexer_id, indexer=self.indexer).one()
-            query = show_query.episodes.filter(
-                MainDB.TVEpisode.season != 0,
-                MainDB.TVEpisode.airdate < datetime.date.today(),
-                MainDB.TVEpisode.status != UNAIRED
-            ).order_by(
-                sqlalchemy.desc(MainDB.TVEpisode.airdate)
-            ).first()
-
-            if query:
-                _airs_prev = query.airdate
+        return sickrage.app.show_stats_cache.get(self.indexer_id, self.indexer)['airs_prev']
 
-        return _airs_prev
+    @property
+    def episodes_total(self):
+        return sickrage.app.show_stats_cache.get(self.indexer_id, self.indexer)['total']
 
     @property
     def episodes_unaired(self):
-        with sickrage.app.main_db.session() as session:
-            show_query = session.query(MainDB.TVShow).filter_by(indexer_id=self.indexer_id, indexer=self.indexer).one()
-            return show_query.episodes.filter(
-                MainDB.TVEpisode.season != 0,
-                MainDB.TVEpisode.status == UNAIRED
-            ).count()
+        return sickrage.app.show_stats_cache.get(self.indexer_id, self.indexer)['unaired']
 
     @property
     def episodes_snatched(self):
-        with sickrage.app.main_db.session() as session:
-            show_query = session.query(MainDB.TVShow).filter_by(indexer_id=self.indexer_id, indexer=self.indexer).one()
-            return show_query.episodes.filter(
-                MainDB.TVEpisode.season != 0,
-                MainDB.TVEpisode.status.in_(Quality.SNATCHED + Quality.SNATCHED_BEST + Quality.SNATCHED_PROPER)
-            ).count()
+        return sickrage.app.show_stats_cache.get(self.indexer_id, self.indexer)['snatched']
 
     @property
     def episodes_downloaded(self):
-        with sickrage.app.main_db.session() as session:
-            show_query = session.query(MainDB.TVShow).filter_by(indexer_id=self.indexer_id, indexer=self.indexer).one()
-            return show_query.episodes.filter(
-                MainDB.TVEpisode.season != 0,
-                MainDB.TVEpisode.status.in_(Quality.DOWNLOADED + Quality.ARCHIVED)
-            ).count()
+        return sickrage.app.show_stats_cache.get(self.indexer_id, self.indexer)['downloaded']
 
     @property
     def episodes_special(self):
-        with sickrage.app.main_db.session() as session:
-            show_query = session.query(MainDB.TVShow).filter_by(indexer_id=self.indexer_id, indexer=self.indexer).one()
-            return show_query.episodes.filter(
-                MainDB.TVEpisode.season == 0
-            ).count()
+        return sickrage.app.show_stats_cache.get(self.indexer_id, self.indexer)['special']
 
     @property
     def episodes_special_unaired(self):
-        with sickrage.app.main_db.session() as session:
-            show_query = session.query(MainDB.TVShow).filter_by(indexer_id=self.indexer_id, indexer=self.indexer).one()
-            return show_query.episodes.filter(
-                MainDB.TVEpisode.season == 0,
-                MainDB.TVEpisode.status == UNAIRED
-            ).count()
+        return sickrage.app.show_stats_cache.get(self.indexer_id, self.indexer)['special_unaired']
 
     @property
     def episodes_special_downloaded(self):
-        with sickrage.app.main_db.session() as session:
-            show_query = session.query(MainDB.TVShow).filter_by(indexer_id=self.indexer_id, indexer=self.indexer).one()
-            return show_query.episodes.filter(
-                MainDB.TVEpisode.season == 0,
-                MainDB.TVEpisode.status.in_(Quality.DOWNLOADED + Quality.ARCHIVED)
-            ).count()
+        return sickrage.app.show_stats_cache.get(self.indexer_id, self.indexer)['special_downloaded']
 
     @property
     def episodes_special_snatched(self):
-        with sickrage.app.main_db.session() as session:
-            show_query = session.query(MainDB.TVShow).filter_by(indexer_id=self.indexer_id, indexer=self.indexer).one()
-            return show_query.episodes.filter(
-                MainDB.TVEpisode.season == 0,
-                MainDB.TVEpisode.status.in_(Quality.SNATCHED + Quality.SNATCHED_BEST + Quality.SNATCHED_PROPER)
-            ).count()
+        return sickrage.app.show_stats_cache.get(self.indexer_id, self.indexer)['special_snatched']
 
     @property
     def new_episodes(self):
@@ -524,13 +485,7 @@ class TVShow(object):
 
     @property
     def total_size(self):
-        _total_size = 0
-        _related_episodes = set()
-        for episode_object in self.episodes:
-            [_related_episodes.add(related_episode.indexer_id) for related_episode in episode_object.related_episodes]
-            if episode_object.indexer_id not in _related_episodes:
-                _total_size += episode_object.file_size
-        return _total_size
+        return sickrage.app.show_stats_cache.get(self.indexer_id, self.indexer)['total_size']
 
     @property
     def network_logo_name(self):
@@ -542,6 +497,10 @@ class TVShow(object):
             return BlackAndWhiteList(self.indexer_id)
 
     def save(self):
+        # defer the write if called within a database batch
+        if sickrage.app.main_db.queue_update(MainDB.TVShow, self._data_local):
+            return
+
         with sickrage.app.main_db.session() as session:
             sickrage.app.log.debug("{0:d}: Saving to database: {1}".format(self.indexer_id, self.name))
             query = session.query(MainDB.TVShow).filter_by(indexer_id=self.indexer_id, indexer=self.indexer).one_or_none()
@@ -556,6 +515,60 @@ class TVShow(object):
 
     def flush_episodes(self):
         self._episodes.clear()
+        self._episodes_by_absolute_number.clear()
+        self._episodes_by_indexer_id.clear()
+        self._episodes_loaded = False
+
+    def load_episodes_from_db(self, rows=None):
+        """
+        Builds episode objects for this show using a single query, or straight from already fetched tv_episodes rows
+        :param rows: iterable of MainDB.TVEpisode rows belonging to this show
+        """
+        self.flush_episodes()
+
+        with sickrage.app.main_db.session() as session:
+            if rows is None:
+                rows = session.query(MainDB.TVEpisode).filter_by(showid=self.indexer_id, indexer=self.indexer)
+
+            for x in rows:
+                self.add_episode(TVEpisode(showid=self.indexer_id, indexer=self.indexer, season=x.season, episode=x.episode, data=x.as_dict()))
+
+        self._episodes_loaded = True
+
+    def add_episode(self, episode_obj):
+        """
+        Adds episode object to the show episode cache and its lookup indexes
+        :param episode_obj: TVEpisode object
+        """
+        key = (episode_obj.season, episode_obj.episode)
+
+        self._episodes[key] = episode_obj
+
+        if episode_obj.absolute_number:
+            self._episodes_by_absolute_number.setdefault(episode_obj.absolute_number, set()).add(key)
+
+        if episode_obj.indexer_id:
+            self._episodes_by_indexer_id[episode_obj.indexer_id] = key
+
+    def remove_episode(self, episode_obj):
+        """
+        Removes episode object from the show episode cache and its lookup indexes
+        :param episode_obj: TVEpisode object
+        """
+        key = (episode_obj.season, episode_obj.episode)
+
+        if self._episodes.get(key) is not episode_obj:
+            return
+
+        del self._episodes[key]
+
+        keys = self._episodes_by_absolute_number.get(episode_obj.absolute_number, set())
+        keys.discard(key)
+        if not keys:
+            self._episodes_by_absolute_number.pop(episode_obj.absolute_number, None)
+
+        if self._episodes_by_indexer_id.get(episode_obj.indexer_id) == key:
+            del self._episodes_by_indexer_id[episode_obj.indexer_id]
 
     def load_from_indexer(self, cache=True, tvapi=None):
         if self.indexer is not INDEXER_TVRAGE:
@@ -624,51 +637,70 @@ class TVShow(object):
         # flush episodes from cache so we can reload from database
         self.flush_episodes()
 
-        for season in t[self.indexer_id]:
-            scanned_eps[season] = {}
-            for episode in t[self.indexer_id][season]:
-                # need some examples of wtf episode 0 means to decide if we want it or not
-                if episode == 0:
-                    continue
+        with sickrage.app.main_db.batch():
+            for season in t[self.indexer_id]:
+                scanned_eps[season] = {}
+                for episode in t[self.indexer_id][season]:
+                    # need some examples of wtf episode 0 means to decide if we want it or not
+                    if episode == 0:
+                        continue
 
-                try:
-                    episode_obj = self.get_episode(season, episode)
-                except EpisodeNotFoundException:
-                    continue
-                else:
                     try:
-                        episode_obj.load_from_indexer(season, episode)
-                    except EpisodeDeletedException:
-                        sickrage.app.log.info("The episode was deleted, skipping the rest of the load")
+                        episode_obj = self.get_episode(season, episode)
+                    except EpisodeNotFoundException:
                         continue
+                    else:
+                        try:
+                            episode_obj.load_from_indexer(season, episode)
+                        except EpisodeDeletedException:
+                            sickrage.app.log.info("The episode was deleted, skipping the rest of the load")
+                            continue
 
-                scanned_eps[season][episode] = True
+                    scanned_eps[season][episode] = True
 
-        # Done updating save last update date
-        self.last_update = datetime.date.today().toordinal()
+            # Done updating save last update date
+            self.last_update = datetime.date.today().toordinal()
 
-        self.save()
+            self.save()
 
         return scanned_eps
 
-    def get_episode(self, season=None, episode=None, absolute_number=None, no_create=False):
+    def get_episode(self, season=None, episode=None, absolute_number=None, indexer_id=None, no_create=False):
+        # make sure the episode cache and lookup indexes are populated
+        if not self._episodes_loaded:
+            self.load_episodes_from_db()
+
         try:
             if season is None and episode is None and absolute_number is not None:
-                with sickrage.app.main_db.session() as session:
-                    query = session.query(MainDB.TVEpisode).filter_by(showid=self.indexer_id, indexer=self.indexer, absolute_number=absolute_number).one()
-                    sickrage.app.log.debug("Found episode by absolute_number %s which is S%02dE%02d" % (absolute_number, query.season, query.episode))
-                    season = query.season
-                    episode = query.episode
-
-            for tv_episode in self._episodes:
-                if tv_episode.season == season and tv_episode.episode == episode:
-                    return tv_episode
-            else:
+                keys = [key for key in self._episodes_by_absolute_number.get(absolute_number, set())
+                        if key in self._episodes and self._episodes[key].absolute_number == absolute_number]
+
+                if len(keys) > 1:
+                    raise orm.exc.MultipleResultsFound
+
+                if keys:
+                    season, episode = keys[0]
+                else:
+                    with sickrage.app.main_db.session() as session:
+                        query = session.query(MainDB.TVEpisode).filter_by(showid=self.indexer_id, indexer=self.indexer,
+                                                                          absolute_number=absolute_number).one()
+                        season = query.season
+                        episode = query.episode
+
+                sickrage.app.log.debug("Found episode by absolute_number %s which is S%02dE%02d" % (absolute_number, season, episode))
+            elif season is None and episode is None and indexer_id is not None:
+                key = self._episodes_by_indexer_id.get(indexer_id)
+                if key not in self._episodes or self._episodes[key].indexer_id != indexer_id:
+                    raise EpisodeNotFoundException
+                season, episode = key
+
+            tv_episode = self._episodes.get((season, episode))
+            if tv_episode is None:
                 if no_create:
                     raise EpisodeNotFoundException
                 tv_episode = TVEpisode(showid=self.indexer_id, indexer=self.indexer, season=season, episode=episode)
-                self._episodes.append(tv_episode)
-                return tv_episode
+            self.add_episode(tv_episode)
+            return tv_episode
         except orm.exc.MultipleResultsFound:
             if absolute_number is not None:
                 sickrage.app.log.debug("Multiple entries for absolute number: " + str(absolute_number) + " in show: " + self.name + " found ")
@@ -745,13 +777,25 @@ class TVShow(object):
         # get file list
         media_files = list_media_files(self.location)
 
+        # parse all file names in one batch, results without a show are not cached so keep them for below
+        file_names = [os.path.join(self.location, x) for x in media_files]
+        file_results = dict(zip(file_names, NameParser(validate_show=False).parse_many(file_names, skip_scene_detection=True)))
+
+        release_names = [os.path.splitext(os.path.basename(x))[0] for x in media_files]
+        release_results = dict(zip(release_names, NameParser(False, show_id=self.indexer_id).parse_many(release_names)))
+
         # create TVEpisodes from each media file (if possible)
         for mediaFile in media_files:
             curEpisode = None
 
+            file_name = os.path.join(self.location, mediaFile)
+            if not file_results.get(file_name):
+                sickrage.app.log.debug("Unable to parse the filename " + file_name + " into a valid episode")
+                continue
+
             sickrage.app.log.debug(str(self.indexer_id) + ": Creating episode from " + mediaFile)
             try:
-                curEpisode = self.make_ep_from_file(os.path.join(self.location, mediaFile))
+                curEpisode = self.make_ep_from_file(file_name, parse_result=file_results[file_name])
             except (ShowNotFoundException, EpisodeNotFoundException) as e:
                 sickrage.app.log.warning("Episode " + mediaFile + " returned an exception: {}".format(e))
             except EpisodeDeletedException:
@@ -765,10 +809,13 @@ class TVShow(object):
             ep_file_name = os.path.basename(curEpisode.location)
             ep_file_name = os.path.splitext(ep_file_name)[0]
 
-            try:
-                parse_result = NameParser(False, show_id=self.indexer_id).parse(ep_file_name)
-            except (InvalidNameException, InvalidShowException):
-                parse_result = None
+            if ep_file_name in release_results:
+                parse_result = release_results[ep_file_name]
+            else:
+                try:
+                    parse_result = NameParser(False, show_id=self.indexer_id).parse(ep_file_name)
+                except (InvalidNameException, InvalidShowException):
+                    parse_result = None
 
             if ' ' not in ep_file_name and parse_result and parse_result.release_group:
                 sickrage.app.log.debug("Name " + ep_file_name + " gave release group of " + parse_result.release_group + ", seems valid")
@@ -866,21 +913,22 @@ class TVShow(object):
 
         return fanart_result or poster_result or banner_result or season_posters_result or season_banners_result or season_all_poster_result or season_all_banner_result
 
-    def make_ep_from_file(self, filename):
+    def make_ep_from_file(self, filename, parse_result=None):
         if not os.path.isfile(filename):
             sickrage.app.log.info(str(self.indexer_id) + ": That isn't even a real file dude... " + filename)
             return None
 
         sickrage.app.log.debug(str(self.indexer_id) + ": Creating episode object from " + filename)
 
-        try:
-            parse_result = NameParser(validate_show=False).parse(filename, skip_scene_detection=True)
-        except InvalidNameException:
-            sickrage.app.log.debug("Unable to parse the filename " + filename + " into a valid episode")
-            return None
-        except InvalidShowException:
-            sickrage.app.log.debug("Unable to parse the filename " + filename + " into a valid show")
-            return None
+        if not parse_result:
+            try:
+                parse_result = NameParser(validate_show=False).parse(filename, skip_scene_detection=True)
+            except InvalidNameException:
+                sickrage.app.log.debug("Unable to parse the filename " + filename + " into a valid episode")
+                return None
+            except InvalidShowException:
+                sickrage.app.log.debug("Unable to parse the filename " + filename + " into a valid show")
+                return None
 
         if not len(parse_result.episode_numbers):
             sickrage.app.log.info("parse_result: " + str(parse_result))
@@ -992,11 +1040,15 @@ class TVShow(object):
             session.query(MainDB.SceneNumbering).filter_by(indexer_id=self.indexer_id).delete()
             self.save()
 
+        sickrage.app.show_stats_cache.invalidate()
+
         # remove episodes from show episode cache
         self.flush_episodes()
 
         # remove from show cache
         del sickrage.app.shows[(self.indexer_id, self.indexer)]
+        show_index.remove(self)
+        name_parser_cache.invalidate(self.indexer_id)
 
         # clear the cache
         image_cache_dir = os.path.join(sickrage.app.cache_dir, 'images')
@@ -1051,63 +1103,64 @@ class TVShow(object):
         if not os.path.isdir(self.location) and not sickrage.app.config.create_missing_show_dirs:
             return False
 
-        # load from dir
-        try:
-            self.load_episodes_from_dir()
-        except Exception as e:
-            sickrage.app.log.debug("Error searching dir for episodes: {}".format(e))
-            sickrage.app.log.debug(traceback.format_exc())
+        with sickrage.app.main_db.batch():
+            # load from dir
+            try:
+                self.load_episodes_from_dir()
+            except Exception as e:
+                sickrage.app.log.debug("Error searching dir for episodes: {}".format(e))
+                sickrage.app.log.debug(traceback.format_exc())
 
-        # run through all locations from DB, check that they exist
-        sickrage.app.log.debug(str(self.indexer_id) + ": Loading all episodes with a location from the database")
+            # run through all locations from DB, check that they exist
+            sickrage.app.log.debug(str(self.indexer_id) + ": Loading all episodes with a location from the database")
 
-        for curEp in self.episodes:
-            if curEp.location == '':
-                continue
+            for curEp in self.episodes:
+                if curEp.location == '':
+                    continue
 
-            curLoc = os.path.normpath(curEp.location)
-            season = int(curEp.season)
-            episode = int(curEp.episode)
-
-            # if the path doesn't exist or if it's not in our show dir
-            if not os.path.isfile(curLoc) or not os.path.normpath(curLoc).startswith(os.path.normpath(self.location)):
-                # check if downloaded files still exist, update our data if this has changed
-                if not sickrage.app.config.skip_removed_files:
-                    # if it used to have a file associated with it and it doesn't anymore then set it to
-                    # EP_DEFAULT_DELETED_STATUS
-                    if curEp.location and curEp.status in Quality.DOWNLOADED:
-                        if sickrage.app.config.ep_default_deleted_status == ARCHIVED:
-                            __, oldQuality = Quality.split_composite_status(curEp.status)
-                            new_status = Quality.composite_status(ARCHIVED, oldQuality)
-                        else:
-                            new_status = sickrage.app.config.ep_default_deleted_status
-
-                        sickrage.app.log.debug("%s: Location for S%02dE%02d doesn't exist, "
-                                               "removing it and changing our status to %s" % (self.indexer_id,
-                                                                                              season or 0,
-                                                                                              episode or 0,
-                                                                                              statusStrings[new_status]))
-
-                        curEp.status = new_status
-                        curEp.subtitles = ''
-                        curEp.subtitles_searchcount = 0
-                        curEp.subtitles_lastsearch = 0
-
-                    curEp.location = ''
-                    curEp.hasnfo = False
-                    curEp.hastbn = False
-                    curEp.release_name = ''
-            else:
-                if curEp.status in Quality.ARCHIVED:
-                    __, oldQuality = Quality.split_composite_status(curEp.status)
-                    curEp.status = Quality.composite_status(DOWNLOADED, oldQuality)
+                curLoc = os.path.normpath(curEp.location)
+                season = int(curEp.season)
+                episode = int(curEp.episode)
+
+                # if the path doesn't exist or if it's not in our show dir
+                if not os.path.isfile(curLoc) or not os.path.normpath(curLoc).startswith(os.path.normpath(self.location)):
+                    # check if downloaded files still exist, update our data if this has changed
+                    if not sickrage.app.config.skip_removed_files:
+                        # if it used to have a file associated with it and it doesn't anymore then set it to
+                        # EP_DEFAULT_DELETED_STATUS
+                        if curEp.location and curEp.status in Quality.DOWNLOADED:
+                            if sickrage.app.config.ep_default_deleted_status == ARCHIVED:
+                                __, oldQuality = Quality.split_composite_status(curEp.status)
+                                new_status = Quality.composite_status(ARCHIVED, oldQuality)
+                            else:
+                                new_status = sickrage.app.config.ep_default_deleted_status
+
+                            sickrage.app.log.debug("%s: Location for S%02dE%02d doesn't exist, "
+                                                   "removing it and changing our status to %s" % (self.indexer_id,
+                                                                                                  season or 0,
+                                                                                                  episode or 0,
+                                                                                                  statusStrings[new_status]))
+
+                            curEp.status = new_status
+                            curEp.subtitles = ''
+                            curEp.subtitles_searchcount = 0
+                            curEp.subtitles_lastsearch = 0
+
+                        curEp.location = ''
+                        curEp.hasnfo = False
+                        curEp.hastbn = False
+                        curEp.release_name = ''
+                else:
+                    if curEp.status in Quality.ARCHIVED:
+                        __, oldQuality = Quality.split_composite_status(curEp.status)
+                        curEp.status = Quality.composite_status(DOWNLOADED, oldQuality)
 
-                # the file exists, set its modify file stamp
-                if sickrage.app.config.airdate_episodes:
-                    curEp.airdate_modify_stamp()
+                    # the file exists, set its modify file stamp
+                    if sickrage.app.config.airdate_episodes:
+                        curEp.airdate_modify_stamp()
 
-            # save episode to database
-            curEp.save()
+                # save episode to database
+                curEp.save()
 
     def download_subtitles(self):
         if not os.path.isdir(self.location):
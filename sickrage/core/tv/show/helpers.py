@@ -19,9 +19,100 @@
 #  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 # ##############################################################################
 
+import os
+import threading
+
 import sickrage
 
 
+class ShowIndex(object):
+    """
+    Lookup dictionaries over sickrage.app.shows by normalized name, scene exception and location
+
+    TVShow keeps entries current when a show is added or removed or its name, scene exceptions or location
+    change, if the show list is replaced or resized behind its back the index is rebuilt on the next lookup.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.shows = None
+        self.entries = {}
+        self.names = {}
+        self.scene_exceptions = {}
+        self.locations = {}
+
+    @staticmethod
+    def normalize_name(name):
+        return name.strip().lower() if name else None
+
+    @staticmethod
+    def normalize_location(location):
+        return os.path.normpath(location) if location else None
+
+    def _keys(self, show):
+        return (('names', {self.normalize_name(show.name)}),
+                ('scene_exceptions', {self.normalize_name(x.split('|')[0]) for x in show.scene_exceptions}),
+                ('locations', {self.normalize_location(show.location)}))
+
+    def _add(self, show):
+        keys = self._keys(show)
+        self.entries[id(show)] = keys
+
+        for index, terms in keys:
+            for term in filter(None, terms):
+                getattr(self, index).setdefault(term, {})[id(show)] = show
+
+    def _remove(self, show):
+        for index, terms in self.entries.pop(id(show), ()):
+            for term in filter(None, terms):
+                shows = getattr(self, index).get(term, {})
+                shows.pop(id(show), None)
+                if not shows:
+                    getattr(self, index).pop(term, None)
+
+    def _check(self):
+        if self.shows is not sickrage.app.shows or len(self.entries) != len(sickrage.app.shows):
+            self.rebuild()
+
+    def rebuild(self):
+        with self.lock:
+            self.shows = sickrage.app.shows
+            self.entries.clear()
+            self.names.clear()
+            self.scene_exceptions.clear()
+            self.locations.clear()
+
+            for show in list(self.shows.values()):
+                self._add(show)
+
+    def add(self, show):
+        with self.lock:
+            self._remove(show)
+            self._add(show)
+
+    def remove(self, show):
+        with self.lock:
+            self._remove(show)
+
+    def update(self, show):
+        """Re-indexes a show already in the index, shows that are not in the show list yet are left alone"""
+        with self.lock:
+            if id(show) in self.entries:
+                self._remove(show)
+                self._add(show)
+
+    def find(self, index, term):
+        with self.lock:
+            self._check()
+
+            shows = getattr(self, index).get(term)
+            if shows:
+                return next(iter(shows.values()))
+
+
+show_index = ShowIndex()
+
+
 def find_show(indexer_id, indexer=1):
     if not indexer_id:
         return None
@@ -30,21 +121,15 @@ def find_show(indexer_id, indexer=1):
 
 
 def find_show_by_name(term):
-    for show in get_show_list():
-        if term == show.name:
-            return show
+    return show_index.find('names', show_index.normalize_name(term))
 
 
 def find_show_by_scene_exception(term):
-    for show in get_show_list():
-        if term in [x.split('|')[0] for x in show.show.scene_exceptions]:
-            return show
+    return show_index.find('scene_exceptions', show_index.normalize_name(term))
 
 
 def find_show_by_location(location):
-    for show in get_show_list():
-        if show.location == location:
-            return show
+    return show_index.find('locations', show_index.normalize_location(location))
 
 
 def get_show_list():
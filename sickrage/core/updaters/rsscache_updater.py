@@ -1,6 +1,7 @@
 import threading
 
 import sickrage
+from sickrage.core.search import provider_fan_out
 
 
 class RSSCacheUpdater(object):
@@ -18,12 +19,16 @@ class RSSCacheUpdater(object):
         # set thread name
         threading.currentThread().setName(self.name)
 
-        for providerID, providerObj in sickrage.app.search_providers.sort().items():
-            if providerObj.is_enabled:
-                sickrage.app.log.debug("Updating RSS cache for provider: [{}]".format(providerObj.name))
-                threading.currentThread().setName(self.name + "::[" + providerObj.name + "]")
+        def update_provider_cache(providerObj):
+            sickrage.app.log.debug("Updating RSS cache for provider: [{}]".format(providerObj.name))
+            try:
                 providerObj.cache.update(force)
-                threading.currentThread().setName(self.name)
-                sickrage.app.log.debug("Updated RSS cache for provider: [{}]".format(providerObj.name))
+            except Exception as e:
+                sickrage.app.log.debug("Error updating RSS cache for provider {}: {}".format(providerObj.name, e))
+            sickrage.app.log.debug("Updated RSS cache for provider: [{}]".format(providerObj.name))
+
+        providers = [providerObj for providerObj in sickrage.app.search_providers.sort().values() if providerObj.is_enabled]
+        for __ in provider_fan_out(providers, update_provider_cache, self.name):
+            pass
 
         self.amActive = False
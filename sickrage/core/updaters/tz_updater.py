@@ -19,11 +19,11 @@
 
 
 import datetime
+import functools
 import re
 import threading
 
 from dateutil import tz
-from sqlalchemy import orm
 
 import sickrage
 from sickrage.core.databases.cache import CacheDB
@@ -31,10 +31,17 @@ from sickrage.core.helpers import try_int
 from sickrage.core.websession import WebSession
 
 
+@functools.lru_cache(maxsize=None)
+def gettz(name):
+    return tz.gettz(name)
+
+
 class TimeZoneUpdater(object):
     def __init__(self):
         self.name = "TZUPDATER"
         self.time_regex = re.compile(r'(?P<hour>\d{1,2})(?:[:.]?(?P<minute>\d{2})?)? ?(?P<meridiem>[PA]\.? ?M?)?\b', re.I)
+        self.network_timezones = None
+        self.lock = threading.Lock()
 
     def run(self):
         # set thread name
@@ -45,8 +52,6 @@ class TimeZoneUpdater(object):
     def update_network_timezones(self):
         """Update timezone information from SR repositories"""
 
-        session = sickrage.app.cache_db.session()
-
         network_timezones = {}
 
         try:
@@ -63,26 +68,61 @@ class TimeZoneUpdater(object):
         except (IOError, OSError):
             pass
 
-        for x in session.query(CacheDB.NetworkTimezone):
-            if x.network_name not in network_timezones:
-                session.query(CacheDB.NetworkTimezone).filter_by(network_name=x.network_name).delete()
-                session.commit()
+        if not network_timezones:
+            sickrage.app.log.warning('Updating network timezones failed, no timezones received.')
+            return
+
+        self.apply_network_timezones(network_timezones)
+
+    def apply_network_timezones(self, network_timezones):
+        """
+        Diff network timezones against cache db and write the changes in a single transaction, then swap the
+        in-memory map for the new one
+
+        :param network_timezones: dict of network name to timezone name
+        """
+
+        session = sickrage.app.cache_db.session()
+
+        current = dict(session.query(CacheDB.NetworkTimezone.network_name, CacheDB.NetworkTimezone.timezone))
+
+        stale = [network for network in current if network not in network_timezones]
+        changed = [{'network_name': network, 'timezone': timezone} for network, timezone in network_timezones.items()
+                   if network in current and current[network] != timezone]
+        added = [{'network_name': network, 'timezone': timezone} for network, timezone in network_timezones.items()
+                 if network not in current]
 
-        for network, timezone in network_timezones.items():
+        if any([stale, changed, added]):
             try:
-                dbData = session.query(CacheDB.NetworkTimezone).filter_by(network_name=network).one()
-                if dbData.timezone != timezone:
-                    dbData.timezone = timezone
-            except orm.exc.NoResultFound:
-                session.add(CacheDB.NetworkTimezone(**{
-                    'network_name': network,
-                    'timezone': timezone
-                }))
-            finally:
+                # chunked to stay under the bound parameter limit of sqlite
+                for i in range(0, len(stale), 500):
+                    session.query(CacheDB.NetworkTimezone).filter(
+                        CacheDB.NetworkTimezone.network_name.in_(stale[i:i + 500])).delete(synchronize_session=False)
+
+                session.bulk_update_mappings(CacheDB.NetworkTimezone, changed)
+                session.bulk_insert_mappings(CacheDB.NetworkTimezone, added)
                 session.commit()
+            except Exception:
+                session.rollback()
+                raise
+
+            sickrage.app.log.debug('Updated network timezones, {} added, {} changed, {} removed'.format(
+                len(added), len(changed), len(stale)))
+
+        # build the new map before swapping it in so readers only ever see a complete one
+        new_network_timezones = dict((network, gettz(timezone)) for network, timezone in network_timezones.items())
 
-        # cleanup
-        del network_timezones
+        with self.lock:
+            self.network_timezones = new_network_timezones
+
+    def load_network_timezones(self):
+        """Load the network to tzinfo map from cache db into memory"""
+        session = sickrage.app.cache_db.session()
+
+        with self.lock:
+            self.network_timezones = dict((x.network_name, gettz(x.timezone)) for x in session.query(CacheDB.NetworkTimezone))
+
+        return self.network_timezones
 
     def get_network_timezone(self, network):
         """
@@ -94,11 +134,13 @@ class TimeZoneUpdater(object):
         if network is None:
             return sickrage.app.tz
 
-        session = sickrage.app.cache_db.session()
+        network_timezones = self.network_timezones
+        if network_timezones is None:
+            network_timezones = self.load_network_timezones()
 
         try:
-            return tz.gettz(session.query(CacheDB.NetworkTimezone).filter_by(network_name=network).one().timezone)
-        except Exception:
+            return network_timezones[network]
+        except KeyError:
             return sickrage.app.tz
 
     # parse date and time string into local time
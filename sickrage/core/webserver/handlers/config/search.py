@@ -77,6 +77,7 @@ class SaveSearchHandler(BaseHandler, ABC):
         allow_high_priority = self.get_argument('allow_high_priority', None)
         sab_forced = self.get_argument('sab_forced', None)
         randomize_providers = self.get_argument('randomize_providers', None)
+        max_provider_threads = self.get_argument('max_provider_threads', None)
         use_failed_snatcher = self.get_argument('use_failed_snatcher', None)
         failed_snatch_age = self.get_argument('failed_snatch_age', None)
         torrent_dir = self.get_argument('torrent_dir', None)
@@ -120,6 +121,7 @@ class SaveSearchHandler(BaseHandler, ABC):
         sickrage.app.config.require_words = require_words if require_words else ""
         sickrage.app.config.ignored_subs_list = ignored_subs_list if ignored_subs_list else ""
         sickrage.app.config.randomize_providers = checkbox_to_value(randomize_providers)
+        sickrage.app.config.max_provider_threads = max(1, try_int(max_provider_threads, 4))
         sickrage.app.config.enable_rss_cache = checkbox_to_value(enable_rss_cache)
         sickrage.app.config.torrent_file_to_magnet = checkbox_to_value(torrent_file_to_magnet)
         sickrage.app.config.download_unverified_magnet_link = checkbox_to_value(download_unverified_magnet_link)
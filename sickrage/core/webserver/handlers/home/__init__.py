@@ -116,7 +116,7 @@ class HomeHandler(BaseHandler, ABC):
                     'ep_airs_prev': show.airs_prev or datetime.date.min,
                     'ep_snatched': show.episodes_snatched or 0,
                     'ep_downloaded': show.episodes_downloaded or 0,
-                    'ep_total': len(show.episodes),
+                    'ep_total': show.episodes_total,
                     'total_size': show.total_size or 0
                 }
 
@@ -138,7 +138,7 @@ class ShowProgressHandler(BaseHandler, ABC):
 
         episodes_snatched = show.episodes_snatched
         episodes_downloaded = show.episodes_downloaded
-        episodes_total = len(show.episodes) - show.episodes_special - show.episodes_unaired
+        episodes_total = show.episodes_total - show.episodes_special - show.episodes_unaired
         progressbar_percent = int(episodes_downloaded * 100 / episodes_total if episodes_total > 0 else 1)
 
         progress_text = '?'
@@ -1317,18 +1317,10 @@ class GetManualSearchStatusHandler(BaseHandler, ABC):
 
         # Finished Searches
         search_status = 'Finished'
-        for search_thread in sickrage.app.search_queue.MANUAL_SEARCH_HISTORY:
-            if show is not None:
-                if not str(search_thread.show_id) == show:
-                    continue
-
-            if isinstance(search_thread, (ManualSearchQueueItem, FailedQueueItem)):
-                if not [x for x in episodes if x['season'] == search_thread.season and x['episode'] == search_thread.episode]:
-                    episodes += self.get_episodes(int(show), [search_thread], search_status)
-            else:
-                # These are only Failed Downloads/Retry SearchThreadItems.. lets loop through the episodes
-                if not [i for i, j in zip(search_thread, episodes) if i.season == j['season'] and i.episode == j['episode']]:
-                    episodes += self.get_episodes(int(show), [search_thread], search_status)
+        listed = set((x['season'], x['episode']) for x in episodes)
+        for search_thread in sickrage.app.search_queue.MANUAL_SEARCH_HISTORY.get_show(int(show)):
+            if (search_thread.season, search_thread.episode) not in listed:
+                episodes += self.get_episodes(int(show), [search_thread], search_status)
 
         return self.write(json_encode({'episodes': episodes}))
 
@@ -1496,7 +1488,7 @@ class RetryEpisodeHandler(BaseHandler, ABC):
 
         # retrieve the episode object and fail if we can't get one
         # make a queue item for it and put it on the queue
-        ep_queue_item = FailedQueueItem(show, season, episode, bool(int(down_cur_quality)))
+        ep_queue_item = FailedQueueItem(int(show), int(season), int(episode), bool(int(down_cur_quality)))
 
         sickrage.app.io_loop.add_callback(sickrage.app.search_queue.put, ep_queue_item)
         if not all([ep_queue_item.started, ep_queue_item.success]):
@@ -34,6 +34,26 @@
                         </label>
                     </div>
                 </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Concurrent providers')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-stream"></span>
+                                </span>
+                            </div>
+                            <input type="number" min="1" step="1"
+                                   name="max_provider_threads"
+                                   id="max_provider_threads"
+                                   value="${sickrage.app.config.max_provider_threads}"
+                                   title="maximum number of providers searched at the same time (ex. 4)"
+                                   class="form-control"/>
+                        </div>
+                    </div>
+                </div>
                 <div class="form-row form-group">
                     <div class="col-lg-3 col-md-4 col-sm-5">
                         <label class="component-title">${_('Download propers')}</label>
@@ -5,6 +5,8 @@
     from sickrage.core.queues.show import ShowQueueActions
     from sickrage.core.common import dateTimeFormat
     from sickrage.core.helpers import pretty_time_delta
+    from sickrage.core.nameparser import name_parser_cache
+    from sickrage.core.websession import web_session_pool
 %>
 <%block name="content">
     <%
@@ -212,4 +214,134 @@
             </div>
         </div>
     </div>
+
+    <div class="row">
+        <div class="col-lg-10 mx-auto">
+            <div class="card mb-3">
+                <div class="card-header">
+                    <h3>${_('Database')}</h3>
+                </div>
+                <div class="card-body">
+                    <table id="DBStatusTable" class="table" width="100%">
+                        <thead>
+                        <tr>
+                            <th>${_('Database')}</th>
+                            <th>${_('Queue Depth')}</th>
+                            <th>${_('Writes')}</th>
+                            <th>${_('Avg. Wait')}</th>
+                            <th>${_('Avg. Write')}</th>
+                            <th>${_('Max. Write')}</th>
+                        </tr>
+                        </thead>
+                        <tbody>
+                            % for db in [sickrage.app.main_db, sickrage.app.cache_db]:
+                                % if db.writer:
+                                    <% metrics = db.writer.metrics %>
+                                    <tr>
+                                        <td>${db.name}</td>
+                                        <td align="middle">${metrics['queue_depth']}</td>
+                                        <td align="middle">${metrics['writes']}</td>
+                                        <td align="middle">${'{:.3f}s'.format(metrics['avg_wait_time'])}</td>
+                                        <td align="middle">${'{:.3f}s'.format(metrics['avg_write_time'])}</td>
+                                        <td align="middle">${'{:.3f}s'.format(metrics['max_write_time'])}</td>
+                                    </tr>
+                                % endif
+                            % endfor
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <div class="row">
+        <div class="col-lg-10 mx-auto">
+            <div class="card mb-3">
+                <div class="card-header">
+                    <h3>${_('HTTP Connection Pool')}</h3>
+                </div>
+                <div class="card-body">
+                    <table id="HTTPPoolStatusTable" class="table" width="100%">
+                        <thead>
+                        <tr>
+                            <th>${_('Host Pools')}</th>
+                            <th>${_('Hits')}</th>
+                            <th>${_('Misses')}</th>
+                        </tr>
+                        </thead>
+                        <tbody>
+                            <% metrics = web_session_pool.metrics %>
+                            <tr>
+                                <td align="middle">${metrics['pools']}</td>
+                                <td align="middle">${metrics['hits']}</td>
+                                <td align="middle">${metrics['misses']}</td>
+                            </tr>
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <div class="row">
+        <div class="col-lg-10 mx-auto">
+            <div class="card mb-3">
+                <div class="card-header">
+                    <h3>${_('Name Parser Cache')}</h3>
+                </div>
+                <div class="card-body">
+                    <table id="NameParserCacheStatusTable" class="table" width="100%">
+                        <thead>
+                        <tr>
+                            <th>${_('Size')}</th>
+                            <th>${_('Hits')}</th>
+                            <th>${_('Misses')}</th>
+                            <th>${_('Evictions')}</th>
+                        </tr>
+                        </thead>
+                        <tbody>
+                            <% metrics = name_parser_cache.metrics %>
+                            <tr>
+                                <td align="middle">${metrics['size']} / ${metrics['max_size']}</td>
+                                <td align="middle">${metrics['hits']}</td>
+                                <td align="middle">${metrics['misses']}</td>
+                                <td align="middle">${metrics['evictions']}</td>
+                            </tr>
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <div class="row">
+        <div class="col-lg-10 mx-auto">
+            <div class="card mb-3">
+                <div class="card-header">
+                    <h3>${_('QuickSearch Cache')}</h3>
+                </div>
+                <div class="card-body">
+                    <table id="QuicksearchCacheStatusTable" class="table" width="100%">
+                        <thead>
+                        <tr>
+                            <th>${_('Status')}</th>
+                            <th>${_('Progress')}</th>
+                            <th>${_('Shows')}</th>
+                            <th>${_('Episodes')}</th>
+                        </tr>
+                        </thead>
+                        <tbody>
+                            <% progress = sickrage.app.quicksearch_cache.progress %>
+                            <tr>
+                                <td align="middle">${(_('Ready'), _('Building'))[progress['building']]}</td>
+                                <td align="middle">${progress['shows_done']} / ${progress['shows_total']} (${progress['percent']}%)</td>
+                                <td align="middle">${progress['shows']}</td>
+                                <td align="middle">${progress['episodes']}</td>
+                            </tr>
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
 </%block>
@@ -20,14 +20,18 @@
 # ##############################################################################
 import os
 import ssl
+import threading
+from collections import OrderedDict
 from urllib.parse import urlparse
 
 import certifi
 import cfscrape
 import requests
 from cachecontrol import CacheControlAdapter
+from cachecontrol.cache import BaseCache
 from fake_useragent import UserAgent
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.utils import dict_from_cookiejar
 from urllib3 import disable_warnings
 
@@ -43,15 +47,126 @@ def _add_proxies():
         return {"http": address, "https": address}
 
 
+class WebSessionPool(object):
+    """
+    Thread-safe registry of plain transport adapters shared by all web sessions, keyed by host and proxy, so
+    repeated requests to the same host reuse kept-alive connections instead of opening a new one per session.
+    The least recently used host pool is closed once max_pools is reached.
+    """
+
+    pool_connections = 4
+    pool_maxsize = 10
+    max_pools = 64
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.adapters = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def metrics(self):
+        return {
+            'pools': len(self.adapters),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def get_adapter(self, url, proxies=None):
+        parsed = urlparse(url)
+        proxy = (proxies or {}).get(parsed.scheme)
+        key = ('{}://{}'.format(parsed.scheme, parsed.netloc).lower(), proxy)
+
+        with self.lock:
+            adapter = self.adapters.get(key)
+            if adapter:
+                self.adapters.move_to_end(key)
+                self.hits += 1
+                return adapter
+
+            self.misses += 1
+
+            adapter = self.adapters[key] = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+
+            while len(self.adapters) > self.max_pools:
+                __, old_adapter = self.adapters.popitem(last=False)
+                old_adapter.close()
+
+        return adapter
+
+    def clear(self):
+        with self.lock:
+            for adapter in self.adapters.values():
+                adapter.close()
+            self.adapters.clear()
+
+
+class BoundedDictCache(BaseCache):
+    """
+    In memory response cache that evicts the least recently used response once max_size is reached
+    """
+
+    def __init__(self, max_size=50):
+        self.lock = threading.Lock()
+        self.data = OrderedDict()
+        self.max_size = max_size
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.data:
+                return None
+
+            self.data.move_to_end(key)
+            return self.data[key]
+
+    def set(self, key, value, expires=None):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+
+            while len(self.data) > self.max_size:
+                self.data.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.data.pop(key, None)
+
+
+class PooledCacheControlAdapter(CacheControlAdapter):
+    """
+    Caches responses for a single web session, connections are borrowed from the shared web session pool
+    """
+
+    def __init__(self, pool, max_size=50):
+        super(PooledCacheControlAdapter, self).__init__(cache=BoundedDictCache(max_size))
+        self.pool = pool
+
+    def get_connection(self, url, proxies=None):
+        return self.pool.get_adapter(url, proxies).get_connection(url, proxies)
+
+
+web_session_pool = WebSessionPool()
+
+_user_agent = None
+
+
+def random_user_agent():
+    global _user_agent
+    if not _user_agent:
+        _user_agent = UserAgent()
+    return _user_agent.random
+
+
 class WebSession(Session):
     def __init__(self, proxies=None, cache=True, cloudflare=False):
         super(WebSession, self).__init__()
 
-        # setup caching adapter
-        if cache:
-            adapter = CacheControlAdapter()
-            self.mount('http://', adapter)
-            self.mount('https://', adapter)
+        # connections come from the shared adapter pool, only explicitly mounted adapters are kept per session
+        self.adapters.clear()
+        self.cache = cache
+
+        # cached responses are kept per session so they never cross cookies or logins of other sessions
+        self.cache_adapter = PooledCacheControlAdapter(web_session_pool) if cache else None
 
         # add proxies
         self.proxies = proxies or _add_proxies()
@@ -62,6 +177,16 @@ class WebSession(Session):
         # add hooks
         self.hooks['response'] += [WebHooks.log_url]
 
+    def get_adapter(self, url):
+        for prefix, adapter in self.adapters.items():
+            if url.lower().startswith(prefix.lower()):
+                return adapter
+
+        if not url.lower().startswith(('http://', 'https://')):
+            return super(WebSession, self).get_adapter(url)
+
+        return self.cache_adapter or web_session_pool.get_adapter(url, self.proxies)
+
     @staticmethod
     def _get_ssl_cert(verify):
         """
@@ -74,7 +199,7 @@ class WebSession(Session):
 
     def request(self, method, url, verify=False, random_ua=False, allow_post_redirects=False, *args, **kwargs):
         self.headers.update({'Accept-Encoding': 'gzip, deflate',
-                             'User-Agent': (sickrage.app.user_agent, UserAgent().random)[random_ua]})
+                             'User-Agent': random_user_agent() if random_ua else sickrage.app.user_agent})
 
         if not verify:
             disable_warnings()
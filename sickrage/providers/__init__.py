@@ -48,7 +48,7 @@ from sickrage.core.common import MULTI_EP_RESULT, Quality, SEASON_RESULT, cpu_pr
 from sickrage.core.helpers import chmod_as_parent, sanitize_file_name, clean_url, bs4_parser, \
     validate_url, try_int, convert_size
 from sickrage.core.helpers.show_names import all_possible_show_names
-from sickrage.core.nameparser import InvalidNameException, InvalidShowException, NameParser
+from sickrage.core.nameparser import NameParser
 from sickrage.core.tv.show.helpers import find_show
 from sickrage.core.websession import WebSession
 
@@ -308,8 +308,12 @@ class GenericProvider(object):
             # extend the list with the unknown qualities, now sorted at the bottom of the list
             items_list.extend(unknown_items)
 
+        # parse result names in one batch
+        parse_results = NameParser(show_id=show_id).parse_many([self._get_title_and_url(item)[0] for item in item_list])
+
         # filter results
-        for item in item_list:
+        cache_entries = []
+        for item, parse_result in zip(item_list, parse_results):
             provider_result = self.get_result()
 
             provider_result.name, provider_result.url = self._get_title_and_url(item)
@@ -318,10 +322,7 @@ class GenericProvider(object):
             if not validate_url(provider_result.url) and not provider_result.url.startswith('magnet'):
                 continue
 
-            try:
-                parse_result = NameParser(show_id=show_id).parse(provider_result.name)
-            except (InvalidNameException, InvalidShowException) as e:
-                sickrage.app.log.debug("{}".format(e))
+            if not parse_result:
                 continue
 
             provider_result.show_id = parse_result.indexer_id
@@ -332,7 +333,7 @@ class GenericProvider(object):
             provider_result.seeders, provider_result.leechers = self._get_result_stats(item)
 
             sickrage.app.log.debug("Adding item from search to cache: {}".format(provider_result.name))
-            self.cache.add_cache_entry(provider_result.name, provider_result.url, provider_result.seeders, provider_result.leechers, provider_result.size)
+            cache_entries.append((provider_result.name, provider_result.url, provider_result.seeders, provider_result.leechers, provider_result.size))
 
             if not provider_result.show_id:
                 continue
@@ -394,6 +395,8 @@ class GenericProvider(object):
             else:
                 provider_results[int(episode_number)] += [provider_result]
 
+        self.cache.add_cache_entries(cache_entries)
+
         return provider_results
 
     def find_propers(self, show_id, season, episode):
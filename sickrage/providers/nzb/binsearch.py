@@ -89,10 +89,13 @@ class BinSearchCache(TVCache):
             # set updated
             self.last_update = datetime.datetime.today()
 
+            entries = []
             for group in ['alt.binaries.hdtv', 'alt.binaries.hdtv.x264', 'alt.binaries.tv', 'alt.binaries.tvseries']:
                 search_params = {'max': 50, 'g': group}
                 for item in self.get_rss_feed(self.provider.urls['rss'], search_params).get('entries', []):
-                    self._parseItem(item)
+                    entries.append(self._get_cache_entry(item))
+
+            self.add_cache_entries(entries)
 
         return True
 
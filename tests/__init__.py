@@ -137,6 +137,7 @@ class SiCKRAGETestDBCase(SiCKRAGETestCase):
 
     def tearDown(self):
         super(SiCKRAGETestDBCase, self).tearDown()
+        sickrage.app.main_db.dispose()
         if os.path.isfile(sickrage.app.main_db.db_path):
             os.unlink(sickrage.app.main_db.db_path)
 
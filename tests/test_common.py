@@ -26,6 +26,73 @@ import unittest
 
 import tests
 
+# release name, expected quality, expected anime quality
+QUALITY_FIXTURES = [
+    ('Test.Show.S01E02.PDTV.XViD-GROUP', 'SDTV', 'SDTV'),
+    ('Test.Show.S01E02.PDTV.x264-GROUP', 'SDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02.HDTV.XViD-GROUP', 'SDTV', 'SDTV'),
+    ('Test.Show.S01E02.HDTV.x264-GROUP', 'SDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02.DSR.XViD-GROUP', 'SDTV', 'SDTV'),
+    ('Test.Show.S01E02.DSR.x264-GROUP', 'SDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02.TVRip.XViD-GROUP', 'SDTV', 'SDTV'),
+    ('Test.Show.S01E02.TVRip.x264-GROUP', 'SDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02.WEBRip.XViD-GROUP', 'SDTV', 'SDTV'),
+    ('Test.Show.S01E02.WEBRip.x264-GROUP', 'SDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02.WEB-DL.x264-GROUP', 'SDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02.WEB-DL.AAC2.0.H.264-GROUP', 'SDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02 WEB-DL H 264-GROUP', 'SDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02_WEB-DL_H_264-GROUP', 'SDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02.WEB-DL.AAC2.0.H264-GROUP', 'SDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02.DVDRiP.XViD-GROUP', 'SDDVD', 'SDDVD'),
+    ('Test.Show.S01E02.DVDRiP.DiVX-GROUP', 'SDDVD', 'SDDVD'),
+    ('Test.Show.S01E02.DVDRiP.x264-GROUP', 'SDDVD', 'SDDVD'),
+    ('Test.Show.S01E02.DVDRip.WS.XViD-GROUP', 'SDDVD', 'SDDVD'),
+    ('Test.Show.S01E02.DVDRip.WS.DiVX-GROUP', 'SDDVD', 'SDDVD'),
+    ('Test.Show.S01E02.DVDRip.WS.x264-GROUP', 'SDDVD', 'SDDVD'),
+    ('Test.Show.S01E02.BDRIP.XViD-GROUP', 'SDDVD', 'UNKNOWN'),
+    ('Test.Show.S01E02.BDRIP.DiVX-GROUP', 'SDDVD', 'UNKNOWN'),
+    ('Test.Show.S01E02.BDRIP.x264-GROUP', 'SDDVD', 'UNKNOWN'),
+    ('Test.Show.S01E02.BDRIP.WS.XViD-GROUP', 'SDDVD', 'UNKNOWN'),
+    ('Test.Show.S01E02.BDRIP.WS.DiVX-GROUP', 'SDDVD', 'UNKNOWN'),
+    ('Test.Show.S01E02.BDRIP.WS.x264-GROUP', 'SDDVD', 'UNKNOWN'),
+    ('Test.Show.S01E02.720p.HDTV.x264-GROUP', 'HDTV', 'HDTV'),
+    ('Test.Show.S01E02.HR.WS.PDTV.x264-GROUP', 'HDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02.720p.HDTV.DD5.1.MPEG2-GROUP', 'RAWHDTV', 'HDTV'),
+    ('Test.Show.S01E02.1080i.HDTV.DD2.0.MPEG2-GROUP', 'RAWHDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02.1080i.HDTV.H.264.DD2.0-GROUP', 'RAWHDTV', 'UNKNOWN'),
+    ('Test Show - S01E02 - 1080i HDTV MPA1.0 H.264 - GROUP', 'RAWHDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02.1080i.HDTV.DD.5.1.h264-GROUP', 'RAWHDTV', 'UNKNOWN'),
+    ('Test.Show.S01E02.1080p.HDTV.x264-GROUP', 'FULLHDTV', 'FULLHDTV'),
+    ('Test.Show.S01E02.720p.WEB-DL-GROUP', 'HDWEBDL', 'HDTV'),
+    ('Test.Show.S01E02.720p.WEBRip-GROUP', 'HDWEBDL', 'HDTV'),
+    ('Test.Show.S01E02.WEBRip.720p.H.264.AAC.2.0-GROUP', 'HDWEBDL', 'HDTV'),
+    ('Test.Show.S01E02.720p.WEB-DL.AAC2.0.H.264-GROUP', 'HDWEBDL', 'HDTV'),
+    ('Test Show S01E02 720p WEB-DL AAC2 0 H 264-GROUP', 'HDWEBDL', 'HDTV'),
+    ('Test_Show.S01E02_720p_WEB-DL_AAC2.0_H264-GROUP', 'HDWEBDL', 'HDTV'),
+    ('Test.Show.S01E02.720p.WEB-DL.AAC2.0.H264-GROUP', 'HDWEBDL', 'HDTV'),
+    ('Test.Show.S01E02.720p.iTunes.Rip.H264.AAC-GROUP', 'HDWEBDL', 'HDTV'),
+    ('Test.Show.S01E02.720p.AMZN.WEBRip.DDP5.1.x264-GROUP', 'HDWEBDL', 'HDTV'),
+    ('Test.Show.S01E02.1080p.WEB-DL-GROUP', 'FULLHDWEBDL', 'FULLHDTV'),
+    ('Test.Show.S01E02.1080p.WEBRip-GROUP', 'FULLHDWEBDL', 'FULLHDTV'),
+    ('Test.Show.S01E02.WEBRip.1080p.H.264.AAC.2.0-GROUP', 'FULLHDWEBDL', 'FULLHDTV'),
+    ('Test.Show.S01E02.WEBRip.1080p.H264.AAC.2.0-GROUP', 'FULLHDWEBDL', 'FULLHDTV'),
+    ('Test.Show.S01E02.1080p.iTunes.H.264.AAC-GROUP', 'FULLHDWEBDL', 'FULLHDTV'),
+    ('Test Show S01E02 1080p iTunes H 264 AAC-GROUP', 'FULLHDWEBDL', 'FULLHDTV'),
+    ('Test_Show_S01E02_1080p_iTunes_H_264_AAC-GROUP', 'FULLHDWEBDL', 'FULLHDTV'),
+    ('Test.Show.S01E02.720p.BluRay.x264-GROUP', 'HDBLURAY', 'HDBLURAY'),
+    ('Test.Show.S01E02.720p.HDDVD.x264-GROUP', 'HDBLURAY', 'SDDVD'),
+    ('Test.Show.S01E02.1080p.BluRay.x264-GROUP', 'FULLHDBLURAY', 'FULLHDBLURAY'),
+    ('Test.Show.S01E02.1080p.HDDVD.x264-GROUP', 'FULLHDBLURAY', 'SDDVD'),
+    ('Test.Show.S01E02-SICKRAGE', 'UNKNOWN', 'UNKNOWN'),
+    ('Test.Show.S01E02.2160p.HDTV.x265-GROUP', 'UHD_4K_TV', 'UNKNOWN'),
+    ('Test.Show.S01E02.2160p.WEB-DL.DDP5.1.H.265-GROUP', 'UHD_4K_WEBDL', 'UNKNOWN'),
+    ('Test.Show.S01E02.4320p.BluRay.x265-GROUP', 'UHD_8K_BLURAY', 'UNKNOWN'),
+    ('[Group] Test Show - 02 [1080p].mkv', 'UNKNOWN', 'FULLHDTV'),
+    ('[Group] Test Show - 02 [720p BD].mkv', 'UNKNOWN', 'HDBLURAY'),
+    ('[Group] Test Show - 02 [848x480 XviD].avi', 'UNKNOWN', 'SDTV'),
+    ('[Group] Test Show - 02 [DVDRip].mkv', 'UNKNOWN', 'SDDVD'),
+]
+
 
 class QualityTests(tests.SiCKRAGETestCase):
     # TODO: repack / proper ? air-by-date ? season rip? multi-ep?
@@ -117,6 +184,75 @@ class QualityTests(tests.SiCKRAGETestCase):
         self.assertEqual(Quality.UNKNOWN, Quality.name_quality("Test.Show.S01E02-SICKRAGE"))
 
 
+class SceneQualityTests(tests.SiCKRAGETestCase):
+    def test_scene_quality(self):
+        from sickrage.core.common import Quality
+        Quality._scene_quality.cache_clear()
+
+        for name, quality, anime_quality in QUALITY_FIXTURES:
+            for anime, expected in ((False, getattr(Quality, quality)), (True, getattr(Quality, anime_quality))):
+                self.assertEqual(expected, Quality.scene_quality(name, anime), name)
+                # second lookup is served from the memo cache
+                self.assertEqual(expected, Quality.scene_quality(name, anime), name)
+
+        self.assertEqual(len(QUALITY_FIXTURES) * 2, Quality._scene_quality.cache_info().hits)
+
+    def test_cache_is_bounded(self):
+        from sickrage.core.common import Quality, SCENE_QUALITY_CACHE_SIZE
+        Quality._scene_quality.cache_clear()
+
+        for i in range(SCENE_QUALITY_CACHE_SIZE + 100):
+            Quality.scene_quality("Test.Show.S01E{:05d}.720p.HDTV.x264-GROUP".format(i))
+
+        self.assertEqual(SCENE_QUALITY_CACHE_SIZE, Quality._scene_quality.cache_info().currsize)
+
+
+class CompositeStatusTests(tests.SiCKRAGETestCase):
+    @staticmethod
+    def legacy_split_composite_status(status):
+        from sickrage.core.common import Quality, UNKNOWN
+
+        if status == UNKNOWN:
+            return UNKNOWN, Quality.UNKNOWN
+
+        for q in sorted(Quality.qualityStrings.keys(), reverse=True):
+            if status > q * 100:
+                return status - q * 100, q
+
+        return status, Quality.NONE
+
+    def test_split_composite_status(self):
+        from sickrage.core.common import Quality, DOWNLOADED, SNATCHED, WANTED, UNKNOWN
+
+        self.assertEqual((UNKNOWN, Quality.UNKNOWN), Quality.split_composite_status(UNKNOWN))
+        self.assertEqual((WANTED, Quality.NONE), Quality.split_composite_status(WANTED))
+        self.assertEqual((DOWNLOADED, Quality.HDTV), Quality.split_composite_status(Quality.composite_status(DOWNLOADED, Quality.HDTV)))
+        self.assertEqual((SNATCHED, Quality.UNKNOWN), Quality.split_composite_status(Quality.composite_status(SNATCHED, Quality.UNKNOWN)))
+
+        # table lookups and out of table fallbacks decode exactly like the loop did
+        for status in list(range(-5, 3000)) + [100 * Quality.UNKNOWN + x for x in range(-5, 200)]:
+            self.assertEqual(self.legacy_split_composite_status(status), Quality.split_composite_status(status), status)
+
+    def test_split_composite_statuses(self):
+        from sickrage.core.common import Quality, UNKNOWN
+
+        statuses = Quality.DOWNLOADED + Quality.SNATCHED + Quality.ARCHIVED + [UNKNOWN, 3, 0, 5000000]
+        self.assertEqual([self.legacy_split_composite_status(x) for x in statuses], Quality.split_composite_statuses(statuses))
+        self.assertEqual([], Quality.split_composite_statuses([]))
+
+    def test_split_composite_status_table(self):
+        from sickrage.core.common import Quality
+
+        statuses = Quality.DOWNLOADED + Quality.SNATCHED + Quality.ARCHIVED
+        table = Quality._composite_status_table
+
+        # every known composite is decoded by a table lookup rather than the loop
+        self.assertTrue(all(x in table for x in statuses))
+        for status, decoded in zip(statuses, Quality.split_composite_statuses(statuses)):
+            self.assertIs(table[status], decoded)
+            self.assertIs(table[status], Quality.split_composite_status(status))
+
+
 # def test_reverse_parsing(self):
 #        self.assertEqual(Quality.SDTV, Quality.nameQuality("Test Show - S01E02 - SDTV - GROUP"))
 #        self.assertEqual(Quality.SDDVD, Quality.nameQuality("Test Show - S01E02 - SD DVD - GROUP"))
@@ -22,13 +22,18 @@
 
 
 import datetime
+import os
 import threading
+import time
 import unittest
 
 import sickrage
 import tests
 from sickrage.core import MainDB
+from sickrage.core.caches.name_cache import NameCache
+from sickrage.core.databases.cache import CacheDB
 from sickrage.core.common import UNAIRED
+from sickrage.core.databases import QueryCounter
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show import TVShow
 
@@ -82,6 +87,71 @@ class DBBasicTests(tests.SiCKRAGETestDBCase):
 
         self.assertEqual(count, 3)
 
+    def test_batch(self):
+        session = sickrage.app.main_db.session()
+
+        episode_objs = [TVEpisode(0o0001, 1, 1, episode) for episode in range(1, 4)]
+
+        with sickrage.app.main_db.batch():
+            for episode_obj in episode_objs:
+                episode_obj.name = "batched episode"
+                episode_obj.save()
+                episode_obj.save()
+
+            self.assertEqual(session.query(MainDB.TVEpisode).filter_by(name="batched episode").count(), 0)
+
+        self.assertEqual(session.query(MainDB.TVEpisode).filter_by(name="batched episode").count(), 3)
+
+    def test_batch_size_flush(self):
+        session = sickrage.app.main_db.session()
+        sickrage.app.main_db.batch_flush_size = 2
+
+        try:
+            with sickrage.app.main_db.batch():
+                for episode in range(1, 4):
+                    episode_obj = TVEpisode(0o0001, 1, 1, episode)
+                    episode_obj.name = "flushed episode"
+                    episode_obj.save()
+
+                # the first two rows reached the flush size, the third is still pending
+                self.assertEqual(session.query(MainDB.TVEpisode).filter_by(name="flushed episode").count(), 2)
+        finally:
+            sickrage.app.main_db.batch_flush_size = 500
+
+        self.assertEqual(session.query(MainDB.TVEpisode).filter_by(name="flushed episode").count(), 3)
+
+    def test_batch_nested(self):
+        session = sickrage.app.main_db.session()
+
+        with sickrage.app.main_db.batch():
+            with sickrage.app.main_db.batch():
+                episode_obj = TVEpisode(0o0001, 1, 1, 1)
+                episode_obj.name = "nested episode"
+                episode_obj.save()
+
+            # only the outermost batch writes
+            self.assertEqual(session.query(MainDB.TVEpisode).filter_by(name="nested episode").count(), 0)
+
+        self.assertEqual(session.query(MainDB.TVEpisode).filter_by(name="nested episode").count(), 1)
+
+    def test_batch_exception(self):
+        session = sickrage.app.main_db.session()
+
+        with self.assertRaises(ValueError):
+            with sickrage.app.main_db.batch():
+                episode_obj = TVEpisode(0o0001, 1, 1, 1)
+                episode_obj.name = "saved before error"
+                episode_obj.save()
+                raise ValueError
+
+        # rows saved before the error are still written and the batch is closed
+        self.assertEqual(session.query(MainDB.TVEpisode).filter_by(name="saved before error").count(), 1)
+        self.assertFalse(sickrage.app.main_db.queue_update(MainDB.TVEpisode, episode_obj._data_local))
+
+        episode_obj.name = "saved after error"
+        episode_obj.save()
+        self.assertEqual(session.query(MainDB.TVEpisode).filter_by(name="saved after error").count(), 1)
+
     def test_multithread(self):
         threads = []
 
@@ -96,6 +166,240 @@ class DBBasicTests(tests.SiCKRAGETestDBCase):
         for t in threads:
             t.join()
 
+    def test_engine_cached(self):
+        engine = sickrage.app.main_db.engine
+        self.assertIs(sickrage.app.main_db.engine, engine)
+
+        sickrage.app.main_db.dispose()
+        self.assertIsNot(sickrage.app.main_db.engine, engine)
+
+    def test_session_follows_engine_after_dispose(self):
+        sickrage.app.main_db.dispose()
+        engine = sickrage.app.main_db.engine
+
+        session = sickrage.app.main_db.session()
+        self.assertIs(session.get_bind(), engine)
+        self.assertEqual(session.query(MainDB.TVEpisode).count(), 3)
+        self.assertIs(sickrage.app.main_db.engine, engine)
+
+    def test_sqlite_pool_pre_ping_off(self):
+        self.assertFalse(sickrage.app.main_db.db_pool_pre_ping)
+        self.assertFalse(sickrage.app.main_db.engine.pool._pre_ping)
+
+    def test_serialized_writes(self):
+        writes = sickrage.app.main_db.writer.writes
+
+        def write(episode):
+            episode_obj = TVEpisode(0o0001, 1, 2, episode)
+            episode_obj.name = "serialized episode"
+            episode_obj.save()
+
+        threads = [threading.Thread(target=write, args=(episode,)) for episode in range(1, 21)]
+
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        session = sickrage.app.main_db.session()
+        self.assertEqual(session.query(MainDB.TVEpisode).filter_by(name="serialized episode").count(), 20)
+        self.assertGreater(sickrage.app.main_db.writer.writes, writes)
+        self.assertEqual(sickrage.app.main_db.writer.queue_depth, 0)
+
+    def test_writer_released_on_rollback(self):
+        writer = sickrage.app.main_db.writer
+        session = sickrage.app.main_db.session()
+
+        session.query(MainDB.TVEpisode).filter_by(episode=1).update({'name': 'rolled back'})
+        self.assertIsNotNone(writer._owner)
+
+        # the scoped session is not removed, the rollback returns its connection and hands the slot on
+        session.rollback()
+        self.assertIsNone(writer._owner)
+
+    def test_writer_held_until_commit_returns(self):
+        writer = sickrage.app.main_db.writer
+        dialect = sickrage.app.main_db.engine.dialect
+        do_commit = dialect.do_commit
+        commits = []
+
+        def record_commit(dbapi_connection):
+            do_commit(dbapi_connection)
+            commits.append((threading.get_ident(), writer._owner))
+
+        def write():
+            session = sickrage.app.main_db.session()
+            session.query(MainDB.TVEpisode).filter_by(episode=1).update({'name': 'second'})
+            session.commit()
+            sickrage.app.main_db.session.remove()
+
+        dialect.do_commit = record_commit
+        try:
+            session = sickrage.app.main_db.session()
+            session.query(MainDB.TVEpisode).filter_by(episode=1).update({'name': 'first'})
+
+            thread = threading.Thread(target=write)
+            thread.start()
+            while thread.is_alive() and not writer.queue_depth:
+                time.sleep(0.01)
+
+            # the queued writer is only let in once the first COMMIT has returned
+            session.commit()
+            thread.join()
+        finally:
+            del dialect.do_commit
+
+        self.assertEqual((threading.get_ident(), threading.get_ident()), commits[0])
+        self.assertEqual(2, len(commits))
+        self.assertIsNone(writer._owner)
+
+    def test_writer_timeout_once_per_checkout(self):
+        writer = sickrage.app.main_db.writer
+        writer.timeout = 0.1
+        timeouts = writer.timeouts
+
+        def write():
+            session = sickrage.app.main_db.session()
+            session.query(MainDB.TVEpisode).filter_by(episode=1).update({'name': 'first'})
+            session.query(MainDB.TVEpisode).filter_by(episode=2).update({'name': 'second'})
+            session.commit()
+            sickrage.app.main_db.session.remove()
+
+        writer.acquire()
+        try:
+            thread = threading.Thread(target=write)
+            thread.start()
+            thread.join()
+        finally:
+            writer.release()
+            writer.timeout = 60
+
+        self.assertEqual(writer.timeouts, timeouts + 1)
+        self.assertIsNone(writer._owner)
+
+
+class CacheDBTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(CacheDBTests, self).setUp()
+        sickrage.app.cache_db = CacheDB(db_type='sqlite',
+                                        db_prefix='sickrage',
+                                        db_host='localhost',
+                                        db_port='3306',
+                                        db_username='sickrage',
+                                        db_password='sickrage')
+
+    def tearDown(self):
+        super(CacheDBTests, self).tearDown()
+        sickrage.app.cache_db.dispose()
+        if os.path.isfile(sickrage.app.cache_db.db_path):
+            os.unlink(sickrage.app.cache_db.db_path)
+
+    def _provider_row(self, url, season, episodes, **kwargs):
+        row = {
+            'provider': 'testprovider',
+            'name': 'Show.Name.S{:02d}.720p.HDTV.x264-GROUP'.format(season),
+            'season': season,
+            'episodes': '|' + '|'.join(map(str, episodes)) + '|',
+            'series_id': 1,
+            'url': url,
+            'time': 0,
+            'quality': 4,
+            'release_group': 'GROUP',
+            'version': -1,
+            'seeders': 0,
+            'leechers': 0,
+            'size': -1
+        }
+        row.update(kwargs)
+        return row
+
+    def _lookup(self, season, episode):
+        session = sickrage.app.cache_db.session()
+        return [x.url for x in session.query(CacheDB.Provider).join(
+            CacheDB.ProviderEpisode, CacheDB.ProviderEpisode.provider_row_id == CacheDB.Provider.id).filter(
+            CacheDB.Provider.provider == 'testprovider',
+            CacheDB.ProviderEpisode.series_id == 1,
+            CacheDB.ProviderEpisode.season == season,
+            CacheDB.ProviderEpisode.episode == episode)]
+
+    def test_upsert_providers(self):
+        sickrage.app.cache_db.upsert_providers([
+            self._provider_row('http://test/1', 1, [1, 2]),
+            self._provider_row('http://test/2', 1, [2]),
+        ])
+
+        self.assertEqual(self._lookup(1, 1), ['http://test/1'])
+        self.assertEqual(sorted(self._lookup(1, 2)), ['http://test/1', 'http://test/2'])
+        self.assertEqual(self._lookup(1, 12), [])
+
+        # same url again updates the existing row and its episodes
+        sickrage.app.cache_db.upsert_providers([self._provider_row('http://test/1', 1, [3], seeders=10)])
+
+        session = sickrage.app.cache_db.session()
+        self.assertEqual(session.query(CacheDB.Provider).filter_by(url='http://test/1').count(), 1)
+        self.assertEqual(session.query(CacheDB.Provider).filter_by(url='http://test/1').one().seeders, 10)
+        self.assertEqual(self._lookup(1, 1), [])
+        self.assertEqual(self._lookup(1, 3), ['http://test/1'])
+
+    def test_delete_providers(self):
+        sickrage.app.cache_db.upsert_providers([
+            self._provider_row('http://test/1', 1, [1, 2]),
+            self._provider_row('http://other/1', 1, [1], provider='otherprovider'),
+        ])
+        sickrage.app.cache_db.delete_providers('testprovider')
+
+        # episode rows go with their provider rows, other providers are untouched
+        session = sickrage.app.cache_db.session()
+        self.assertEqual([x.url for x in session.query(CacheDB.Provider)], ['http://other/1'])
+        self.assertEqual([x.provider_row_id for x in session.query(CacheDB.ProviderEpisode)],
+                         [session.query(CacheDB.Provider).one().id])
+
+    def test_name_cache_save_dirty(self):
+        name_cache = NameCache()
+        name_cache.put('Show Name', 1)
+        name_cache.put('Other Show', 2)
+        name_cache.save()
+
+        session = sickrage.app.cache_db.session()
+        self.assertEqual(dict(session.query(CacheDB.SceneName.name, CacheDB.SceneName.indexer_id)),
+                         {'show name': 1, 'other show': 2})
+
+        # unchanged names are not written again, changed ones are updated in place
+        name_cache.put('Other Show', 2)
+        self.assertEqual(name_cache.dirty, set())
+
+        name_cache.put('Other Show', 3)
+        self.assertEqual(name_cache.dirty, {'other show'})
+
+        name_cache.save()
+        self.assertEqual(session.query(CacheDB.SceneName).filter_by(name='other show').count(), 1)
+        self.assertEqual(session.query(CacheDB.SceneName).filter_by(name='other show').one().indexer_id, 3)
+
+        reloaded = NameCache()
+        reloaded.load()
+        self.assertEqual(reloaded.cache, name_cache.cache)
+
+    def test_name_cache_save_queries(self):
+        names = ['Scene Name {}'.format(i) for i in range(2000)]
+
+        name_cache = NameCache()
+        for i, name in enumerate(names):
+            name_cache.put(name, i)
+
+        # names are written in chunks, not one lookup per name
+        with QueryCounter() as query_counter:
+            name_cache.save()
+
+        session = sickrage.app.cache_db.session()
+        self.assertEqual(session.query(CacheDB.SceneName).count(), len(names))
+        self.assertLess(query_counter.count, len(names) / 100)
+
+        # nothing changed since the last save, nothing to write
+        with QueryCounter() as query_counter:
+            name_cache.save()
+        self.assertEqual(query_counter.count, 0)
+
 
 if __name__ == '__main__':
     print("==================")
@@ -27,7 +27,9 @@ import unittest
 from datetime import date
 
 import tests
-from sickrage.core.nameparser import ParseResult, NameParser, InvalidNameException, InvalidShowException
+from sickrage.core import nameparser
+from sickrage.core.nameparser import ParseResult, NameParser, InvalidNameException, InvalidShowException, compile_regexes, \
+    NameParserCache, name_parser_cache
 from sickrage.core.tv.show import TVShow
 
 DEBUG = VERBOSE = False
@@ -444,6 +446,155 @@ class BasicTests(tests.SiCKRAGETestDBCase):
         pass
 
 
+class RegexCacheTests(tests.SiCKRAGETestDBCase):
+    def test_shared_regexes(self):
+        self.assertIs(NameParser(validate_show=False).compiled_regexes, NameParser(validate_show=False).compiled_regexes)
+        self.assertIsNot(compile_regexes(NameParser.NORMAL_REGEX), compile_regexes(NameParser.ANIME_REGEX))
+        self.assertEqual(len(compile_regexes(NameParser.ALL_REGEX)),
+                         len(compile_regexes(NameParser.NORMAL_REGEX)) + len(compile_regexes(NameParser.ANIME_REGEX)))
+
+    def test_compiled_once(self):
+        nameparser._compiled_regexes.clear()
+
+        parsers = [NameParser(validate_show=False) for __ in range(10)]
+
+        # only the first parser compiles, the rest reuse its patterns
+        self.assertEqual([NameParser.ALL_REGEX], list(nameparser._compiled_regexes))
+        self.assertTrue(all(p.compiled_regexes is parsers[0].compiled_regexes for p in parsers))
+
+
+def release_names_fixture():
+    """
+    Builds ~10k release names in the formats seen on indexer feeds, scene episodes, multi episodes, daily shows,
+    season packs and anime fansub releases
+    """
+    shows = ['The Big Bang Theory', 'Game of Thrones', 'Breaking Bad', 'The Walking Dead', 'Doctor Who 2005', 'Greys Anatomy',
+             'The Simpsons', 'Family Guy', 'Brooklyn Nine-Nine', 'Its Always Sunny in Philadelphia', 'Last Week Tonight with John Oliver',
+             'The Daily Show', 'Marvels Agents of S.H.I.E.L.D.', 'One Piece', 'Naruto Shippuden']
+    groups = ['LOL', 'DIMENSION', 'KILLERS', 'SVA', 'NTb', 'AVS', 'CtrlHD', 'HorribleSubs']
+    formats = ['{show}.S{season:02d}E{episode:02d}.720p.HDTV.x264-{group}',
+               '{show}.S{season:02d}E{episode:02d}.1080p.WEB.H264-{group}',
+               '{show}.{season}x{episode:02d}.HDTV.XviD-{group}',
+               '{show}.S{season:02d}E{episode:02d}E{next_episode:02d}.720p.WEB-DL.DD5.1.H.264-{group}',
+               '{show}.{year}.{month:02d}.{day:02d}.720p.HDTV.x264-{group}',
+               '{show}.S{season:02d}.1080p.BluRay.x264-{group}',
+               '[{group}] {show} - {absolute:03d} [720p].mkv']
+
+    names = []
+    for number in range(1, 97):
+        for show_num, show in enumerate(shows):
+            for fmt in formats:
+                names.append(fmt.format(show=show.replace(' ', '.') if not fmt.startswith('[') else show,
+                                        season=number // 24 + 1 + show_num % 3,
+                                        episode=number % 24 + 1,
+                                        next_episode=number % 24 + 2,
+                                        absolute=number + show_num * 100,
+                                        year=2010 + number % 10,
+                                        month=number % 12 + 1,
+                                        day=number % 28 + 1,
+                                        group=groups[(number + show_num) % len(groups)]))
+
+    return names
+
+
+class ParseManyTests(tests.SiCKRAGETestDBCase):
+    def test_parse_many_order(self):
+        names = ['Show.Name.S01E02.Source.Quality.Etc-Group', 'not a release name', 'Show Name - S06E01 - 2009-12-20 - Ep Name']
+        results = NameParser(validate_show=False, naming_pattern=True).parse_many(names)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0].episode_numbers, [2])
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2].season_number, 6)
+
+    def test_parse_many_matches_parse(self):
+        names = release_names_fixture()
+        sample = names[::len(names) // 100]
+
+        np = NameParser(validate_show=False, naming_pattern=True)
+
+        sequential_results = []
+        for name in sample:
+            try:
+                sequential_results.append(np.parse(name))
+            except InvalidNameException:
+                sequential_results.append(None)
+
+        batch_results = np.parse_many(names)
+
+        self.assertEqual(len(batch_results), len(names))
+        self.assertEqual([str(x) for x in batch_results[::len(names) // 100]], [str(x) for x in sequential_results])
+
+    def test_small_batch_matched_in_process(self):
+        names = release_names_fixture()[:nameparser.PARSE_POOL_MIN_BATCH - 1]
+
+        matches, pooled = nameparser.match_names(names, NameParser.ALL_REGEX)
+
+        # small batches skip the pool, so parsing them still pays the per name CPU sleep
+        self.assertFalse(pooled)
+        self.assertEqual(set(names), set(matches))
+
+
+class NameParserCacheTests(tests.SiCKRAGETestDBCase):
+    def test_lru_eviction(self):
+        cache = NameParserCache(max_size=2)
+        cache.add(('a',), 1)
+        cache.add(('b',), 2)
+
+        # touching a makes b the least recently used entry
+        self.assertEqual(cache.get(('a',)), 1)
+        cache.add(('c',), 3)
+
+        self.assertIsNone(cache.get(('b',)))
+        self.assertEqual(cache.get(('a',)), 1)
+        self.assertEqual(cache.get(('c',)), 3)
+        self.assertEqual(cache.metrics['hits'], 3)
+        self.assertEqual(cache.metrics['misses'], 1)
+        self.assertEqual(cache.metrics['evictions'], 1)
+
+        cache.resize(1)
+        self.assertEqual(cache.metrics['size'], 1)
+        self.assertEqual(cache.metrics['evictions'], 2)
+
+    def test_invalidate_on_show_change(self):
+        show = TVShow(1, 1, 'en')
+        show.name = 'Show Name'
+
+        show_key = ('Show.Name.S01E01', False, True, True, None)
+        other_key = ('Other.Show.S01E01', False, True, True, None)
+
+        name_parser_cache.add(show_key, ParseResult('Show.Name.S01E01', indexer_id=1))
+        name_parser_cache.add(other_key, ParseResult('Other.Show.S01E01', indexer_id=2))
+        show.name = 'Show Name'
+        self.assertIsNotNone(name_parser_cache.get(show_key))
+
+        # only the renamed show's parse results are dropped
+        show.name = 'Other Show Name'
+        self.assertIsNone(name_parser_cache.get(show_key))
+        self.assertIsNotNone(name_parser_cache.get(other_key))
+
+        name_parser_cache.add(show_key, ParseResult('Show.Name.S01E01', indexer_id=1))
+        show.scene_exceptions = {'Show Name|-1', 'Alias|1'}
+        self.assertIsNone(name_parser_cache.get(show_key))
+
+        # the same exceptions in a different order are not a change
+        name_parser_cache.add(show_key, ParseResult('Show.Name.S01E01', indexer_id=1))
+        show.scene_exceptions = ['Alias|1', 'Show Name|-1']
+        self.assertIsNotNone(name_parser_cache.get(show_key))
+
+    def test_invalidate_show(self):
+        cache = NameParserCache()
+        cache.add(('a', False, True, True, None), ParseResult('a', indexer_id=1))
+        cache.add(('b', False, True, True, 1), ParseResult('b', indexer_id=1))
+        cache.add(('c', False, True, True, None), ParseResult('c', indexer_id=2))
+
+        cache.invalidate(1)
+        self.assertEqual([('c', False, True, True, None)], list(cache.data))
+
+        cache.invalidate()
+        self.assertEqual(0, cache.metrics['size'])
+
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - NAME PARSER TESTS")
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import threading
+import time
+import unittest
+
+from tornado.ioloop import IOLoop
+
+import sickrage
+import tests
+from sickrage.core.queues import SRQueue, SRQueueItem
+from sickrage.core.queues.search import BacklogQueueItem, ManualSearchQueueItem, SearchHistory, SearchQueue
+from sickrage.core.queues.show import QueueItemForceUpdate, QueueItemRefresh, ShowQueue
+
+
+class SleepQueueItem(SRQueueItem):
+    lock = threading.Lock()
+    running = peak = 0
+
+    def __init__(self, delay, finished):
+        super(SleepQueueItem, self).__init__('Sleep')
+        self.delay = delay
+        self.finished = finished
+
+    def run(self):
+        with self.lock:
+            SleepQueueItem.running += 1
+            SleepQueueItem.peak = max(SleepQueueItem.peak, SleepQueueItem.running)
+
+        time.sleep(self.delay)
+
+        with self.lock:
+            SleepQueueItem.running -= 1
+        self.finished.append(self)
+
+
+class SRQueueTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(SRQueueTests, self).setUp()
+        sickrage.app.io_loop = IOLoop.current()
+        sickrage.app.config.max_queue_workers = 5
+
+        self.queue = SRQueue('TESTQUEUE')
+        self.finished = []
+
+    def wait_for(self, condition, timeout=10):
+        async def wait():
+            start = time.time()
+            while not condition() and time.time() - start < timeout:
+                await sickrage.app.io_loop.run_in_executor(None, time.sleep, 0.01)
+
+        sickrage.app.io_loop.run_sync(wait)
+
+    def test_burst_dispatches_to_free_workers(self):
+        self.queue.start()
+
+        items = [SleepQueueItem(0.2, self.finished) for __ in range(20)]
+
+        async def put_all():
+            for item in items:
+                await self.queue.put(item)
+            return len(self.queue.processing)
+
+        SleepQueueItem.peak = 0
+        started = sickrage.app.io_loop.run_sync(put_all)
+        self.wait_for(lambda: len(self.finished) == len(items))
+
+        # every free worker slot is filled straight away, at most max_queue_workers run at once
+        self.assertEqual(5, started)
+        self.assertEqual(len(items), len(self.finished))
+        self.assertEqual(5, SleepQueueItem.peak)
+        self.assertFalse(self.queue.is_busy)
+
+    def test_paused_queue_dispatches_on_unpause(self):
+        self.queue.start()
+        self.queue.pause()
+
+        sickrage.app.io_loop.run_sync(lambda: self.queue.put(SleepQueueItem(0, self.finished)))
+        self.assertEqual([], self.queue.processing)
+
+        self.queue.unpause()
+        self.wait_for(lambda: len(self.finished) == 1)
+        self.assertEqual(1, len(self.finished))
+
+    def test_worker_threads_named_after_item(self):
+        names = []
+
+        class NamedQueueItem(SRQueueItem):
+            def run(self):
+                names.append(threading.currentThread().getName())
+
+        self.queue.start()
+        sickrage.app.io_loop.run_sync(lambda: self.queue.put(NamedQueueItem('Named')))
+        self.wait_for(lambda: names)
+
+        self.assertEqual(['TESTQUEUE-NAMED'], names)
+
+
+class QueueMembershipTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(QueueMembershipTests, self).setUp()
+        sickrage.app.io_loop = IOLoop.current()
+
+    def queue_item(self, queue, item):
+        # bypass the search queue provider checks, the queue is never started so items stay queued
+        return sickrage.app.io_loop.run_sync(lambda: SRQueue.put(queue, item))
+
+    def test_search_queue_membership(self):
+        queue = SearchQueue()
+
+        backlog_item = self.queue_item(queue, BacklogQueueItem(1, 1, 2))
+        manual_item = self.queue_item(queue, ManualSearchQueueItem(2, 3, 4))
+
+        self.assertTrue(queue.is_in_queue(1, 1, 2))
+        self.assertFalse(queue.is_in_queue(1, 1, 3))
+        self.assertTrue(queue.is_ep_in_queue(3, 4))
+        self.assertTrue(queue.is_show_in_queue(2))
+        self.assertFalse(queue.is_show_in_queue(1))
+        self.assertTrue(queue.is_backlog_in_progress())
+        self.assertTrue(queue.is_manual_search_in_progress())
+        self.assertFalse(queue.is_dailysearch_in_progress())
+        self.assertEqual({'backlog': 1, 'daily': 0, 'manual': 1, 'failed': 0}, queue.queue_length())
+
+        queue.remove(backlog_item)
+        queue.remove(manual_item)
+        queue.remove(manual_item)
+
+        self.assertFalse(queue.is_in_queue(1, 1, 2))
+        self.assertFalse(queue.is_show_in_queue(2))
+        self.assertEqual({'backlog': 0, 'daily': 0, 'manual': 0, 'failed': 0}, queue.queue_length())
+
+    def test_show_queue_membership(self):
+        queue = ShowQueue()
+
+        refresh_item = self.queue_item(queue, QueueItemRefresh(1))
+        update_item = self.queue_item(queue, QueueItemForceUpdate(1))
+        second_update_item = self.queue_item(queue, QueueItemForceUpdate(1))
+
+        self.assertTrue(queue._is_in_queue(1))
+        self.assertTrue(queue.is_being_refreshed(1))
+        self.assertTrue(queue.is_being_updated(1))
+        self.assertFalse(queue.is_being_updated(2))
+        self.assertTrue(queue.is_queued(update_item))
+
+        queue.remove(update_item)
+        self.assertTrue(queue.is_being_updated(1))
+        self.assertFalse(queue.is_queued(update_item))
+
+        queue.remove(second_update_item)
+        self.assertFalse(queue.is_being_updated(1))
+        self.assertTrue(queue._is_in_queue(1))
+
+        queue.remove(refresh_item)
+        self.assertFalse(queue._is_in_queue(1))
+
+
+class SearchHistoryTests(tests.SiCKRAGETestCase):
+    def test_bounded(self):
+        history = SearchHistory(max_size=3)
+
+        for episode in range(1, 6):
+            history.add((1, 1, episode))
+
+        self.assertEqual(3, len(history))
+        self.assertEqual([(1, 1, 3), (1, 1, 4), (1, 1, 5)], list(history))
+        self.assertNotIn((1, 1, 1), history)
+        self.assertEqual(3, len(history.get_show(1)))
+
+    def test_deduplicated(self):
+        history = SearchHistory(max_size=3)
+
+        history.add((1, 1, 1), 'first')
+        history.add((2, 1, 1), 'other')
+        history.add((1, 1, 1), 'second')
+        history.add((3, 1, 1))
+        history.add((4, 1, 1))
+
+        # re-adding an episode refreshes it, so the other show is evicted first
+        self.assertEqual([(1, 1, 1), (3, 1, 1), (4, 1, 1)], list(history))
+        self.assertEqual('second', history.get((1, 1, 1)))
+        self.assertEqual(['second'], history.get_show(1))
+        self.assertEqual([], history.get_show(2))
+
+    def test_remove(self):
+        history = SearchHistory()
+
+        history.add((1, 1, 1), 'item')
+        history.remove((1, 1, 1))
+        history.remove((1, 1, 1))
+
+        self.assertNotIn((1, 1, 1), history)
+        self.assertEqual([], history.get_show(1))
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - QUEUE TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import datetime
+import os
+import random
+import threading
+import unittest
+
+import sickrage
+import tests
+from sickrage.core.caches.quicksearch_cache import QuicksearchIndex, QuicksearchCache
+from sickrage.core.common import UNAIRED
+from sickrage.core.databases.cache import CacheDB
+from sickrage.core.databases.main import MainDB
+from sickrage.core.tv.show import TVShow
+
+
+class QuicksearchIndexTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(QuicksearchIndexTests, self).setUp()
+
+        self.index = QuicksearchIndex()
+        self.index.add(1, "The Office")
+        self.index.add(2, "Office Space")
+        self.index.add(3, "Officer Down")
+        self.index.add(4, "Back Office")
+        self.index.add(5, None)
+
+    def test_substring_search(self):
+        self.assertEqual([2, 3, 1, 4], self.index.search("office"))
+        self.assertEqual([3], self.index.search("fficer"))
+        self.assertEqual([], self.index.search("ffices"))
+        self.assertNotIn(5, self.index)
+
+    def test_ranking(self):
+        self.index.add(6, "office")
+        self.assertEqual([6, 2, 3, 1, 4], self.index.search("OFFICE"))
+        self.assertEqual([2, 3], self.index.search("office", limit=3)[1:])
+
+    def test_short_terms_match_word_prefixes(self):
+        self.assertEqual([2, 3, 1], self.index.search("o", limit=3))
+        self.assertEqual([2], self.index.search("sp"))
+        self.assertEqual([], self.index.search("ff"))
+
+    def test_incremental_updates(self):
+        self.index.add(1, "Parks and Recreation")
+        self.assertEqual([2, 3, 4], self.index.search("office"))
+        self.assertEqual([1], self.index.search("recreation"))
+
+        self.index.remove(2)
+        self.index.remove(2)
+        self.assertEqual([3, 4], self.index.search("office"))
+        self.assertNotIn("e s", self.index.trigrams)
+
+    def test_add_many(self):
+        self.index.add_many([(1, "Parks and Recreation"), (6, "Office"), (6, "The Office Christmas Special")])
+        self.assertEqual(5, len(self.index))
+        self.assertEqual(len(self.index), len(self.index.sorted_names))
+        self.assertEqual([2, 3, 4, 6], self.index.search("office"))
+
+    def test_search_matches_scan(self):
+        words = ["the", "night", "of", "return", "king", "office", "space", "doctor", "pilot", "finale", "part",
+                 "lost", "city", "storm", "dragon", "winter", "house", "secret", "game", "blood"]
+
+        random.seed(42)
+        names = [" ".join(random.choice(words) for __ in range(random.randint(2, 5))) for __ in range(5000)]
+        self.index.add_many(enumerate(names))
+
+        for term in ["dragon ki", "secret game", "ter sto", "pilot", "ni"]:
+            result = self.index.search(term)
+            scan = [x for x in names if term in x.lower()]
+
+            self.assertLessEqual(len(result), 50)
+            self.assertTrue(all(term in self.index.names[x] for x in result))
+            if len(term) >= 3:
+                self.assertEqual(min(len(scan), 50), len(result))
+
+
+class QuicksearchCacheTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(QuicksearchCacheTests, self).setUp()
+        sickrage.app.cache_db = CacheDB(db_type='sqlite',
+                                        db_prefix='sickrage',
+                                        db_host='localhost',
+                                        db_port='3306',
+                                        db_username='sickrage',
+                                        db_password='sickrage')
+
+        session = sickrage.app.main_db.session()
+        session.add(MainDB.TVShow(**{'indexer_id': 0o001, 'indexer': 1, 'lang': 'en', 'name': 'show name'}))
+        session.commit()
+
+        for episode in range(1, 51):
+            session.add(MainDB.TVEpisode(**{'showid': 0o001, 'indexer': 1, 'season': 1, 'episode': episode, 'indexer_id': episode,
+                                            'name': 'test episode {}'.format(episode), 'airdate': datetime.date.fromordinal(733832),
+                                            'status': UNAIRED}))
+        session.commit()
+
+        self.show = TVShow(0o001, 1)
+        sickrage.app.shows = {(0o001, 1): self.show}
+
+        self.quicksearch_cache = QuicksearchCache()
+
+    def tearDown(self):
+        super(QuicksearchCacheTests, self).tearDown()
+        sickrage.app.shows = {}
+        sickrage.app.cache_db.dispose()
+        if os.path.isfile(sickrage.app.cache_db.db_path):
+            os.unlink(sickrage.app.cache_db.db_path)
+
+    def test_update_show_only_touches_changed_episodes(self):
+        self.quicksearch_cache.update_show(0o001)
+        self.assertEqual(50, len(self.quicksearch_cache.cache['episodes']))
+
+        unchanged = self.quicksearch_cache.cache['episodes'][(0o001, 1, 20)]
+
+        episode = self.show.get_episode(1, 10)
+        episode.name = 'renamed episode'
+        episode.save()
+
+        self.quicksearch_cache.update_show(0o001)
+
+        self.assertIs(unchanged, self.quicksearch_cache.cache['episodes'][(0o001, 1, 20)])
+        self.assertEqual([10], [x['episodeid'] for x in self.quicksearch_cache.get_episodes('renamed')])
+        self.assertEqual([], self.quicksearch_cache.get_episodes('test episode 10'))
+
+        # the database copy matches the in-memory cache
+        reloaded = QuicksearchCache()
+        reloaded.load()
+        self.assertEqual(self.quicksearch_cache.cache, reloaded.cache)
+
+    def test_del_show(self):
+        self.quicksearch_cache.update_show(0o001)
+        self.quicksearch_cache.del_show(0o001)
+
+        self.assertEqual({}, self.quicksearch_cache.cache['episodes'])
+        self.assertEqual([], self.quicksearch_cache.get_shows('show name'))
+
+    def test_concurrent_updates(self):
+        errors = []
+
+        def update():
+            try:
+                self.quicksearch_cache.update_show(0o001)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=update) for __ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(50, len(self.quicksearch_cache.cache['episodes']))
+        self.assertEqual(50, sickrage.app.cache_db.session().query(CacheDB.QuickSearchEpisode).count())
+
+    def test_failed_write_keeps_index(self):
+        self.quicksearch_cache.update_show(0o001)
+
+        # a database row the cache does not know about makes the insert of the new episode fail
+        session = sickrage.app.main_db.session()
+        session.add(MainDB.TVEpisode(**{'showid': 0o001, 'indexer': 1, 'season': 1, 'episode': 51, 'indexer_id': 51,
+                                        'name': 'new episode', 'airdate': datetime.date.fromordinal(733832), 'status': UNAIRED}))
+        session.commit()
+        self.show.load_episodes_from_db()
+
+        cache_session = sickrage.app.cache_db.session()
+        cache_session.add(CacheDB.QuickSearchEpisode(**{'category': 'episodes', 'showid': 0o001, 'episodeid': 51, 'season': 1,
+                                                        'episode': 51, 'name': 'conflicting episode'}))
+        cache_session.commit()
+
+        self.assertRaises(Exception, self.quicksearch_cache.update_show, 0o001)
+        self.assertNotIn((0o001, 1, 51), self.quicksearch_cache.cache['episodes'])
+        self.assertEqual([], self.quicksearch_cache.get_episodes('new episode'))
+
+        # the session was rolled back and is usable again
+        cache_session.query(CacheDB.QuickSearchEpisode).filter_by(episodeid=51).delete()
+        cache_session.commit()
+
+        self.quicksearch_cache.update_show(0o001)
+        self.assertEqual([51], [x['episodeid'] for x in self.quicksearch_cache.get_episodes('new episode')])
+
+    def test_episodes_without_indexer_id(self):
+        session = sickrage.app.main_db.session()
+        session.add(MainDB.TVShow(**{'indexer_id': 0o002, 'indexer': 1, 'lang': 'en', 'name': 'other show'}))
+        for showid, episode in [(0o001, 51), (0o002, 1), (0o002, 2)]:
+            session.add(MainDB.TVEpisode(**{'showid': showid, 'indexer': 1, 'season': 1, 'episode': episode, 'indexer_id': 0,
+                                            'name': 'unknown episode {}'.format(episode),
+                                            'airdate': datetime.date.fromordinal(733832), 'status': UNAIRED}))
+        session.commit()
+
+        self.show.load_episodes_from_db()
+        sickrage.app.shows[(0o002, 1)] = TVShow(0o002, 1)
+
+        # episodes sharing indexer id 0 are kept apart per show and per episode
+        for indexer_id in (0o001, 0o002, 0o001, 0o002):
+            self.quicksearch_cache.update_show(indexer_id)
+
+        self.assertEqual(53, len(self.quicksearch_cache.cache['episodes']))
+        self.assertEqual(53, sickrage.app.cache_db.session().query(CacheDB.QuickSearchEpisode).count())
+        self.assertEqual(['unknown episode 1', 'unknown episode 2', 'unknown episode 51'],
+                         sorted(x['name'] for x in self.quicksearch_cache.get_episodes('unknown episode')))
+
+        reloaded = QuicksearchCache()
+        reloaded.load()
+        self.assertEqual(self.quicksearch_cache.cache, reloaded.cache)
+
+    def test_background_build(self):
+        self.quicksearch_cache.build()
+        self.quicksearch_cache.build_thread.join(30)
+
+        progress = self.quicksearch_cache.progress
+        self.assertFalse(progress['building'])
+        self.assertEqual(100, progress['percent'])
+        self.assertEqual((1, 50), (progress['shows'], progress['episodes']))
+        self.assertEqual([0o001], [x['showid'] for x in self.quicksearch_cache.get_shows('show')])
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - QUICKSEARCH CACHE TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
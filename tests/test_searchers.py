@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import datetime
+import unittest
+
+import sickrage
+import tests
+from sickrage.core.common import DOWNLOADED, SKIPPED, SNATCHED, UNAIRED, WANTED, Quality
+from sickrage.core.databases import QueryCounter
+from sickrage.core.databases.main import MainDB
+from sickrage.core.searchers import get_wanted_episodes, wanted_composite_statuses
+from sickrage.core.tv.show import TVShow
+
+
+class WantedEpisodesTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(WantedEpisodesTests, self).setUp()
+        self.today = datetime.date.today()
+
+        session = sickrage.app.main_db.session()
+        session.add(MainDB.TVShow(**{'indexer_id': 1, 'indexer': 1, 'lang': 'en', 'name': 'show one', 'quality': Quality.HDTV}))
+        session.add(MainDB.TVShow(**{'indexer_id': 2, 'indexer': 1, 'lang': 'en', 'name': 'show two', 'quality': Quality.HDTV,
+                                     'skip_downloaded': True}))
+        session.commit()
+
+        episodes = [
+            (1, 1, WANTED, 10),
+            (1, 2, Quality.composite_status(DOWNLOADED, Quality.SDTV), 10),
+            (1, 3, Quality.composite_status(DOWNLOADED, Quality.HDTV), 10),
+            (1, 4, Quality.composite_status(SNATCHED, Quality.FULLHDBLURAY), 10),
+            (1, 5, SKIPPED, 10),
+            (1, 6, UNAIRED, -10),
+            (1, 7, WANTED, -10),
+            (0, 1, WANTED, 10),
+        ]
+
+        for showid in (1, 2):
+            for season, episode, status, days_ago in episodes:
+                session.add(MainDB.TVEpisode(**{'showid': showid, 'indexer': 1, 'season': season, 'episode': episode,
+                                                'indexer_id': showid * 100 + season * 10 + episode,
+                                                'airdate': self.today - datetime.timedelta(days=days_ago),
+                                                'status': status}))
+        session.commit()
+
+    def test_wanted_composite_statuses(self):
+        statuses = wanted_composite_statuses(Quality.HDTV)
+
+        self.assertIn(WANTED, statuses)
+        self.assertIn(Quality.composite_status(DOWNLOADED, Quality.SDTV), statuses)
+        self.assertIn(Quality.composite_status(SNATCHED, Quality.UNKNOWN), statuses)
+        self.assertNotIn(Quality.composite_status(DOWNLOADED, Quality.HDTV), statuses)
+        self.assertNotIn(Quality.composite_status(SNATCHED, Quality.FULLHDBLURAY), statuses)
+        self.assertNotIn(SKIPPED, statuses)
+
+        self.assertNotIn(Quality.composite_status(DOWNLOADED, Quality.SDTV), wanted_composite_statuses(Quality.HDTV, skip_downloaded=True))
+
+    def test_get_wanted_episodes(self):
+        shows = [TVShow(1, 1), TVShow(2, 1)]
+
+        with QueryCounter() as query_counter:
+            wanted = get_wanted_episodes(shows, datetime.date.min, self.today - datetime.timedelta(days=1))
+
+        self.assertEqual(1, query_counter.count)
+        self.assertEqual([(1, 1), (1, 2)], wanted[(1, 1)])
+        self.assertEqual([(1, 1)], wanted[(2, 1)])
+
+    def test_get_wanted_episodes_airdate_bounds(self):
+        wanted = get_wanted_episodes([TVShow(1, 1)], self.today)
+        self.assertEqual({(1, 1): [(1, 7)]}, wanted)
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - SEARCHER TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -21,12 +21,18 @@
 # ##############################################################################
 
 
+import datetime
 import unittest
 
 import sickrage
 import tests
+from sickrage.core.common import UNAIRED, DOWNLOADED, Quality
+from sickrage.core.databases import QueryCounter
+from sickrage.core.databases.main import MainDB
+from sickrage.core.exceptions import EpisodeNotFoundException
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show import TVShow
+from sickrage.core.tv.show.helpers import find_show_by_name, find_show_by_scene_exception, find_show_by_location, show_index
 
 
 class TVShowTests(tests.SiCKRAGETestDBCase):
@@ -62,6 +68,107 @@ class TVEpisodeTests(tests.SiCKRAGETestDBCase):
         self.assertEqual(ep.name, "asdasdasdajkaj")
 
 
+class TVShowEpisodesTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(TVShowEpisodesTests, self).setUp()
+        session = sickrage.app.main_db.session()
+        session.add(MainDB.TVShow(**{'indexer_id': 0o001, 'indexer': 1, 'lang': 'en', 'name': 'show name'}))
+        session.commit()
+
+        for episode in range(1, 51):
+            session.add(MainDB.TVEpisode(**{'showid': 0o001, 'indexer': 1, 'season': 1, 'episode': episode, 'indexer_id': episode,
+                                            'absolute_number': episode,
+                                            'name': 'test episode {}'.format(episode), 'airdate': datetime.date.fromordinal(733832),
+                                            'status': UNAIRED}))
+        session.commit()
+
+    def test_load_episodes_single_query(self):
+        show = TVShow(0o001, 1)
+
+        with QueryCounter() as query_counter:
+            episodes = show.episodes
+
+        self.assertEqual(len(episodes), 50)
+        self.assertEqual(query_counter.count, 1)
+        self.assertEqual(episodes[0].name, 'test episode 1')
+
+    def test_load_episodes_from_rows(self):
+        session = sickrage.app.main_db.session()
+        show = TVShow(0o001, 1, data=session.query(MainDB.TVShow).filter_by(indexer_id=0o001, indexer=1).one().as_dict())
+        rows = session.query(MainDB.TVEpisode).filter_by(showid=0o001, indexer=1).all()
+
+        with QueryCounter() as query_counter:
+            show.load_episodes_from_db(rows)
+            episodes = show.episodes
+
+        self.assertEqual(len(episodes), 50)
+        self.assertEqual(query_counter.count, 0)
+
+    def test_get_episode(self):
+        show = TVShow(0o001, 1)
+
+        with QueryCounter() as query_counter:
+            for episode in range(1, 51):
+                self.assertEqual(show.get_episode(1, episode).episode, episode)
+
+        self.assertEqual(query_counter.count, 1)
+        self.assertIs(show.get_episode(1, 10), show.get_episode(1, 10))
+
+    def test_get_episode_by_absolute_number(self):
+        show = TVShow(0o001, 1)
+        self.assertIs(show.get_episode(absolute_number=25), show.get_episode(1, 25))
+
+        episode = show.get_episode(1, 25)
+        episode.absolute_number = 125
+        episode.save()
+        self.assertIs(show.get_episode(absolute_number=125), episode)
+
+    def test_get_episode_by_indexer_id(self):
+        show = TVShow(0o001, 1)
+        self.assertIs(show.get_episode(indexer_id=30), show.get_episode(1, 30))
+        self.assertRaises(EpisodeNotFoundException, show.get_episode, indexer_id=100)
+
+    def test_remove_episode(self):
+        show = TVShow(0o001, 1)
+        show.remove_episode(show.get_episode(1, 5))
+        self.assertEqual(len(show.episodes), 49)
+        self.assertRaises(EpisodeNotFoundException, show.get_episode, indexer_id=5)
+        self.assertRaises(EpisodeNotFoundException, show.get_episode, 1, 5, no_create=True)
+
+    def test_flush_episodes(self):
+        show = TVShow(0o001, 1)
+        episode = show.get_episode(1, 1)
+        show.flush_episodes()
+        self.assertIsNot(show.get_episode(1, 1), episode)
+        self.assertEqual(len(show.episodes), 50)
+
+    def test_show_stats(self):
+        show = TVShow(0o001, 1)
+
+        self.assertEqual(show.episodes_total, 50)
+        self.assertEqual(show.episodes_unaired, 50)
+        self.assertEqual(show.episodes_downloaded, 0)
+        self.assertEqual(show.airs_prev, datetime.date.min)
+
+        with QueryCounter() as query_counter:
+            for __ in range(10):
+                self.assertEqual(show.episodes_snatched, 0)
+
+        self.assertEqual(query_counter.count, 0)
+
+    def test_show_stats_invalidated_on_status_change(self):
+        show = TVShow(0o001, 1)
+        self.assertEqual(show.episodes_downloaded, 0)
+
+        episode = show.get_episode(1, 1)
+        episode.status = Quality.composite_status(DOWNLOADED, Quality.HDTV)
+        episode.save()
+
+        self.assertEqual(show.episodes_downloaded, 1)
+        self.assertEqual(show.episodes_unaired, 49)
+        self.assertEqual(show.airs_prev, datetime.date.fromordinal(733832))
+
+
 class TVTests(tests.SiCKRAGETestDBCase):
     def test_getEpisode(self):
         show = TVShow(0o001, 1)
@@ -76,6 +183,70 @@ class TVTests(tests.SiCKRAGETestDBCase):
         sickrage.app.showlist = [show]
 
 
+class ShowIndexTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(ShowIndexTests, self).setUp()
+        session = sickrage.app.main_db.session()
+        for indexer_id, name in [(0o001, 'Show Name'), (0o002, 'Other Show')]:
+            session.add(MainDB.TVShow(**{'indexer_id': indexer_id, 'indexer': 1, 'lang': 'en', 'name': name,
+                                         'location': '/tv/{}'.format(name), 'scene_exceptions': ''}))
+        session.commit()
+
+        self.show = TVShow(0o001, 1)
+        self.other_show = TVShow(0o002, 1)
+        sickrage.app.shows = {(0o001, 1): self.show, (0o002, 1): self.other_show}
+
+    def tearDown(self):
+        super(ShowIndexTests, self).tearDown()
+        sickrage.app.shows = {}
+
+    def test_find_show_by_name(self):
+        self.assertIs(find_show_by_name('Show Name'), self.show)
+        self.assertIs(find_show_by_name('show name '), self.show)
+        self.assertIsNone(find_show_by_name('Missing Show'))
+
+    def test_rename_updates_index(self):
+        find_show_by_name('Show Name')
+
+        self.show.name = 'Renamed Show'
+        self.assertIsNone(find_show_by_name('Show Name'))
+        self.assertIs(find_show_by_name('Renamed Show'), self.show)
+
+    def test_scene_exceptions_update_index(self):
+        self.assertIsNone(find_show_by_scene_exception('Alias Name'))
+
+        self.show.scene_exceptions = ['Alias Name|-1', 'Season Alias|2']
+        self.assertIs(find_show_by_scene_exception('Alias Name'), self.show)
+        self.assertIs(find_show_by_scene_exception('season alias'), self.show)
+
+        self.show.scene_exceptions = []
+        self.assertIsNone(find_show_by_scene_exception('Alias Name'))
+
+    def test_location_updates_index(self):
+        self.assertIs(find_show_by_location('/tv/Other Show/'), self.other_show)
+
+        self.other_show.location = '/media/Other Show'
+        self.assertIsNone(find_show_by_location('/tv/Other Show'))
+        self.assertIs(find_show_by_location('/media/Other Show'), self.other_show)
+
+    def test_show_list_changes_rebuild_index(self):
+        self.assertIs(find_show_by_name('Other Show'), self.other_show)
+
+        del sickrage.app.shows[(0o002, 1)]
+        self.assertIsNone(find_show_by_name('Other Show'))
+
+        sickrage.app.shows = {(0o002, 1): self.other_show}
+        self.assertIsNone(find_show_by_name('Show Name'))
+        self.assertIs(find_show_by_name('Other Show'), self.other_show)
+
+    def test_remove_show(self):
+        show_index.rebuild()
+
+        show_index.remove(self.show)
+        self.assertNotIn('show name', show_index.names)
+        self.assertNotIn('/tv/Show Name', show_index.locations)
+
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - TV TESTS")
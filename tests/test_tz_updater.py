@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import datetime
+import os
+import unittest
+
+from dateutil import tz
+
+import sickrage
+import tests
+from sickrage.core.databases import QueryCounter
+from sickrage.core.databases.cache import CacheDB
+from sickrage.core.updaters.tz_updater import TimeZoneUpdater
+
+
+class TimeZoneUpdaterTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(TimeZoneUpdaterTests, self).setUp()
+        sickrage.app.cache_db = CacheDB(db_type='sqlite',
+                                        db_prefix='sickrage',
+                                        db_host='localhost',
+                                        db_port='3306',
+                                        db_username='sickrage',
+                                        db_password='sickrage')
+
+        session = sickrage.app.cache_db.session()
+        session.add(CacheDB.NetworkTimezone(network_name='CBS', timezone='US/Eastern'))
+        session.add(CacheDB.NetworkTimezone(network_name='BBC One', timezone='Europe/London'))
+        session.commit()
+
+        self.tz_updater = TimeZoneUpdater()
+
+    def tearDown(self):
+        super(TimeZoneUpdaterTests, self).tearDown()
+        sickrage.app.cache_db.dispose()
+        if os.path.isfile(sickrage.app.cache_db.db_path):
+            os.unlink(sickrage.app.cache_db.db_path)
+
+    def test_get_network_timezone(self):
+        self.assertEqual(self.tz_updater.get_network_timezone('CBS'), tz.gettz('US/Eastern'))
+        self.assertEqual(self.tz_updater.get_network_timezone('Unknown Network'), sickrage.app.tz)
+        self.assertEqual(self.tz_updater.get_network_timezone(None), sickrage.app.tz)
+
+    def test_parse_date_time_warm_cache_skips_database(self):
+        self.tz_updater.parse_date_time(datetime.date(2020, 1, 1), '8:00 PM', 'CBS')
+
+        with QueryCounter() as query_counter:
+            for __ in range(100):
+                airtime = self.tz_updater.parse_date_time(datetime.date(2020, 1, 1), '8:00 PM', 'BBC One')
+
+        self.assertEqual(query_counter.count, 0)
+        self.assertEqual(airtime, datetime.datetime(2020, 1, 1, 20, 0, tzinfo=tz.gettz('Europe/London')))
+        self.assertIs(self.tz_updater.get_network_timezone('BBC One'), self.tz_updater.get_network_timezone('BBC One'))
+
+    def test_load_network_timezones_refreshes_map(self):
+        self.assertEqual(self.tz_updater.get_network_timezone('NHK'), sickrage.app.tz)
+
+        session = sickrage.app.cache_db.session()
+        session.add(CacheDB.NetworkTimezone(network_name='NHK', timezone='Asia/Tokyo'))
+        session.commit()
+
+        self.tz_updater.load_network_timezones()
+        self.assertEqual(self.tz_updater.get_network_timezone('NHK'), tz.gettz('Asia/Tokyo'))
+
+    def test_apply_network_timezones(self):
+        old_network_timezones = self.tz_updater.load_network_timezones()
+
+        self.tz_updater.apply_network_timezones({'CBS': 'US/Pacific', 'NHK': 'Asia/Tokyo'})
+
+        session = sickrage.app.cache_db.session()
+        self.assertEqual(dict(session.query(CacheDB.NetworkTimezone.network_name, CacheDB.NetworkTimezone.timezone)),
+                         {'CBS': 'US/Pacific', 'NHK': 'Asia/Tokyo'})
+
+        # the map is replaced as a whole, a reader holding the old one still sees a complete map
+        self.assertIsNot(self.tz_updater.network_timezones, old_network_timezones)
+        self.assertEqual(old_network_timezones['BBC One'], tz.gettz('Europe/London'))
+        self.assertEqual(self.tz_updater.get_network_timezone('CBS'), tz.gettz('US/Pacific'))
+        self.assertEqual(self.tz_updater.get_network_timezone('BBC One'), sickrage.app.tz)
+
+    def test_apply_network_timezones_single_transaction(self):
+        network_timezones = {'Network {}'.format(i): 'US/Eastern' for i in range(2000)}
+
+        with QueryCounter() as query_counter:
+            self.tz_updater.apply_network_timezones(network_timezones)
+
+        self.assertLess(query_counter.count, 20)
+        self.assertEqual(len(self.tz_updater.network_timezones), 2000)
+
+        # nothing changed, nothing is written
+        with QueryCounter() as query_counter:
+            self.tz_updater.apply_network_timezones(network_timezones)
+
+        self.assertEqual(query_counter.count, 1)
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - TIMEZONE UPDATER TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+
+import unittest
+
+import tests
+from sickrage.core.websession import BoundedDictCache, WebSession, WebSessionPool, web_session_pool
+
+
+class WebSessionPoolTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(WebSessionPoolTests, self).setUp()
+        self.pool = WebSessionPool()
+
+    def test_hit_miss(self):
+        adapter = self.pool.get_adapter('https://example.com/api')
+
+        self.assertIs(adapter, self.pool.get_adapter('HTTPS://Example.com/other'))
+        self.assertEqual({'pools': 1, 'hits': 1, 'misses': 1}, self.pool.metrics)
+
+    def test_key_separation(self):
+        adapter = self.pool.get_adapter('https://example.com')
+        proxies = {'https': 'http://proxy:3128'}
+
+        self.assertIsNot(adapter, self.pool.get_adapter('http://example.com'))
+        self.assertIsNot(adapter, self.pool.get_adapter('https://example.org'))
+        self.assertIsNot(adapter, self.pool.get_adapter('https://example.com', proxies))
+        self.assertIs(self.pool.get_adapter('https://example.com', proxies), self.pool.get_adapter('https://example.com/x', proxies))
+        self.assertEqual(4, self.pool.metrics['pools'])
+
+    def test_max_pools(self):
+        self.pool.max_pools = 2
+
+        first = self.pool.get_adapter('https://one.example.com')
+        self.pool.get_adapter('https://two.example.com')
+        self.pool.get_adapter('https://one.example.com')
+        self.pool.get_adapter('https://three.example.com')
+
+        # two was the least recently used host
+        self.assertEqual(2, self.pool.metrics['pools'])
+        self.assertIs(first, self.pool.get_adapter('https://one.example.com'))
+        self.assertEqual(3, self.pool.metrics['misses'])
+
+        self.pool.get_adapter('https://two.example.com')
+        self.assertEqual(4, self.pool.metrics['misses'])
+
+    def test_clear(self):
+        adapter = self.pool.get_adapter('https://example.com')
+        self.pool.clear()
+
+        self.assertEqual(0, self.pool.metrics['pools'])
+        self.assertIsNot(adapter, self.pool.get_adapter('https://example.com'))
+
+
+class WebSessionCacheTests(tests.SiCKRAGETestCase):
+    def test_cache_per_session(self):
+        first = WebSession(cache=True)
+        second = WebSession(cache=True)
+
+        self.assertIsNot(first.get_adapter('https://example.com'), second.get_adapter('https://example.com'))
+        self.assertIsNot(first.cache_adapter.cache, second.cache_adapter.cache)
+
+    def test_cached_session_borrows_pooled_connections(self):
+        url = 'https://cached.example.com/api'
+        session = WebSession(cache=True, proxies={})
+
+        self.assertIs(web_session_pool.get_adapter(url).get_connection(url), session.get_adapter(url).get_connection(url))
+
+    def test_uncached_session_uses_pool(self):
+        url = 'https://uncached.example.com/api'
+        self.assertIs(web_session_pool.get_adapter(url), WebSession(cache=False, proxies={}).get_adapter(url))
+
+    def test_bounded_cache(self):
+        cache = BoundedDictCache(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        # touching a makes b the least recently used entry
+        self.assertEqual(1, cache.get('a'))
+        cache.set('c', 3)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(3, cache.get('c'))
+
+        cache.delete('c')
+        self.assertIsNone(cache.get('c'))
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - WEB SESSION TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()